@@ -1,17 +1,16 @@
 """Support for bodymiscale."""
 
-import asyncio
 import logging
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime
-from functools import partial
 from typing import Any
 
 from awesomeversion import AwesomeVersion
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, STATE_OK, STATE_PROBLEM
 from homeassistant.const import __version__ as HA_VERSION
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -47,15 +46,28 @@ from .const import (
     NOTIFICATION_COORDINATOR,
     PLATFORMS,
     PROBLEM_NONE,
+    PROFILE_ID_ROUTER,
     PROFILE_METHOD_NONE,
     PROFILE_METHOD_NOTIFY,
+    SENSOR_DISPATCHER,
     STARTUP_MESSAGE,
-    UPDATE_DELAY,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
+    WRITE_SCHEDULER,
 )
-from .entity import BodyScaleBaseEntity
+from .entity import BodyScaleBaseEntity, StateWriteScheduler
+from .history import async_setup_services, async_unload_services
 from .metrics import BodyScaleMetricsHandler
+from .metrics.dispatcher import SensorDispatcher
 from .models import Metric
-from .profile import NotificationCoordinator, NotificationFilter
+from .profile import (
+    NearestWeightRouter,
+    NotificationCoordinator,
+    NotificationFilter,
+    ProfileIdRouter,
+    WeightRangeIndex,
+)
+from .stats import CycleStatistics
 from .util import get_age, get_bmi_label, get_ideal_weight
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,19 +105,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             HANDLERS: {},
             MAIN_ENTITIES: {},
             NOTIFICATION_COORDINATOR: None,
+            WRITE_SCHEDULER: StateWriteScheduler(hass),
+            WEIGHT_ROUTER: NearestWeightRouter(),
+            WEIGHT_RANGES: WeightRangeIndex(),
+            PROFILE_ID_ROUTER: ProfileIdRouter(hass),
+            SENSOR_DISPATCHER: SensorDispatcher(hass),
         }
         _LOGGER.info(STARTUP_MESSAGE)
+        async_setup_services(hass)
 
     config = {**entry.data, **entry.options}
     handler = BodyScaleMetricsHandler(hass, config, entry.entry_id)
     hass.data[DOMAIN][HANDLERS][entry.entry_id] = handler
 
+    # Write the states of a completed cycle now instead of at the window end;
+    # the other profiles' queued writes keep their own window.
+    scheduler: StateWriteScheduler = hass.data[DOMAIN][WRITE_SCHEDULER]
+    entry.async_on_unload(
+        handler.subscribe_cycle(lambda _snapshot: scheduler.flush(entry.entry_id))
+    )
+
+    # Long-term statistics — hourly mean/min/max of the completed measurements
+    if RECORDER_DOMAIN in hass.config.components:
+        statistics = CycleStatistics(hass, config.get(CONF_NAME, entry.title))
+        entry.async_on_unload(handler.subscribe_cycle(statistics.async_import))
+
     # Notification coordinator (method 3)
     if config.get(CONF_PROFILE_METHOD) == PROFILE_METHOD_NOTIFY:
         coordinator = hass.data[DOMAIN].get(NOTIFICATION_COORDINATOR)
         if coordinator is None:
             coordinator = NotificationCoordinator(hass)
             hass.data[DOMAIN][NOTIFICATION_COORDINATOR] = coordinator
+            await coordinator.async_load()
 
         notify_filter = handler.profile_filter
         if isinstance(notify_filter, NotificationFilter):
@@ -152,11 +183,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if coordinator is not None:
             coordinator.unregister(entry.entry_id)
             if not coordinator.has_entries():
+                await coordinator.async_save_pending()
                 coordinator.unload()
                 hass.data[DOMAIN][NOTIFICATION_COORDINATOR] = None
 
         if not hass.data[DOMAIN][HANDLERS]:
-            hass.data.pop(DOMAIN)
+            domain_data = hass.data.pop(DOMAIN)
+            domain_data[WRITE_SCHEDULER].unload()
+            domain_data[SENSOR_DISPATCHER].unload()
+            domain_data[PROFILE_ID_ROUTER].unload()
+            async_unload_services(hass)
 
     return unload_ok
 
@@ -261,7 +297,6 @@ class Bodymiscale(BodyScaleBaseEntity, RestoreEntity):
                 icon="mdi:human",
             ),
         )
-        self._timer_handle: asyncio.TimerHandle | None = None
         self._available_metrics: MutableMapping[str, StateType | datetime] = {}
 
     async def async_added_to_hass(self) -> None:
@@ -304,32 +339,25 @@ class Bodymiscale(BodyScaleBaseEntity, RestoreEntity):
                 if value is not None:
                     self._handler.restore_metric(metric, value)
 
-        loop = asyncio.get_running_loop()
-
-        def on_value(value: StateType | datetime, *, metric: Metric) -> None:
-            if metric is Metric.STATUS:
-                self._attr_state = STATE_OK if value == PROBLEM_NONE else STATE_PROBLEM
-                self._available_metrics[ATTR_PROBLEM] = value
-            else:
-                self._available_metrics[metric.value] = value
-
-            if self._timer_handle is not None:
-                self._timer_handle.cancel()
-            self._timer_handle = loop.call_later(
-                UPDATE_DELAY, self.async_write_ha_state
-            )
+        def on_values(changes: Mapping[Metric, StateType | datetime]) -> None:
+            for metric, value in changes.items():
+                if metric is Metric.STATUS:
+                    self._attr_state = (
+                        STATE_OK if value == PROBLEM_NONE else STATE_PROBLEM
+                    )
+                    self._available_metrics[ATTR_PROBLEM] = value
+                else:
+                    self._available_metrics[metric.value] = value
 
-        remove_subs = []
-        for metric in Metric:
-            remove_subs.append(
-                self._handler.subscribe(metric, partial(on_value, metric=metric))
-            )
+            self.async_schedule_write()
 
-        def _remove_all() -> None:
-            for sub in remove_subs:
-                sub()
+        self.async_on_remove(self._handler.subscribe_batch(on_values))
 
-        self.async_on_remove(_remove_all)
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and close the latency breakdown of the cycle."""
+        super().async_write_ha_state()
+        self._handler.cycle_written()
 
     @property
     def state_attributes(self) -> dict[str, Any]:
@@ -38,8 +38,10 @@ from .const import (
     CONF_SENSOR_PROFILE_ID,
     CONF_SENSOR_STABILIZED,
     CONF_SENSOR_WEIGHT,
+    CONF_SETTLE_WINDOW,
     CONF_WEIGHT_MAX,
     CONF_WEIGHT_MIN,
+    CONF_WRITE_WINDOW,
     CONSTRAINT_HEIGHT_MAX,
     CONSTRAINT_HEIGHT_MIN,
     CONSTRAINT_PROFILE_ID_MAX,
@@ -57,8 +59,11 @@ from .const import (
     PROFILE_METHOD_NOTIFY,
     PROFILE_METHOD_OPTIONS,
     PROFILE_METHOD_WEIGHT,
+    RECALCULATION_DEBOUNCE,
+    UPDATE_DELAY,
 )
 from .models import Gender
+from .profile import WeightRangeIndex
 
 # ---------------------------------------------------------------------------
 # Schema helpers
@@ -186,6 +191,43 @@ def _get_sensors_schema(
             selector.EntitySelectorConfig(domain=["sensor", "input_number", "number"])
         )
 
+    if impedance_mode in (IMPEDANCE_MODE_STANDARD, IMPEDANCE_MODE_DUAL):
+        fields[
+            vol.Optional(
+                CONF_SETTLE_WINDOW,
+                description={
+                    "suggested_value": defaults.get(
+                        CONF_SETTLE_WINDOW, RECALCULATION_DEBOUNCE
+                    )
+                },
+            )
+        ] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                mode=selector.NumberSelectorMode.BOX,
+                min=1,
+                max=60,
+                step=1,
+                unit_of_measurement="s",
+            )
+        )
+
+    fields[
+        vol.Optional(
+            CONF_WRITE_WINDOW,
+            description={
+                "suggested_value": defaults.get(CONF_WRITE_WINDOW, UPDATE_DELAY)
+            },
+        )
+    ] = selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            mode=selector.NumberSelectorMode.BOX,
+            min=0,
+            max=10,
+            step=0.5,
+            unit_of_measurement="s",
+        )
+    )
+
     if profile_method == PROFILE_METHOD_ID:
         fields[
             vol.Required(
@@ -338,15 +380,14 @@ def _get_profile_schema(method: str, defaults: dict[str, Any]) -> vol.Schema | N
 def _validate_weight_range(
     weight_min: float,
     weight_max: float,
-    existing_ranges: list[tuple[float, float]],
+    existing_ranges: WeightRangeIndex,
 ) -> str | None:
     """Validate the weight range and detect overlaps with existing entries."""
     if weight_min >= weight_max:
         return "weight_range_invalid"
 
-    for r_min, r_max in existing_ranges:
-        if weight_min < r_max and r_min < weight_max:
-            return "weight_range_overlap"
+    if existing_ranges.overlapping(weight_min, weight_max) is not None:
+        return "weight_range_overlap"
 
     return None
 
@@ -382,7 +423,7 @@ def _validate_nearest(user_input: dict[str, Any], errors: dict[str, str]) -> Non
 
 
 def _validate_weight(
-    user_input: dict, errors: dict, existing: list[tuple[float, float]]
+    user_input: dict, errors: dict, existing: WeightRangeIndex
 ) -> None:
     """Validate WEIGHT method fields."""
     w_min = user_input.get(CONF_WEIGHT_MIN)
@@ -619,17 +660,14 @@ class BodyMiScaleFlowHandler(ConfigFlow, domain=DOMAIN):
             options=self._data,
         )
 
-    def _get_existing_weight_ranges(self) -> list[tuple[float, float]]:
+    def _get_existing_weight_ranges(self) -> WeightRangeIndex:
         """Return weight ranges already configured in other entries."""
-        ranges = []
-        for entry in self._async_current_entries():
-            opts = dict(entry.data) | dict(entry.options)
-            if opts.get(CONF_PROFILE_METHOD) == PROFILE_METHOD_WEIGHT:
-                w_min = opts.get(CONF_WEIGHT_MIN)
-                w_max = opts.get(CONF_WEIGHT_MAX)
-                if w_min is not None and w_max is not None:
-                    ranges.append((float(w_min), float(w_max)))
-        return ranges
+        return WeightRangeIndex.from_configs(
+            {
+                entry.entry_id: dict(entry.data) | dict(entry.options)
+                for entry in self._async_current_entries()
+            }
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -724,17 +762,13 @@ class BodyMiScaleOptionsFlowHandler(OptionsFlow):
             data_schema=schema,
         )
 
-    def _get_other_weight_ranges(self) -> list[tuple[float, float]]:
+    def _get_other_weight_ranges(self) -> WeightRangeIndex:
         """Return weight ranges from other entries."""
         current_id = self._config_entry.entry_id
-        ranges = []
-        for entry in self.hass.config_entries.async_entries(DOMAIN):
-            if entry.entry_id == current_id:
-                continue
-            opts = dict(entry.data) | dict(entry.options)
-            if opts.get(CONF_PROFILE_METHOD) == PROFILE_METHOD_WEIGHT:
-                w_min = opts.get(CONF_WEIGHT_MIN)
-                w_max = opts.get(CONF_WEIGHT_MAX)
-                if w_min is not None and w_max is not None:
-                    ranges.append((float(w_min), float(w_max)))
-        return ranges
+        return WeightRangeIndex.from_configs(
+            {
+                entry.entry_id: dict(entry.data) | dict(entry.options)
+                for entry in self.hass.config_entries.async_entries(DOMAIN)
+                if entry.entry_id != current_id
+            }
+        )
@@ -13,6 +13,11 @@ COMPONENT = "component"
 HANDLERS = "handlers"
 MAIN_ENTITIES = "main_entities"
 NOTIFICATION_COORDINATOR = "notification_coordinator"
+WRITE_SCHEDULER = "write_scheduler"
+WEIGHT_ROUTER = "weight_router"
+WEIGHT_RANGES = "weight_ranges"
+PROFILE_ID_ROUTER = "profile_id_router"
+SENSOR_DISPATCHER = "sensor_dispatcher"
 
 # User config
 CONF_BIRTHDAY = "birthday"
@@ -62,8 +67,18 @@ CONF_NOTIFY_SERVICE = "notify_service"
 CONF_NOTIFY_WEIGHT_MIN = "notify_weight_min"
 CONF_NOTIFY_WEIGHT_MAX = "notify_weight_max"
 PENDING_MEASUREMENT_TIMEOUT = 300
+# measurements waiting for a confirmation, kept across restarts
+PENDING_QUEUE_SIZE = 10
+PENDING_STORAGE_KEY = f"{DOMAIN}.pending_measurements"
+PENDING_STORAGE_VERSION = 1
+PENDING_SAVE_DELAY: float = 5.0
+# longest wait for one device's notify service call
+NOTIFY_TIMEOUT: float = 10.0
 EVENT_MOBILE_APP_NOTIFICATION_ACTION = "mobile_app_notification_action"
 NOTIFICATION_TAG = "bodymiscale_user_selection"
+# action ids are "<tag>:<NAME>" so actions of other notifications are
+# rejected before any lookup
+NOTIFICATION_ACTION_PREFIX = f"{NOTIFICATION_TAG}:"
 
 # ---------------------------------------------------------------------------
 # Calculation mode (standard impedance only; dual mode uses fixed formulas)
@@ -94,6 +109,10 @@ CONF_SENSOR_IMPEDANCE = "impedance"
 CONF_SENSOR_IMPEDANCE_LOW = "impedance_low"
 CONF_SENSOR_IMPEDANCE_HIGH = "impedance_high"
 CONF_SENSOR_STABILIZED = "stabilized"
+# Seconds a measurement cycle waits for its impedance reading(s)
+CONF_SETTLE_WINDOW = "settle_window"
+# Seconds entity state writes are held to be written together
+CONF_WRITE_WINDOW = "write_window"
 
 # State attributes
 ATTR_AGE = "age"
@@ -120,6 +139,7 @@ ATTR_INTRACELLULAR_WATER = "intracellular_water"
 ATTR_ECW_TBW_RATIO = "ecw_tbw_ratio"
 ATTR_BCM = "bcm"
 ATTR_SKELETAL_MUSCLE_MASS = "skeletal_muscle_mass"
+ATTR_MEASUREMENT_LATENCY = "measurement_latency"
 
 UNIT_POUNDS = "lb"
 PROBLEM_NONE = "none"
@@ -145,7 +165,11 @@ CONSTRAINT_WEIGHT_MAX = 200
 # Home Assistant
 PLATFORMS: set[Platform] = {Platform.SENSOR}
 
+# Services
+SERVICE_RECOMPUTE_HISTORY = "recompute_history"
+
 # Debounce delays
-# waits for all sensors to settle before recalculating
+# waits for all sensors to settle before recalculating (default settle window)
 RECALCULATION_DEBOUNCE: float = 5.0
-UPDATE_DELAY: float = 2.0  # waits before writing state to HA
+# waits before writing state to HA — default write window of the scheduler
+UPDATE_DELAY: float = 2.0
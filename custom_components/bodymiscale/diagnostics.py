@@ -0,0 +1,96 @@
+"""Diagnostics support for bodymiscale.
+
+Reports what a profile's handler actually does — recalculation passes,
+metrics computed or skipped, subscriber calls, profile filter rejections,
+expired values and pass durations — together with the shared domain
+objects, so event-loop load can be traced to a profile or sensor without
+enabling debug logging.
+"""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_BIRTHDAY,
+    CONF_NOTIFY_DEVICE_ID,
+    DOMAIN,
+    HANDLERS,
+    NOTIFICATION_COORDINATOR,
+    PROFILE_ID_ROUTER,
+    SENSOR_DISPATCHER,
+    WRITE_SCHEDULER,
+)
+from .entity import StateWriteScheduler
+from .metrics import BodyScaleMetricsHandler
+from .metrics.dispatcher import SensorDispatcher
+from .profile import NotificationCoordinator, ProfileIdRouter
+
+TO_REDACT = {CONF_BIRTHDAY, CONF_NOTIFY_DEVICE_ID}
+
+
+def _handler_diagnostics(handler: BodyScaleMetricsHandler) -> dict[str, Any]:
+    """Return the counters of one profile handler."""
+    latency = handler.last_cycle_latency
+    return {
+        **handler.stats.as_dict(),
+        "ttl_evictions": handler.ttl_evictions,
+        "suppressed_notifications": handler.suppressed_notifications,
+        "last_cycle_latency": None if latency is None else asdict(latency),
+    }
+
+
+def _domain_diagnostics(domain_data: dict[str, Any]) -> dict[str, Any]:
+    """Return the state of the objects shared by every profile."""
+    diagnostics: dict[str, Any] = {"profiles": len(domain_data.get(HANDLERS, {}))}
+
+    dispatcher: SensorDispatcher | None = domain_data.get(SENSOR_DISPATCHER)
+    if dispatcher is not None:
+        diagnostics["tracked_sensors"] = sorted(dispatcher.tracked_entities)
+
+    id_router: ProfileIdRouter | None = domain_data.get(PROFILE_ID_ROUTER)
+    if id_router is not None:
+        diagnostics["tracked_profile_id_sensors"] = sorted(id_router.tracked_entities)
+
+    scheduler: StateWriteScheduler | None = domain_data.get(WRITE_SCHEDULER)
+    if scheduler is not None:
+        diagnostics["state_writes"] = {
+            "flushes": scheduler.flushes,
+            "entities_written": scheduler.entities_written,
+            "last_flush_size": scheduler.last_flush_size,
+            "largest_flush": scheduler.largest_flush,
+            "pending": scheduler.pending,
+        }
+
+    coordinator: NotificationCoordinator | None = domain_data.get(
+        NOTIFICATION_COORDINATOR
+    )
+    if coordinator is not None:
+        diagnostics["notifications"] = {
+            "pending_measurements": len(coordinator.pending_measurements),
+            # Device ids are redacted; only the delivery times are kept.
+            "delivery_times": sorted(coordinator.delivery_times.values()),
+        }
+
+    return diagnostics
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data: dict[str, Any] = hass.data.get(DOMAIN, {})
+    handler: BodyScaleMetricsHandler | None = domain_data.get(HANDLERS, {}).get(
+        entry.entry_id
+    )
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "handler": None if handler is None else _handler_diagnostics(handler),
+        "domain": _domain_diagnostics(domain_data),
+    }
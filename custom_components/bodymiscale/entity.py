@@ -1,13 +1,132 @@
 """Bodymiscale entity module."""
 
+import logging
+from datetime import datetime
+
 from homeassistant.const import CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import UNDEFINED
 
-from .const import DOMAIN, VERSION
+from .const import CONF_WRITE_WINDOW, DOMAIN, UPDATE_DELAY, VERSION, WRITE_SCHEDULER
 from .metrics import BodyScaleMetricsHandler
 
+_LOGGER = logging.getLogger(__name__)
+
+
+class StateWriteScheduler:
+    """Coalesce the state writes of every bodymiscale entity.
+
+    One instance is shared by all profiles. Entities whose state changed
+    are queued and written together when the shortest write window of the
+    queued entities has passed, or as soon as a measurement cycle is
+    complete (``flush`` of the profile's entities), so a cycle ends in one
+    flush instead of one write per sensor update. Entities are queued with
+    their owner (the config entry id of their profile): a profile's cycle
+    only writes its own entities, the others keep their write window.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float = UPDATE_DELAY) -> None:
+        self._hass = hass
+        self.window = window
+        self._dirty: dict[Entity, str | None] = {}
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._flush_due: float = 0.0
+        self._flushes: int = 0
+        self._entities_written: int = 0
+        self._last_flush_size: int = 0
+        self._largest_flush: int = 0
+
+    @property
+    def flushes(self) -> int:
+        """Return how many flushes were run."""
+        return self._flushes
+
+    @property
+    def entities_written(self) -> int:
+        """Return how many entity states were written by all flushes."""
+        return self._entities_written
+
+    @property
+    def last_flush_size(self) -> int:
+        """Return how many entities the last flush wrote."""
+        return self._last_flush_size
+
+    @property
+    def largest_flush(self) -> int:
+        """Return the largest number of entities written by one flush."""
+        return self._largest_flush
+
+    @property
+    def pending(self) -> int:
+        """Return how many entities wait for the next flush."""
+        return len(self._dirty)
+
+    @callback
+    def schedule(
+        self, entity: Entity, window: float | None = None, owner: str | None = None
+    ) -> None:
+        """Queue a state write for the entity, due within ``window`` seconds."""
+        self._dirty[entity] = owner
+        delay = self.window if window is None else window
+        due = self._hass.loop.time() + delay
+        if self._cancel_flush is not None:
+            if due >= self._flush_due:
+                return
+            self._cancel_flush()
+        self._flush_due = due
+        self._cancel_flush = async_call_later(self._hass, delay, self._async_flush)
+
+    @callback
+    def discard(self, entity: Entity) -> None:
+        """Drop a queued write, e.g. when the entity is removed."""
+        self._dirty.pop(entity, None)
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        self._cancel_flush = None
+        self.flush()
+
+    @callback
+    def flush(self, owner: str | None = None) -> None:
+        """Write the queued entity states of ``owner`` (every one if None) now.
+
+        The pending flush keeps running while other entities are queued.
+        """
+        if owner is None:
+            entities = list(self._dirty)
+            self._dirty.clear()
+        else:
+            entities = [
+                entity
+                for entity, entity_owner in self._dirty.items()
+                if entity_owner == owner
+            ]
+            for entity in entities:
+                del self._dirty[entity]
+        if not self._dirty and self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        if not entities:
+            return
+        for entity in entities:
+            entity.async_write_ha_state()
+        self._flushes += 1
+        self._entities_written += len(entities)
+        self._last_flush_size = len(entities)
+        self._largest_flush = max(self._largest_flush, len(entities))
+        _LOGGER.debug("State write flush: %d entities", len(entities))
+
+    @callback
+    def unload(self) -> None:
+        """Cancel the pending flush and forget queued writes."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._dirty.clear()
+
 
 class BodyScaleBaseEntity(Entity):
     """Body scale base entity."""
@@ -50,3 +169,32 @@ class BodyScaleBaseEntity(Entity):
             sw_version=VERSION,
             identifiers={(DOMAIN, self._handler.config_entry_id)},
         )
+
+    @property
+    def write_window(self) -> float:
+        """Return how long a state write of the profile may be held."""
+        return float(self._handler.config.get(CONF_WRITE_WINDOW, UPDATE_DELAY))
+
+    @callback
+    def async_schedule_write(self) -> None:
+        """Queue a state write on the shared scheduler.
+
+        Writes immediately when no scheduler is running (entity used
+        outside a set-up config entry).
+        """
+        scheduler: StateWriteScheduler | None = self.hass.data.get(DOMAIN, {}).get(
+            WRITE_SCHEDULER
+        )
+        if scheduler is None:
+            self.async_write_ha_state()
+        else:
+            scheduler.schedule(self, self.write_window, self._handler.config_entry_id)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a queued state write of the removed entity."""
+        await super().async_will_remove_from_hass()
+        scheduler: StateWriteScheduler | None = self.hass.data.get(DOMAIN, {}).get(
+            WRITE_SCHEDULER
+        )
+        if scheduler is not None:
+            scheduler.discard(self)
@@ -0,0 +1,332 @@
+"""Recompute derived metrics from recorded history (recompute_history service).
+
+The profile's own sensors are the source: their recorded states only hold
+measurements already accepted for this profile, so no profile filtering
+has to be replayed. Every state change of the last measurement time sensor
+is one measurement. Its weight and impedance are the latest values
+recorded up to ``MEASUREMENT_WINDOW`` after it (impedance packets arrive a
+few seconds after the weight). A reading equal to the previous one records
+no new state, so an impedance recorded before the window is still the one
+of the measurement — as it is for the live handler, whose completed cycle
+holds the same value.
+
+The weight, the impedance readings and the recomputed metrics are imported
+under the statistic ids the live cycles write.
+
+History is read in ``HISTORY_CHUNK`` windows, recomputed with the batch
+API in the executor and imported as hourly long-term statistics before the
+next window is loaded, so memory use does not grow with the history length.
+"""
+
+import logging
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Self
+
+import voluptuous as vol
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_NAME,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    Platform,
+)
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    State,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_IMPEDANCE_MODE,
+    DOMAIN,
+    HANDLERS,
+    IMPEDANCE_MODE_DUAL,
+    IMPEDANCE_MODE_STANDARD,
+    SERVICE_RECOMPUTE_HISTORY,
+)
+from .metrics import BodyScaleMetricsHandler
+from .metrics.batch import MeasurementColumns, compute_batch
+from .models import Metric
+from .stats import async_import_metric_statistics
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_START = "start"
+
+# Size of one history window loaded from the recorder.
+HISTORY_CHUNK = timedelta(days=30)
+# How long after a measurement its weight/impedance readings may be recorded.
+MEASUREMENT_WINDOW = timedelta(seconds=60)
+
+SERVICE_RECOMPUTE_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+    }
+)
+
+
+@dataclass(frozen=True)
+class _Series:
+    """Recorded numeric values of one entity, in chronological order."""
+
+    times: Sequence[datetime]
+    values: Sequence[float]
+
+    @classmethod
+    def from_states(cls, states: Iterable[State | dict[str, Any]]) -> Self:
+        """Build a series from recorder states, skipping non-numeric ones."""
+        times: list[datetime] = []
+        values: list[float] = []
+        for state in states:
+            if not isinstance(state, State) or state.state in (
+                STATE_UNKNOWN,
+                STATE_UNAVAILABLE,
+            ):
+                continue
+            try:
+                value = float(state.state)
+            except ValueError:
+                continue
+            times.append(state.last_changed)
+            values.append(value)
+        return cls(times, values)
+
+    def value_at(self, when: datetime) -> float | None:
+        """Return the latest value recorded at or before ``when``."""
+        index = bisect_right(self.times, when) - 1
+        return self.values[index] if index >= 0 else None
+
+
+def _measurement_times(
+    states: Iterable[State | dict[str, Any]],
+    start: datetime,
+    end: datetime,
+    previous: datetime | None,
+) -> list[datetime]:
+    """Return the measurement times recorded in ``[start, end)``.
+
+    The sensor state is the measurement time itself, so the state recorded
+    at the window start (an older measurement) is naturally left out. A
+    cycle may stamp the time more than once (weight pass, then
+    confirmation); stamps closer than ``MEASUREMENT_WINDOW`` to the previous
+    one are merged into it.
+    """
+    times: list[datetime] = []
+    for state in states:
+        if not isinstance(state, State):
+            continue
+        when = dt_util.parse_datetime(state.state)
+        if when is None or not start <= when < end:
+            continue
+        if previous is not None and when - previous < MEASUREMENT_WINDOW:
+            continue
+        times.append(when)
+        previous = when
+    return times
+
+
+def _profile_entity_ids(
+    hass: HomeAssistant, handler: BodyScaleMetricsHandler
+) -> dict[Metric, str]:
+    """Return the entity ids of the profile sensors history is read from."""
+    metrics = [Metric.LAST_MEASUREMENT_TIME, Metric.WEIGHT]
+    impedance_mode = handler.config.get(CONF_IMPEDANCE_MODE)
+    if impedance_mode == IMPEDANCE_MODE_STANDARD:
+        metrics.append(Metric.IMPEDANCE)
+    elif impedance_mode == IMPEDANCE_MODE_DUAL:
+        metrics.extend((Metric.IMPEDANCE_LOW, Metric.IMPEDANCE_HIGH))
+
+    registry = er.async_get(hass)
+    name = handler.config[CONF_NAME]
+    entity_ids: dict[Metric, str] = {}
+    for metric in metrics:
+        entity_id = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, "_".join([DOMAIN, name, metric.value])
+        )
+        if entity_id is not None:
+            entity_ids[metric] = entity_id
+    return entity_ids
+
+
+def _build_columns(
+    times: Sequence[datetime], series: Mapping[Metric, _Series]
+) -> MeasurementColumns:
+    """Pair each measurement time with its weight and impedance readings."""
+
+    def _column(metric: Metric) -> list[float | None] | None:
+        values = series.get(metric)
+        if values is None:
+            return None
+        return [values.value_at(when + MEASUREMENT_WINDOW) for when in times]
+
+    return MeasurementColumns(
+        weight=_column(Metric.WEIGHT) or [],
+        impedance=_column(Metric.IMPEDANCE),
+        impedance_low=_column(Metric.IMPEDANCE_LOW),
+        impedance_high=_column(Metric.IMPEDANCE_HIGH),
+        timestamps=times,
+    )
+
+
+def _load_states(
+    hass: HomeAssistant,
+    start: datetime,
+    end: datetime,
+    entity_ids: list[str],
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Load every recorded state of the entities in one window (executor)."""
+    return history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids,
+        include_start_time_state=True,
+        significant_changes_only=False,
+        no_attributes=True,
+    )
+
+
+async def async_recompute_history(
+    hass: HomeAssistant,
+    handler: BodyScaleMetricsHandler,
+    start: datetime,
+    end: datetime,
+) -> tuple[int, int]:
+    """Recompute a profile's metrics between two dates and import them.
+
+    Returns the number of measurements found and of hourly statistic rows
+    imported.
+    """
+    entity_ids = _profile_entity_ids(hass, handler)
+    if not {Metric.LAST_MEASUREMENT_TIME, Metric.WEIGHT} <= entity_ids.keys():
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="history_sensors_not_found",
+            translation_placeholders={"name": handler.config[CONF_NAME]},
+        )
+
+    recorder = get_instance(hass)
+    name = handler.config[CONF_NAME]
+    measurements = 0
+    imported = 0
+    previous: datetime | None = None
+
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + HISTORY_CHUNK, end)
+        states = await recorder.async_add_executor_job(
+            _load_states,
+            hass,
+            chunk_start,
+            min(chunk_end + MEASUREMENT_WINDOW, end),
+            list(entity_ids.values()),
+        )
+        times = _measurement_times(
+            states.get(entity_ids[Metric.LAST_MEASUREMENT_TIME], []),
+            chunk_start,
+            chunk_end,
+            previous,
+        )
+        if times:
+            previous = times[-1]
+            columns = _build_columns(
+                times,
+                {
+                    metric: _Series.from_states(states.get(entity_id, []))
+                    for metric, entity_id in entity_ids.items()
+                    if metric is not Metric.LAST_MEASUREMENT_TIME
+                },
+            )
+            results = await hass.async_add_executor_job(
+                compute_batch, handler.config, columns
+            )
+            measurements += len(times)
+            imported += async_import_metric_statistics(
+                hass,
+                name,
+                times,
+                {
+                    **results,
+                    Metric.WEIGHT: columns.weight,
+                    Metric.IMPEDANCE: columns.impedance,
+                    Metric.IMPEDANCE_LOW: columns.impedance_low,
+                    Metric.IMPEDANCE_HIGH: columns.impedance_high,
+                },
+            )
+        # Drop the window before loading the next one.
+        del states
+        chunk_start = chunk_end
+
+    _LOGGER.debug(
+        "[%s][history] Recomputed %d measurements, %d hourly statistics",
+        name,
+        measurements,
+        imported,
+    )
+    return measurements, imported
+
+
+async def _async_handle_recompute_history(call: ServiceCall) -> ServiceResponse:
+    """Handle the recompute_history service call."""
+    hass = call.hass
+    entry_id: str = call.data[ATTR_CONFIG_ENTRY_ID]
+    handler: BodyScaleMetricsHandler | None = (
+        hass.data.get(DOMAIN, {}).get(HANDLERS, {}).get(entry_id)
+    )
+    if handler is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="profile_not_found",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    if RECORDER_DOMAIN not in hass.config.components:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="recorder_not_available",
+        )
+
+    end = dt_util.utcnow()
+    start: datetime | None = call.data.get(ATTR_START)
+    if start is None:
+        start = end - timedelta(days=get_instance(hass).keep_days)
+    elif start.tzinfo is None:
+        start = start.replace(tzinfo=dt_util.get_default_time_zone())
+    start = dt_util.as_utc(start)
+    # Hour-aligned windows never split an hourly statistic between chunks.
+    start = start.replace(minute=0, second=0, microsecond=0)
+
+    measurements, imported = await async_recompute_history(hass, handler, start, end)
+    return {"measurements": measurements, "statistics": imported}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    if hass.services.has_service(DOMAIN, SERVICE_RECOMPUTE_HISTORY):
+        return
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECOMPUTE_HISTORY,
+        _async_handle_recompute_history,
+        schema=SERVICE_RECOMPUTE_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services."""
+    hass.services.async_remove(DOMAIN, SERVICE_RECOMPUTE_HISTORY)
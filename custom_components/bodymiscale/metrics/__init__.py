@@ -2,30 +2,25 @@
 
 import logging
 import time
+from array import array
+from collections import deque
 from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.const import (
-    ATTR_UNIT_OF_MEASUREMENT,
-    STATE_UNAVAILABLE,
-    STATE_UNKNOWN,
-)
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     EventStateChangedData,
-    EventStateReportedData,
     HomeAssistant,
     State,
     callback,
 )
-from homeassistant.helpers.event import (
-    async_call_later,
-    async_track_state_change_event,
-    async_track_state_report_event,
-)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 from homeassistant.util import dt as dt_util
 
@@ -35,34 +30,53 @@ from ..const import (
     CONF_HEIGHT,
     CONF_IMPEDANCE_MODE,
     CONF_INITIAL_WEIGHT,
+    CONF_PROFILE_ID,
     CONF_PROFILE_METHOD,
     CONF_SCALE,
     CONF_SENSOR_IMPEDANCE,
     CONF_SENSOR_IMPEDANCE_HIGH,
     CONF_SENSOR_IMPEDANCE_LOW,
+    CONF_SENSOR_PROFILE_ID,
     CONF_SENSOR_STABILIZED,
     CONF_SENSOR_WEIGHT,
-    CONSTRAINT_IMPEDANCE_MAX,
-    CONSTRAINT_IMPEDANCE_MIN,
-    CONSTRAINT_WEIGHT_MAX,
-    CONSTRAINT_WEIGHT_MIN,
+    CONF_SETTLE_WINDOW,
+    CONF_WEIGHT_MAX,
+    CONF_WEIGHT_MIN,
+    DOMAIN,
     IMPEDANCE_MODE_DUAL,
     IMPEDANCE_MODE_NONE,
+    IMPEDANCE_MODE_OPTIONS,
     IMPEDANCE_MODE_STANDARD,
     PENDING_MEASUREMENT_TIMEOUT,
     PROBLEM_NONE,
+    PROFILE_ID_ROUTER,
     PROFILE_METHOD_NEAREST,
-    UNIT_POUNDS,
+    RECALCULATION_DEBOUNCE,
+    SENSOR_DISPATCHER,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
 )
 from ..models import Gender, Metric
 from ..profile import (
+    NearestWeightRouter,
     NotificationCoordinator,
     NotificationFilter,
+    PendingMeasurement,
     ProfileFilter,
+    ProfileIdFilter,
+    ProfileIdRouter,
+    WeightRangeFilter,
+    WeightRangeIndex,
     build_profile_filter,
 )
 from ..util import get_age
 from .body_score import get_body_score
+from .dispatcher import (
+    SensorDispatcher,
+    SensorReading,
+    parse_impedance,
+    parse_weight,
+)
 from .impedance import (
     get_bcm,
     get_body_type,
@@ -174,15 +188,6 @@ _METRIC_DEPS: dict[Metric, MetricInfo] = {
 }
 
 
-def _modify_state_for_subscriber(
-    metric_info: MetricInfo, state: StateType | datetime
-) -> StateType | datetime:
-    """Round the state before sending to sensors."""
-    if isinstance(state, (int, float)) and metric_info.decimals is not None:
-        return round(float(state), metric_info.decimals)
-    return state
-
-
 # Raw sensor readings — stored without TTL so they remain available until the
 # next valid measurement. This is required by the notification flow: the user
 # may confirm their identity several minutes after the scale fires, and both
@@ -200,7 +205,202 @@ _SOURCE_METRICS: frozenset[Metric] = frozenset(
 )
 
 
-class _MetricsStore(MutableMapping):
+# Metrics that depend only on weight (no impedance required)
+_WEIGHT_ONLY_METRICS: frozenset[Metric] = frozenset(
+    {
+        Metric.BMI,
+        Metric.BMR,
+        Metric.VISCERAL_FAT,
+    }
+)
+
+# Metrics that need an impedance reading although their declared dependencies
+# don't list one (see the note on _METRIC_DEPS).
+_IMPEDANCE_GATED_METRICS: frozenset[Metric] = frozenset(
+    {Metric.LBM, Metric.METABOLIC_AGE}
+)
+
+_IMPEDANCE_SOURCES: frozenset[Metric] = frozenset(
+    {Metric.IMPEDANCE, Metric.IMPEDANCE_LOW, Metric.IMPEDANCE_HIGH}
+)
+
+# Impedance readings a profile can ever receive, per impedance mode.
+_MODE_SOURCES: dict[str, frozenset[Metric]] = {
+    IMPEDANCE_MODE_NONE: frozenset(),
+    IMPEDANCE_MODE_STANDARD: frozenset({Metric.IMPEDANCE}),
+    IMPEDANCE_MODE_DUAL: frozenset({Metric.IMPEDANCE_LOW, Metric.IMPEDANCE_HIGH}),
+}
+
+# Inputs that calculators read without declaring them in ``depends_on`` —
+# they are optional for the calculation (ordering is unaffected) but a change
+# must still invalidate the reader.
+_IMPLICIT_DEPENDENTS: dict[Metric, frozenset[Metric]] = {
+    **dict.fromkeys(_IMPEDANCE_SOURCES, _IMPEDANCE_GATED_METRICS),
+    Metric.LBM: frozenset(
+        {Metric.BMR, Metric.METABOLIC_AGE, Metric.PROTEIN_PERCENTAGE}
+    ),
+    Metric.SKELETAL_MUSCLE_MASS: frozenset({Metric.BODY_SCORE}),
+}
+
+
+def _inputs(deps: Mapping[Metric, MetricInfo], metric: Metric) -> list[Metric]:
+    """Return every metric read by a calculator, declared or implicit."""
+    return [*deps[metric].depends_on] + [
+        dep for dep, readers in _IMPLICIT_DEPENDENTS.items() if metric in readers
+    ]
+
+
+def _topological_order(deps: Mapping[Metric, MetricInfo]) -> tuple[Metric, ...]:
+    """Return derived metrics in topological order (dependencies before dependents).
+
+    Implicit inputs count as dependencies too, so a reader always comes
+    after them.
+    """
+    derived = [m for m in deps if m not in _SOURCE_METRICS]
+
+    # Kahn's algorithm
+    dependents: dict[Metric, list[Metric]] = {m: [] for m in derived}
+    in_degree: dict[Metric, int] = {}
+    for metric in derived:
+        graph_deps = [
+            d for d in _inputs(deps, metric) if d in deps and d not in _SOURCE_METRICS
+        ]
+        in_degree[metric] = len(graph_deps)
+        for dep in graph_deps:
+            dependents[dep].append(metric)
+
+    queue = deque(m for m, deg in in_degree.items() if deg == 0)
+    ordered: list[Metric] = []
+
+    while queue:
+        metric = queue.popleft()
+        ordered.append(metric)
+        for dependent in dependents[metric]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    return tuple(ordered)
+
+
+@dataclass(frozen=True)
+class _EvaluationPlan:
+    """Pre-filtered metric sequences for each kind of recalculation pass."""
+
+    weight_only: tuple[Metric, ...]
+    impedance: tuple[Metric, ...]
+    full: tuple[Metric, ...]
+
+
+def _build_evaluation_plan(impedance_mode: str) -> _EvaluationPlan:
+    """Compile the evaluation plan for one impedance mode.
+
+    Only metrics whose dependencies can ever be satisfied in this mode are
+    kept, so a pass never visits e.g. ECW on a mono-frequency scale.
+
+    The impedance pass also visits the weight-only metrics that read one of
+    its outputs (BMR reads LBM): they are invalidated by that pass and must
+    be recomputed within it, not at the next weighing.
+    """
+    impedance_sources = _MODE_SOURCES.get(impedance_mode, frozenset())
+    available: set[Metric] = {
+        m for m in _SOURCE_METRICS if m not in _IMPEDANCE_SOURCES
+    } | impedance_sources
+
+    reachable: list[Metric] = []
+    for metric in _topological_order(_METRIC_DEPS):
+        if metric in _IMPEDANCE_GATED_METRICS and not impedance_sources:
+            continue
+        if all(d in available for d in _METRIC_DEPS[metric].depends_on):
+            available.add(metric)
+            reachable.append(metric)
+
+    impedance: list[Metric] = []
+    for metric in reachable:
+        if metric not in _WEIGHT_ONLY_METRICS or any(
+            dep in impedance for dep in _inputs(_METRIC_DEPS, metric)
+        ):
+            impedance.append(metric)
+
+    return _EvaluationPlan(
+        weight_only=tuple(m for m in reachable if m in _WEIGHT_ONLY_METRICS),
+        impedance=tuple(impedance),
+        full=tuple(reachable),
+    )
+
+
+# Built once at import time — a measurement pass is a flat loop over a tuple.
+_EVALUATION_PLANS: dict[str, _EvaluationPlan] = {
+    mode: _build_evaluation_plan(mode) for mode in IMPEDANCE_MODE_OPTIONS
+}
+
+
+def _prepare_config(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the config as the calculators expect it (typed gender, scale)."""
+    prepared: dict[str, Any] = {**config, CONF_GENDER: Gender(config[CONF_GENDER])}
+    prepared[CONF_SCALE] = Scale(prepared[CONF_HEIGHT], prepared[CONF_GENDER])
+    return prepared
+
+
+def _has_impedance(
+    impedance_mode: str, metrics: Mapping[Metric, StateType | datetime]
+) -> bool:
+    """Return True if a valid impedance reading is available for the mode."""
+    if impedance_mode == IMPEDANCE_MODE_STANDARD:
+        return Metric.IMPEDANCE in metrics
+    if impedance_mode == IMPEDANCE_MODE_DUAL:
+        # Both frequencies must be available
+        return Metric.IMPEDANCE_LOW in metrics and Metric.IMPEDANCE_HIGH in metrics
+    return False
+
+
+def _can_compute(
+    metric: Metric,
+    impedance_mode: str,
+    metrics: Mapping[Metric, StateType | datetime],
+) -> bool:
+    """Return True if all dependencies for this metric are satisfied."""
+    info = _METRIC_DEPS.get(metric)
+    if info is None:
+        return False
+    if metric in _IMPEDANCE_GATED_METRICS:
+        if not _has_impedance(impedance_mode, metrics):
+            return False
+        if Metric.WEIGHT not in metrics:
+            return False
+        other_deps = [d for d in info.depends_on if d is not Metric.IMPEDANCE]
+        return all(d in metrics for d in other_deps)
+    return all(d in metrics for d in info.depends_on)
+
+
+def _modify_state_for_subscriber(
+    metric_info: MetricInfo, state: StateType | datetime
+) -> StateType | datetime:
+    """Round the state before sending to sensors."""
+    if isinstance(state, (int, float)) and metric_info.decimals is not None:
+        return round(float(state), metric_info.decimals)
+    return state
+
+
+def _as_float(value: StateType | datetime) -> StateType | datetime:
+    """Coerce a numeric value (or numeric string) to float, keep anything else."""
+    if isinstance(value, (int, str)):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Fixed slot of every metric in the store arrays — Metric is a closed enum.
+_ALL_METRICS: tuple[Metric, ...] = tuple(Metric)
+_METRIC_SLOTS: dict[Metric, int] = {
+    metric: slot for slot, metric in enumerate(_ALL_METRICS)
+}
+_SOURCE_MASK: int = sum(1 << _METRIC_SLOTS[metric] for metric in _SOURCE_METRICS)
+
+
+class _MetricsStore(MutableMapping[Metric, StateType | datetime]):
     """Unified metric store with two retention policies.
 
     Source metrics (weight, impedance, age, timestamp, status) are kept
@@ -209,70 +409,218 @@ class _MetricsStore(MutableMapping):
     Derived metrics (BMI, fat%, muscle mass, score…) expire after ``ttl``
     seconds so that stale calculated values are not served if the sensors
     go silent.
+
+    Values live in fixed slots indexed by the metric ordinal: a value list,
+    an array of monotonic insertion timestamps and a presence bitmask.
+    Inside ``pass_clock()`` the clock is read once for the whole pass
+    instead of once per lookup.
     """
 
+    __slots__ = ("_evictions", "_now", "_present", "_stamps", "_ttl", "_values")
+
     def __init__(self, ttl: float) -> None:
         self._ttl = ttl
-        self._sources: dict[Metric, StateType | datetime] = {}
-        # Derived metrics stored as (value, monotonic insertion timestamp).
-        self._derived: dict[Metric, tuple[StateType | datetime, float]] = {}
+        self._values: list[StateType | datetime] = [None] * len(_ALL_METRICS)
+        self._stamps = array("d", [0.0]) * len(_ALL_METRICS)
+        self._present = 0
+        self._now: float | None = None
+        self._evictions = 0
 
     # ── MutableMapping interface ──────────────────────────────────────────
 
     def __setitem__(self, key: Metric, value: StateType | datetime) -> None:
-        if key in _SOURCE_METRICS:
-            self._sources[key] = value
-        else:
-            self._derived[key] = (value, time.monotonic())
+        slot = _METRIC_SLOTS[key]
+        self._values[slot] = value
+        self._stamps[slot] = self._clock()
+        self._present |= 1 << slot
 
     def __getitem__(self, key: Metric) -> StateType | datetime:
-        if key in _SOURCE_METRICS:
-            return self._sources[key]
-        entry = self._derived.get(key)
-        if entry is None:
-            raise KeyError(key)
-        value, ts = entry
-        if time.monotonic() - ts > self._ttl:
-            del self._derived[key]
+        slot = self._live_slot(key)
+        if slot is None:
             raise KeyError(key)
-        return value
+        return self._values[slot]
 
     def __delitem__(self, key: Metric) -> None:
-        if key in _SOURCE_METRICS:
-            del self._sources[key]
-        else:
-            del self._derived[key]
+        slot = _METRIC_SLOTS.get(key)
+        if slot is None or not self._present >> slot & 1:
+            raise KeyError(key)
+        self._clear(slot)
 
     def __iter__(self) -> Iterator[Metric]:
         self._evict_expired()
-        return iter(set(self._sources) | set(self._derived))
+        present = self._present
+        return iter(
+            [metric for slot, metric in enumerate(_ALL_METRICS) if present >> slot & 1]
+        )
 
     def __len__(self) -> int:
         self._evict_expired()
-        return len(self._sources) + len(self._derived)
+        return self._present.bit_count()
 
     def __contains__(self, key: object) -> bool:
-        if key in _SOURCE_METRICS:
-            return key in self._sources
-        if not isinstance(key, Metric):
-            return False
-        entry = self._derived.get(key)
-        if entry is None:
-            return False
-        _, ts = entry
-        if time.monotonic() - ts > self._ttl:
-            del self._derived[key]
-            return False
-        return True
+        return isinstance(key, Metric) and self._live_slot(key) is not None
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
+    @property
+    def evictions(self) -> int:
+        """Return how many derived values expired since the store was created."""
+        return self._evictions
+
+    @contextmanager
+    def pass_clock(self) -> Iterator[None]:
+        """Share one clock reading across every lookup of a recalculation pass."""
+        if self._now is not None:
+            yield
+            return
+        self._now = time.monotonic()
+        try:
+            yield
+        finally:
+            self._now = None
+
+    def _clock(self) -> float:
+        return time.monotonic() if self._now is None else self._now
+
+    def _clear(self, slot: int) -> None:
+        self._present &= ~(1 << slot)
+        self._values[slot] = None
+
+    def _expire(self, slot: int) -> None:
+        self._clear(slot)
+        self._evictions += 1
+
+    def _live_slot(self, key: Metric) -> int | None:
+        """Return the slot of a stored metric, evicting it if it expired."""
+        slot = _METRIC_SLOTS.get(key)
+        if slot is None or not self._present >> slot & 1:
+            return None
+        if (
+            not _SOURCE_MASK >> slot & 1
+            and self._clock() - self._stamps[slot] > self._ttl
+        ):
+            self._expire(slot)
+            return None
+        return slot
+
+    def snapshot(self) -> dict[Metric, StateType | datetime]:
+        """Return the live metrics with numeric values coerced to float."""
+        self._evict_expired()
+        present = self._present
+        return {
+            metric: _as_float(self._values[slot])
+            for slot, metric in enumerate(_ALL_METRICS)
+            if present >> slot & 1
+        }
+
     def _evict_expired(self) -> None:
         """Remove expired derived entries (called on iteration)."""
-        now = time.monotonic()
-        expired = [k for k, (_, ts) in self._derived.items() if now - ts > self._ttl]
-        for k in expired:
-            del self._derived[k]
+        derived = self._present & ~_SOURCE_MASK
+        if not derived:
+            return
+        now = self._clock()
+        for slot in range(len(_ALL_METRICS)):
+            if derived >> slot & 1 and now - self._stamps[slot] > self._ttl:
+                self._expire(slot)
+
+
+# Most recent pass durations kept for the diagnostics percentiles.
+PASS_DURATION_SAMPLES = 200
+
+
+def _percentile(ordered: list[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of an ordered sample list."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+@dataclass(slots=True)
+class HandlerStats:
+    """Counters of the work done by a handler, reported in the diagnostics."""
+
+    passes: int = 0
+    computed: int = 0
+    # Metric still fresh and none of its inputs changed.
+    skipped_fresh: int = 0
+    # Dependencies not available (e.g. no impedance for this cycle).
+    skipped_unmet: int = 0
+    subscriber_calls: int = 0
+    # Measurements rejected by the profile filter, per filter class.
+    rejections: dict[str, int] = field(default_factory=dict)
+    pass_durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=PASS_DURATION_SAMPLES)
+    )
+
+    def reject(self, profile_filter: ProfileFilter) -> None:
+        """Count a measurement rejected by a profile filter."""
+        name = type(profile_filter).__name__
+        self.rejections[name] = self.rejections.get(name, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and the pass duration percentiles (ms)."""
+        durations = sorted(self.pass_durations)
+        p50 = _percentile(durations, 0.5)
+        p95 = _percentile(durations, 0.95)
+        return {
+            "passes": self.passes,
+            "computed": self.computed,
+            "skipped_fresh": self.skipped_fresh,
+            "skipped_unmet": self.skipped_unmet,
+            "subscriber_calls": self.subscriber_calls,
+            "rejections": dict(self.rejections),
+            "pass_duration_ms": {
+                "samples": len(durations),
+                "p50": None if p50 is None else round(p50 * 1000, 3),
+                "p95": None if p95 is None else round(p95 * 1000, 3),
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CycleLatency:
+    """Where the time of one measurement cycle went, in seconds.
+
+    The stages follow each other: ``ingest`` runs from the weight reading
+    to the last reading of the weighing (or the end of the settle window),
+    ``filter`` until the profile let the measurement through and the first
+    pass started (the user's confirmation for notify profiles), ``compute``
+    is the time spent in the passes and ``publish`` runs from the end of
+    the cycle to the state write of the main entity.
+    """
+
+    ingest: float
+    filter: float
+    compute: float
+    publish: float
+
+    @property
+    def total(self) -> float:
+        """Return the time from the weight reading to the state write."""
+        return self.ingest + self.filter + self.compute + self.publish
+
+
+@dataclass(slots=True)
+class _CycleClock:
+    """``perf_counter`` marks of the measurement cycle in progress."""
+
+    started: float
+    # Last reading of the weighing, or the end of the settle window.
+    inputs: float
+    first_pass: float | None = None
+    compute: float = 0.0
+    completed: float | None = None
+
+    def latency(self, written: float) -> CycleLatency:
+        """Return the breakdown of a completed cycle written at ``written``."""
+        completed = self.completed if self.completed is not None else written
+        first_pass = self.first_pass if self.first_pass is not None else completed
+        return CycleLatency(
+            ingest=self.inputs - self.started,
+            filter=max(0.0, first_pass - self.inputs),
+            compute=self.compute,
+            publish=max(0.0, written - completed),
+        )
 
 
 class BodyScaleMetricsHandler:
@@ -286,16 +634,23 @@ class BodyScaleMetricsHandler:
     ) -> None:
         self._hass = hass
         self._config_entry_id = config_entry_id
-        self._config: dict[str, Any] = {
-            **config,
-            CONF_GENDER: Gender(config[CONF_GENDER]),
-        }
-        self._config[CONF_SCALE] = Scale(
-            self._config[CONF_HEIGHT], self._config[CONF_GENDER]
-        )
+        self._config: dict[str, Any] = _prepare_config(config)
 
         self._name: str = config.get("name", config_entry_id)
         self._profile_filter: ProfileFilter = build_profile_filter(self._config)
+        if isinstance(self._profile_filter, WeightRangeFilter):
+            ranges = self._weight_ranges()
+            w_min = self._config.get(CONF_WEIGHT_MIN)
+            w_max = self._config.get(CONF_WEIGHT_MAX)
+            if ranges is not None and w_min is not None and w_max is not None:
+                ranges.update(config_entry_id, float(w_min), float(w_max))
+                self._profile_filter.index_key = config_entry_id
+        elif isinstance(self._profile_filter, ProfileIdFilter):
+            id_router = self._profile_id_router()
+            sensor_profile_id = self._config.get(CONF_SENSOR_PROFILE_ID)
+            profile_id = self._config.get(CONF_PROFILE_ID)
+            if id_router is not None and sensor_profile_id and profile_id is not None:
+                id_router.register(self._name, sensor_profile_id, int(profile_id))
         self._notification_coordinator: NotificationCoordinator | None = None
 
         self._pending_weight: float | None = None
@@ -318,9 +673,7 @@ class BodyScaleMetricsHandler:
         # branch in _process_weight).
         self._bootstrapping: bool = False
 
-        self._available_metrics: MutableMapping[Metric, StateType | datetime] = (
-            _MetricsStore(ttl=60)
-        )
+        self._available_metrics = _MetricsStore(ttl=60)
 
         # Sensor problems: { "weight": "high", "impedance": "unavailable", ... }
         self._sensor_problems: dict[str, str] = {}
@@ -328,6 +681,32 @@ class BodyScaleMetricsHandler:
         self._subscribers: dict[
             Metric, list[Callable[[StateType | datetime], None]]
         ] = {}
+        # Last rounded value handed to subscribers, per metric. Scales often
+        # re-broadcast the same reading (state_reported); an identical value
+        # is not fanned out again.
+        self._published: dict[Metric, StateType | datetime] = {}
+        self._suppressed_notifications: int = 0
+        self._stats = HandlerStats()
+        # Values published during a recalculation pass are collected and
+        # dispatched together when the outermost pass ends: once per batch
+        # subscriber, and per metric key to the per-metric subscribers.
+        self._batch_subscribers: list[
+            Callable[[Mapping[Metric, StateType | datetime]], None]
+        ] = []
+        self._pending_changes: dict[Metric, StateType | datetime] = {}
+        self._dispatch_depth: int = 0
+        # Snapshot of a cycle completed inside a batched dispatch, handed to
+        # the cycle subscribers once its values were dispatched.
+        self._completed_cycle: dict[Metric, StateType | datetime] | None = None
+        # Called once per completed measurement cycle with every metric.
+        self._cycle_subscribers: list[
+            Callable[[Mapping[Metric, StateType | datetime]], None]
+        ] = []
+        # Latency breakdown of the cycle in progress and of the last one
+        # that reached the main entity state.
+        self._cycle_clock: _CycleClock | None = None
+        self._last_latency: CycleLatency | None = None
+        self._latency_subscribers: list[Callable[[CycleLatency], None]] = []
 
         # Build the dependency graph
         self._dependencies: dict[Metric, MetricInfo] = {
@@ -341,6 +720,22 @@ class BodyScaleMetricsHandler:
         for key, value in self._dependencies.items():
             for dep in value.depends_on:
                 self._dependencies[dep].depended_by.append(key)
+        for dep, readers in _IMPLICIT_DEPENDENTS.items():
+            for reader in readers:
+                if reader not in self._dependencies[dep].depended_by:
+                    self._dependencies[dep].depended_by.append(reader)
+
+        # Measurement cycle assembler: with impedance, an accepted weight
+        # opens a cycle that waits up to the settle window for the impedance
+        # reading(s), so one recalculation covers the whole weighing.
+        self._settle_window: float = float(
+            self._config.get(CONF_SETTLE_WINDOW, RECALCULATION_DEBOUNCE)
+        )
+        self._settle_cancel: CALLBACK_TYPE | None = None
+
+        # Derived metrics whose inputs changed since they were last computed.
+        # A pass skips every metric that is neither dirty nor expired.
+        self._dirty: set[Metric] = set()
 
         if self._config.get(CONF_PROFILE_METHOD) == PROFILE_METHOD_NEAREST:
             initial_weight = self._config.get(CONF_INITIAL_WEIGHT)
@@ -353,6 +748,9 @@ class BodyScaleMetricsHandler:
 
         # Subscribe to sensors based on impedance mode
         impedance_mode = self._config.get(CONF_IMPEDANCE_MODE, "none")
+        self._plan: _EvaluationPlan = _EVALUATION_PLANS.get(
+            impedance_mode, _EVALUATION_PLANS[IMPEDANCE_MODE_NONE]
+        )
         if (
             impedance_mode == IMPEDANCE_MODE_STANDARD
             and CONF_SENSOR_IMPEDANCE in self._config
@@ -370,51 +768,33 @@ class BodyScaleMetricsHandler:
             sensors.append(stabilized_id)
 
         self._sensors_set = frozenset(sensors)
-        self._last_reported_ts: dict[str, float] = {}
         self._remove_listener: CALLBACK_TYPE | None = None
         self._setup_listeners(sensors, stabilized_id)
 
     def _setup_listeners(self, sensors: list[str], stabilized_id: str | None) -> None:
-        """Subscribe to state_changed and state_reported for measurement sensors."""
+        """Subscribe to the source sensors through the shared dispatcher."""
         measurement_sensors = [s for s in sensors if s != stabilized_id]
         _LOGGER.debug(
             "[%s] subscribing to state_changed+state_reported for %s",
             self._name,
             measurement_sensors,
         )
-
-        @callback
-        def _on_state_change(event: Event[EventStateChangedData]) -> None:
-            """Handle state_changed — fires when value actually changes."""
-            new_state = event.data.get("new_state")
-            entity_id = event.data.get("entity_id")
-            _LOGGER.debug("[%s][state_changed] received: %s", self._name, entity_id)
-            if entity_id is None or new_state is None:
-                return
-            ts = new_state.last_reported.timestamp()
-            if self._last_reported_ts.get(entity_id) == ts:
-                return
-            self._last_reported_ts[entity_id] = ts
-            self._state_changed(entity_id, new_state)
-
-        @callback
-        def _on_state_report(event: Event[EventStateReportedData]) -> None:
-            """Handle state_reported — fires on every write, even if value unchanged."""
-            entity_id: str = event.data["entity_id"]
-            _LOGGER.debug("[%s][state_reported] received: %s", self._name, entity_id)
-            new_state = self._hass.states.get(entity_id)
-            if new_state is None:
-                return
-            self._last_reported_ts[entity_id] = new_state.last_reported.timestamp()
-            self._state_changed(entity_id, new_state)
+        dispatcher: SensorDispatcher | None = self._hass.data.get(DOMAIN, {}).get(
+            SENSOR_DISPATCHER
+        )
+        if dispatcher is None:
+            # Handler used outside a set-up entry — listen on its own.
+            dispatcher = SensorDispatcher(self._hass)
 
         removers: list[CALLBACK_TYPE] = [
-            async_track_state_change_event(
-                self._hass, measurement_sensors, _on_state_change
-            ),
-            async_track_state_report_event(
-                self._hass, measurement_sensors, _on_state_report
-            ),
+            dispatcher.subscribe(
+                sensor_id,
+                self._on_sensor_state,
+                parse_weight
+                if sensor_id == self._config[CONF_SENSOR_WEIGHT]
+                else parse_impedance,
+            )
+            for sensor_id in measurement_sensors
         ]
 
         if stabilized_id:
@@ -423,18 +803,9 @@ class BodyScaleMetricsHandler:
                 self._name,
                 stabilized_id,
             )
-
-            @callback
-            def _on_stabilized_change(event: Event[EventStateChangedData]) -> None:
-                new_state = event.data.get("new_state")
-                entity_id = event.data.get("entity_id")
-                if entity_id is None or new_state is None:
-                    return
-                self._state_changed(entity_id, new_state)
-
             removers.append(
-                async_track_state_change_event(
-                    self._hass, [stabilized_id], _on_stabilized_change
+                dispatcher.subscribe(
+                    stabilized_id, self._on_sensor_state, reported=False
                 )
             )
 
@@ -455,6 +826,9 @@ class BodyScaleMetricsHandler:
                 state = self._hass.states.get(sensor_id)
                 if state is not None:
                     self._state_changed(sensor_id, state)
+            # Every reading was replayed — do not wait for a missing impedance.
+            if self._cancel_settle_timer():
+                self._trigger_weight_only_metrics()
         finally:
             self._bootstrapping = False
 
@@ -483,6 +857,38 @@ class BodyScaleMetricsHandler:
             return None
         return float(current)
 
+    @property
+    def suppressed_notifications(self) -> int:
+        """Return how many unchanged values were not sent to subscribers."""
+        return self._suppressed_notifications
+
+    @property
+    def stats(self) -> HandlerStats:
+        """Return the pass and dispatch counters of this handler."""
+        return self._stats
+
+    @property
+    def ttl_evictions(self) -> int:
+        """Return how many derived metrics expired before being recomputed."""
+        return self._available_metrics.evictions
+
+    @property
+    def last_cycle_latency(self) -> CycleLatency | None:
+        """Return the latency breakdown of the last published cycle."""
+        return self._last_latency
+
+    def _weight_router(self) -> NearestWeightRouter | None:
+        """Return the domain weight index, if the integration is set up."""
+        return self._hass.data.get(DOMAIN, {}).get(WEIGHT_ROUTER)
+
+    def _weight_ranges(self) -> WeightRangeIndex | None:
+        """Return the domain weight-range index, if the integration is set up."""
+        return self._hass.data.get(DOMAIN, {}).get(WEIGHT_RANGES)
+
+    def _profile_id_router(self) -> ProfileIdRouter | None:
+        """Return the domain profile ID table, if the integration is set up."""
+        return self._hass.data.get(DOMAIN, {}).get(PROFILE_ID_ROUTER)
+
     def set_notification_coordinator(
         self, coordinator: NotificationCoordinator
     ) -> None:
@@ -516,46 +922,91 @@ class BodyScaleMetricsHandler:
         self._last_accepted_weight = None
 
     @callback
-    def accept_pending_measurement(self) -> None:
-        """Replay the pending measurement after the user confirms via notification."""
+    def accept_pending_measurement(
+        self, measurement: PendingMeasurement | None = None
+    ) -> None:
+        """Replay a pending measurement after the user confirms via notification.
+
+        ``measurement`` comes from the coordinator's queue (possibly restored
+        after a restart); without it, the last weighing seen by this handler
+        is replayed.
+        """
+        if measurement is not None:
+            if (
+                self._pending_state is not None
+                and self._pending_state.last_reported == measurement.measured
+            ):
+                self._clear_pending_slot()
+            else:
+                # Queued before a restart or another weighing: the time
+                # spent before the confirmation is unknown.
+                now = time.perf_counter()
+                self._cycle_clock = _CycleClock(started=now, inputs=now)
+            _LOGGER.debug(
+                "accept_pending_measurement: replaying queued %.2f kg (%s)",
+                measurement.weight,
+                measurement.measurement_id,
+            )
+            with self._batched_dispatch():
+                self._replay_pending_measurement(
+                    State(measurement.sensor, str(measurement.weight)),
+                    measurement.impedance,
+                    SensorReading(value=measurement.weight),
+                )
+            return
+
         if self._pending_weight is None or self._pending_state is None:
             _LOGGER.debug(
                 "accept_pending_measurement: no pending measurement to replay"
             )
             return
 
-        self._cancel_pending_timeout()
-
         _LOGGER.debug(
             "accept_pending_measurement: replaying %.2f kg after confirmation",
             self._pending_weight,
         )
         pending_state = self._pending_state
+        impedance = {
+            metric: val for metric, (val, _state) in self._pending_impedance.items()
+        }
+        self._clear_pending_slot()
+
+        with self._batched_dispatch():
+            self._replay_pending_measurement(pending_state, impedance)
+
+    def _clear_pending_slot(self) -> None:
+        """Forget the last weighing waiting for a confirmation."""
+        self._cancel_pending_timeout()
         self._pending_weight = None
         self._pending_state = None
+        self._pending_impedance.clear()
 
+    def _replay_pending_measurement(
+        self,
+        pending_state: State,
+        impedance: Mapping[Metric, float],
+        reading: SensorReading | None = None,
+    ) -> None:
+        """Process a confirmed pending weight and its impedance readings."""
         self._replaying = True
         try:
-            valid, problem = self._process_weight(pending_state)
+            valid, problem = self._process_weight(pending_state, reading)
         finally:
             self._replaying = False
 
         if problem:
             self._set_sensor_problem(self._config[CONF_SENSOR_WEIGHT], problem)
         if valid:
-            if self._pending_impedance:
-                for metric, (val, _state) in self._pending_impedance.items():
-                    _LOGGER.debug(
-                        "accept_pending_measurement: replaying impedance %s=%.2f",
-                        metric,
-                        val,
-                    )
-                    self._update_available_metric(metric, val)
-                self._pending_impedance.clear()
-            self._update_available_metric(
-                Metric.LAST_MEASUREMENT_TIME, dt_util.utcnow()
-            )
+            for metric, val in impedance.items():
+                _LOGGER.debug(
+                    "accept_pending_measurement: replaying impedance %s=%.2f",
+                    metric,
+                    val,
+                )
+                self._update_available_metric(metric, val)
+            self._stamp_measurement_time()
             self._trigger_dependent_recalculation()
+            self._complete_cycle()
 
     # ── Lifecycle ────────────────────────────────────────────────────────────
 
@@ -563,11 +1014,25 @@ class BodyScaleMetricsHandler:
     def unload(self) -> None:
         """Unload the handler."""
         self._cancel_pending_timeout()
+        self._cancel_settle_timer()
+        router = self._weight_router()
+        if router is not None:
+            router.remove(self._name)
+        ranges = self._weight_ranges()
+        if ranges is not None:
+            ranges.remove(self._config_entry_id)
+        id_router = self._profile_id_router()
+        if id_router is not None:
+            id_router.unregister(self._name)
 
         if self._remove_listener is not None:
             self._remove_listener()
             self._remove_listener = None
         self._subscribers.clear()
+        self._batch_subscribers.clear()
+        self._cycle_subscribers.clear()
+        self._latency_subscribers.clear()
+        self._cycle_clock = None
 
     # ── Subscribe ─────────────────────────────────────────────────────────────
 
@@ -591,6 +1056,91 @@ class BodyScaleMetricsHandler:
 
         return _remove_subscription
 
+    def subscribe_batch(
+        self, callback_func: Callable[[Mapping[Metric, StateType | datetime]], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe for every metric change, one snapshot per pass.
+
+        The callback receives a read-only mapping of the metrics whose
+        published value changed during the pass — immediately with every
+        available metric, then once per recalculation pass.
+        """
+        self._batch_subscribers.append(callback_func)
+
+        @callback
+        def _remove_subscription() -> None:
+            """Remove the subscription."""
+            if callback_func in self._batch_subscribers:
+                self._batch_subscribers.remove(callback_func)
+
+        current = {
+            metric: _modify_state_for_subscriber(self._dependencies[metric], value)
+            for metric, value in self._available_metrics.items()
+            if metric in self._dependencies
+        }
+        if current:
+            callback_func(MappingProxyType(current))
+
+        return _remove_subscription
+
+    def subscribe_cycle(
+        self, callback_func: Callable[[Mapping[Metric, StateType | datetime]], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe for completed measurement cycles.
+
+        The callback receives a snapshot of every available metric once the
+        weight and, depending on the impedance mode, the impedance readings
+        of a measurement have been processed, after the values of the cycle
+        were dispatched to the metric subscribers.
+        """
+        self._cycle_subscribers.append(callback_func)
+
+        @callback
+        def _remove_subscription() -> None:
+            """Remove the subscription."""
+            if callback_func in self._cycle_subscribers:
+                self._cycle_subscribers.remove(callback_func)
+
+        return _remove_subscription
+
+    def subscribe_latency(
+        self, callback_func: Callable[[CycleLatency], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe for the latency breakdown of each published cycle."""
+        self._latency_subscribers.append(callback_func)
+
+        @callback
+        def _remove_subscription() -> None:
+            """Remove the subscription."""
+            if callback_func in self._latency_subscribers:
+                self._latency_subscribers.remove(callback_func)
+
+        return _remove_subscription
+
+    @callback
+    def cycle_written(self) -> None:
+        """Close the latency breakdown once the main entity state is written.
+
+        Called by the main entity on every state write; only the first
+        write after a completed cycle ends it.
+        """
+        clock = self._cycle_clock
+        if clock is None or clock.completed is None:
+            return
+        self._cycle_clock = None
+        latency = clock.latency(time.perf_counter())
+        self._last_latency = latency
+        _LOGGER.debug(
+            "[%s][latency] ingest=%.3fs filter=%.3fs compute=%.3fs publish=%.3fs",
+            self._name,
+            latency.ingest,
+            latency.filter,
+            latency.compute,
+            latency.publish,
+        )
+        for sub in list(self._latency_subscribers):
+            sub(latency)
+
     # ── Restoration ───────────────────────────────────────────────────────────
 
     def restore_metric(self, metric: Metric, state: StateType | datetime) -> None:
@@ -656,9 +1206,28 @@ class BodyScaleMetricsHandler:
         )
 
     @callback
-    def _state_changed(self, entity_id: str | None, new_state: State | None) -> None:
+    def _on_sensor_state(
+        self, entity_id: str, new_state: State, reading: SensorReading | None
+    ) -> None:
+        """Handle a source sensor state routed by the dispatcher."""
+        self._state_changed(entity_id, new_state, reading)
+
+    @callback
+    def _state_changed(
+        self,
+        entity_id: str | None,
+        new_state: State | None,
+        reading: SensorReading | None = None,
+    ) -> None:
         if entity_id is None or new_state is None:
             return
+        with self._batched_dispatch():
+            self._process_state(entity_id, new_state, reading)
+
+    def _process_state(
+        self, entity_id: str, new_state: State, reading: SensorReading | None
+    ) -> None:
+        """Process one source sensor state and run the resulting passes."""
 
         raw = new_state.state
 
@@ -667,20 +1236,29 @@ class BodyScaleMetricsHandler:
             self._clear_sensor_problem(entity_id)
             return
 
+        if entity_id != self._config.get(CONF_SENSOR_STABILIZED):
+            self._mark_reading(entity_id)
+
         valid = False
         problem: str | None = None
 
         if entity_id == self._config[CONF_SENSOR_WEIGHT]:
-            valid, problem = self._process_weight(new_state)
+            valid, problem = self._process_weight(new_state, reading)
 
         elif entity_id == self._config.get(CONF_SENSOR_IMPEDANCE):
-            valid, problem = self._process_impedance(new_state, Metric.IMPEDANCE)
+            valid, problem = self._process_impedance(
+                new_state, Metric.IMPEDANCE, reading
+            )
 
         elif entity_id == self._config.get(CONF_SENSOR_IMPEDANCE_LOW):
-            valid, problem = self._process_impedance(new_state, Metric.IMPEDANCE_LOW)
+            valid, problem = self._process_impedance(
+                new_state, Metric.IMPEDANCE_LOW, reading
+            )
 
         elif entity_id == self._config.get(CONF_SENSOR_IMPEDANCE_HIGH):
-            valid, problem = self._process_impedance(new_state, Metric.IMPEDANCE_HIGH)
+            valid, problem = self._process_impedance(
+                new_state, Metric.IMPEDANCE_HIGH, reading
+            )
 
         elif entity_id == self._config.get(CONF_SENSOR_STABILIZED):
             self._process_stabilized(new_state)
@@ -695,50 +1273,55 @@ class BodyScaleMetricsHandler:
         if valid:
             impedance_mode = self._config.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE)
             if entity_id == self._config[CONF_SENSOR_WEIGHT]:
-                # Weight received — compute weight-only metrics immediately
-                self._trigger_weight_only_metrics()
                 if impedance_mode == IMPEDANCE_MODE_NONE:
                     # No impedance expected — full cycle complete
-                    self._update_available_metric(
-                        Metric.LAST_MEASUREMENT_TIME, dt_util.utcnow()
-                    )
+                    self._stamp_measurement_time()
+                    self._trigger_weight_only_metrics()
+                    self._complete_cycle()
+                else:
+                    # Wait for the impedance reading(s) of this weighing
+                    self._open_measurement_cycle()
             elif entity_id == self._config.get(CONF_SENSOR_IMPEDANCE):
-                # Standard impedance — compute impedance-dependent metrics
-                self._trigger_impedance_metrics()
+                # Standard impedance — the cycle is complete
+                self._finish_measurement_cycle()
             elif entity_id == self._config.get(CONF_SENSOR_IMPEDANCE_HIGH):
                 # Dual mode: impedance_high is the last packet — compute all
-                self._trigger_impedance_metrics()
+                self._finish_measurement_cycle()
             # impedance_low in dual mode → wait for impedance_high, do nothing
 
     # ── Process helpers ─────────────────────────────────────────────────────
 
-    def _process_weight(self, state: State) -> tuple[bool, str | None]:
-        raw = state.state
+    def _mark_reading(self, entity_id: str) -> None:
+        """Stamp a scale reading on the latency clock: a weight starts a cycle."""
+        if self._bootstrapping:
+            return
+        if entity_id == self._config[CONF_SENSOR_WEIGHT]:
+            now = time.perf_counter()
+            self._cycle_clock = _CycleClock(started=now, inputs=now)
+        else:
+            self._mark_inputs()
 
-        if raw == STATE_UNAVAILABLE:
-            _LOGGER.debug("[%s] Weight sensor unavailable — ignoring", self._name)
-            return False, None
+    def _mark_inputs(self) -> None:
+        """Extend the ingest stage of the cycle in progress until now.
 
-        try:
-            val = float(raw)
-        except ValueError:
-            return False, "invalid_format"
+        Impedance readings, the stabilized sensor and the end of the settle
+        window all mean the handler waited for the scale until this point.
+        """
+        clock = self._cycle_clock
+        if clock is not None and clock.completed is None:
+            clock.inputs = time.perf_counter()
 
-        if val < CONSTRAINT_WEIGHT_MIN:
+    def _process_weight(
+        self, state: State, reading: SensorReading | None = None
+    ) -> tuple[bool, str | None]:
+        if reading is None:
+            reading = parse_weight(state)
+        if reading.reset:
             # Scale reset to zero — clear last accepted weight for this cycle
             self._last_accepted_weight = None
-            if val == 0.0:
-                _LOGGER.debug(
-                    "[%s] Weight 0.0 kg — scale reset, ignoring silently", self._name
-                )
-                return False, None
-            _LOGGER.debug("Weight %.2f kg below minimum — ignoring (scale reset)", val)
-            return False, "low"
-        if val > CONSTRAINT_WEIGHT_MAX:
-            return False, "high"
-
-        if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == UNIT_POUNDS:
-            val *= 0.45359237
+        if reading.value is None:
+            return False, reading.problem
+        val = reading.value
 
         # ── Mode notification ─────────────────────────────────────────────────
         if (
@@ -757,12 +1340,21 @@ class BodyScaleMetricsHandler:
                 PENDING_MEASUREMENT_TIMEOUT,
                 self._expire_pending_measurement,
             )
-            self._hass.async_create_task(
-                self._notification_coordinator.async_notify(val)
+            # Every notify profile sees the weighing; only the first one to
+            # queue it sends the notification.
+            measurement = self._notification_coordinator.add_measurement(
+                self._config[CONF_SENSOR_WEIGHT], val, state.last_reported
             )
+            if measurement is not None:
+                self._hass.async_create_task(
+                    self._notification_coordinator.async_notify(
+                        val, measurement.measurement_id
+                    )
+                )
             return False, None
 
         if not self._profile_filter.accepts(self._hass, self._config, val):
+            self._stats.reject(self._profile_filter)
             _LOGGER.debug(
                 "[%s] Profile filter rejected measurement: %.2f kg", self._name, val
             )
@@ -787,29 +1379,13 @@ class BodyScaleMetricsHandler:
         return True, None
 
     def _process_impedance(
-        self, state: State, metric: Metric
+        self, state: State, metric: Metric, reading: SensorReading | None = None
     ) -> tuple[bool, str | None]:
-        raw = state.state
-
-        if raw == STATE_UNAVAILABLE:
-            _LOGGER.debug(
-                "Impedance sensor unavailable — ignoring (scale disconnected)"
-            )
-            return False, None
-
-        try:
-            val = float(raw)
-        except ValueError:
-            return False, "invalid_format"
-
-        if val < CONSTRAINT_IMPEDANCE_MIN:
-            if val == 0.0:
-                _LOGGER.debug("Impedance 0.0 — scale reset, ignoring silently")
-                return False, None
-            _LOGGER.debug("Impedance %.2f below minimum — ignoring", val)
-            return False, "low"
-        if val > CONSTRAINT_IMPEDANCE_MAX:
-            return False, "high"
+        if reading is None:
+            reading = parse_impedance(state)
+        if reading.value is None:
+            return False, reading.problem
+        val = reading.value
 
         # ── Profile filter for impedance ──────────────────────────────────────
         if isinstance(self._profile_filter, NotificationFilter):
@@ -818,6 +1394,10 @@ class BodyScaleMetricsHandler:
                     "Notification filter: impedance %.2f stored as pending", val
                 )
                 self._pending_impedance[metric] = (val, state)
+                if self._notification_coordinator is not None:
+                    self._notification_coordinator.add_impedance(
+                        self._config[CONF_SENSOR_WEIGHT], metric, val
+                    )
                 return False, None
         else:
             # Use the weight accepted in the current measurement cycle.
@@ -832,6 +1412,7 @@ class BodyScaleMetricsHandler:
             if not self._profile_filter.accepts(
                 self._hass, self._config, self._last_accepted_weight
             ):
+                self._stats.reject(self._profile_filter)
                 _LOGGER.debug("Profile filter rejected impedance: %.2f", val)
                 return False, None
 
@@ -897,106 +1478,113 @@ class BodyScaleMetricsHandler:
 
     def _has_impedance(self) -> bool:
         """Return True if a valid impedance reading is available for the current mode."""
-        mode = self._config.get(CONF_IMPEDANCE_MODE, "none")
-        if mode == IMPEDANCE_MODE_STANDARD:
-            return Metric.IMPEDANCE in self._available_metrics
-        if mode == IMPEDANCE_MODE_DUAL:
-            # Both frequencies must be available
-            return (
-                Metric.IMPEDANCE_LOW in self._available_metrics
-                and Metric.IMPEDANCE_HIGH in self._available_metrics
-            )
-        return False
+        return _has_impedance(
+            self._config.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE),
+            self._available_metrics,
+        )
 
     def _can_compute(self, metric: Metric) -> bool:
         """Return True if all dependencies for this metric are satisfied."""
-        info = self._dependencies.get(metric)
-        if info is None:
-            return False
-        if metric in (Metric.LBM, Metric.METABOLIC_AGE):
-            if not self._has_impedance():
-                return False
-            if Metric.WEIGHT not in self._available_metrics:
-                return False
-            other_deps = [d for d in info.depends_on if d is not Metric.IMPEDANCE]
-            return all(d in self._available_metrics for d in other_deps)
-        return all(d in self._available_metrics for d in info.depends_on)
-
-    def _compute_metric(self, metric: Metric) -> None:
+        return _can_compute(
+            metric,
+            self._config.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE),
+            self._available_metrics,
+        )
+
+    def _run_pass(self, metrics: tuple[Metric, ...]) -> None:
+        """Compute metrics in order against one snapshot of the store.
+
+        The snapshot is taken once when the pass starts and each computed
+        value is appended to it, so every calculator of the pass sees the
+        same inputs even if a derived value expires meanwhile.
+        """
+        self._available_metrics.setdefault(
+            Metric.AGE, get_age(self._config[CONF_BIRTHDAY])
+        )
+        start = time.perf_counter()
+        with self._available_metrics.pass_clock():
+            snapshot = self._available_metrics.snapshot()
+            view = MappingProxyType(snapshot)
+            for metric in metrics:
+                self._compute_metric(metric, snapshot, view)
+        duration = time.perf_counter() - start
+        self._stats.passes += 1
+        self._stats.pass_durations.append(duration)
+        clock = self._cycle_clock
+        if clock is not None and clock.completed is None:
+            if clock.first_pass is None:
+                clock.first_pass = start
+            clock.compute += duration
+
+    def _compute_metric(
+        self,
+        metric: Metric,
+        snapshot: dict[Metric, StateType | datetime],
+        view: Mapping[Metric, StateType | datetime],
+    ) -> None:
         """Compute a single metric value if dependencies are met and store it."""
-        if not self._can_compute(metric):
+        if metric not in self._dirty and metric in snapshot:
+            self._stats.skipped_fresh += 1
+            return
+        if not _can_compute(
+            metric,
+            self._config.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE),
+            snapshot,
+        ):
+            self._stats.skipped_unmet += 1
             return
         info = self._dependencies[metric]
-        val = info.calculate(self._config, self._available_metrics)
+        val = info.calculate(self._config, view)
+        self._stats.computed += 1
         if val is not None:
             _LOGGER.debug("[%s][recalc] %s = %s", self._name, metric.name, val)
+            self._dirty.discard(metric)
             self._update_available_metric(metric, val)
-
-    def _topological_order(self) -> list[Metric]:
-        """Return derived metrics in topological order (dependencies before dependents)."""
-        derived = [m for m in _METRIC_DEPS if m not in _SOURCE_METRICS]
-
-        # Kahn's algorithm
-        graph_deps: dict[Metric, list[Metric]] = {}
-        for metric in derived:
-            info = self._dependencies.get(metric)
-            graph_deps[metric] = [
-                d
-                for d in (info.depends_on if info else [])
-                if d in _METRIC_DEPS and d not in _SOURCE_METRICS
-            ]
-
-        in_degree: dict[Metric, int] = {m: len(graph_deps[m]) for m in derived}
-        queue = [m for m, deg in in_degree.items() if deg == 0]
-        ordered: list[Metric] = []
-
-        while queue:
-            metric = queue.pop(0)
-            ordered.append(metric)
-            info = self._dependencies.get(metric)
-            if info:
-                for dependent in info.depended_by:
-                    if dependent in in_degree:
-                        in_degree[dependent] -= 1
-                        if in_degree[dependent] == 0:
-                            queue.append(dependent)
-
-        return ordered
-
-    # Metrics that depend only on weight (no impedance required)
-    _WEIGHT_ONLY_METRICS: frozenset[Metric] = frozenset(
-        {
-            Metric.BMI,
-            Metric.BMR,
-            Metric.VISCERAL_FAT,
-        }
-    )
+            snapshot[metric] = val
 
     def _process_stabilized(self, state: State) -> None:
-        """Force immediate full recalculation when stabilized sensor turns ON.
+        """Run an immediate recalculation when stabilized sensor turns ON.
 
         When configured, the stabilized sensor takes priority over the normal
         debounce/timing logic — as soon as the scale signals a stable reading,
         we recalculate with the latest accepted weight and impedance values.
+        Metrics that are still fresh and whose inputs did not change are
+        skipped by the passes.
+
+        While a cycle waits for its impedance, the signal only means the
+        weight is final: scales such as Xiaomi's send it before the
+        impedance, and the cycle is computed once that impedance arrives
+        (or the settle window ends).
         """
         if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
             return
         if state.state == "on":
+            self._mark_inputs()
+            if self._settle_cancel is not None:
+                _LOGGER.debug(
+                    "[%s][stabilized] ON — weight final, waiting for impedance",
+                    self._name,
+                )
+                return
             _LOGGER.debug(
                 "[%s][stabilized] ON — forcing immediate full recalculation", self._name
             )
             impedance_mode = self._config.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE)
+            # Only a weight accepted for this profile in the current cycle
+            # makes this a measurement of the profile. A profile whose weight
+            # was rejected must neither stamp a measurement time nor
+            # recalculate impedance-derived metrics from stale or another
+            # user's data.
+            accepted = self._last_accepted_weight is not None and (
+                self._profile_filter.accepts(
+                    self._hass, self._config, self._last_accepted_weight
+                )
+            )
+            if accepted:
+                self._stamp_measurement_time()
             self._trigger_weight_only_metrics()
             if impedance_mode != IMPEDANCE_MODE_NONE:
-                # Only trigger impedance metrics if a weight was accepted for
-                # this profile in the current measurement cycle. This prevents
-                # a profile whose weight was rejected from recalculating
-                # impedance-derived metrics using stale or another user's data.
-                if self._last_accepted_weight is not None and (
-                    self._profile_filter.accepts(
-                        self._hass, self._config, self._last_accepted_weight
-                    )
-                ):
+                if accepted:
                     self._trigger_impedance_metrics()
                 else:
                     _LOGGER.debug(
@@ -1005,47 +1593,155 @@ class BodyScaleMetricsHandler:
                         self._name,
                     )
 
+    def _open_measurement_cycle(self) -> None:
+        """Start waiting for the impedance reading(s) of an accepted weight."""
+        if self._settle_cancel is None:
+            self._settle_cancel = async_call_later(
+                self._hass, self._settle_window, self._settle_measurement_cycle
+            )
+
+    def _cancel_settle_timer(self) -> bool:
+        """Stop waiting for impedance; return True if a cycle was open."""
+        if self._settle_cancel is None:
+            return False
+        self._settle_cancel()
+        self._settle_cancel = None
+        return True
+
+    def _finish_measurement_cycle(self) -> None:
+        """Run the single recalculation of a cycle once its impedance arrived.
+
+        An impedance arriving after the settle window ended corrects the
+        impedance metrics of the cycle already completed; it does not
+        complete another one.
+        """
+        if not self._cancel_settle_timer():
+            _LOGGER.debug("[%s][recalc] Late impedance — correction pass", self._name)
+            self._trigger_impedance_metrics()
+            return
+        self._stamp_measurement_time()
+        self._trigger_weight_only_metrics()
+        self._trigger_impedance_metrics()
+        self._complete_cycle()
+
+    @callback
+    def _settle_measurement_cycle(self, _now: datetime) -> None:
+        """Settle window elapsed without impedance — use the weight only."""
+        self._settle_cancel = None
+        self._mark_inputs()
+        _LOGGER.debug(
+            "[%s][recalc] No impedance within %.0fs — weight-only cycle",
+            self._name,
+            self._settle_window,
+        )
+        with self._batched_dispatch():
+            self._stamp_measurement_time()
+            self._trigger_weight_only_metrics()
+            self._complete_cycle()
+
+    def _stamp_measurement_time(self) -> None:
+        """Stamp the time of a measurement accepted for this profile."""
+        # The startup replay re-reads a measurement that was already stamped.
+        if self._bootstrapping:
+            return
+        self._update_available_metric(Metric.LAST_MEASUREMENT_TIME, dt_util.utcnow())
+
     def _trigger_weight_only_metrics(self) -> None:
-        """Compute weight-only metrics and stamp measurement time."""
+        """Compute weight-only metrics."""
         _LOGGER.debug("[%s][recalc] Weight-only pass", self._name)
-        self._update_available_metric(Metric.LAST_MEASUREMENT_TIME, dt_util.utcnow())
-        for metric in self._topological_order():
-            if metric in self._WEIGHT_ONLY_METRICS:
-                self._compute_metric(metric)
+        self._run_pass(self._plan.weight_only)
 
     def _trigger_impedance_metrics(self) -> None:
         """Compute metrics that require impedance — skip weight-only metrics already computed."""
         _LOGGER.debug("[%s][recalc] Impedance pass", self._name)
-        for metric in self._topological_order():
-            if metric not in self._WEIGHT_ONLY_METRICS:
-                self._compute_metric(metric)
+        self._run_pass(self._plan.impedance)
 
     def _trigger_dependent_recalculation(self) -> None:
         """Recalculate all derived metrics in topological order — one pass, no cascades."""
         _LOGGER.debug("[recalc] Starting topological recalculation pass")
-        for metric in self._topological_order():
-            self._compute_metric(metric)
+        self._run_pass(self._plan.full)
         _LOGGER.debug("[recalc] Topological pass complete")
 
+    def _complete_cycle(self) -> None:
+        """Hand the finished measurement cycle to the cycle subscribers."""
+        # The startup replay re-reads values of a cycle that already completed.
+        if self._bootstrapping:
+            return
+        if self._cycle_clock is not None and self._cycle_clock.completed is None:
+            self._cycle_clock.completed = time.perf_counter()
+        if not self._cycle_subscribers:
+            return
+        snapshot = dict(self._available_metrics)
+        if self._dispatch_depth:
+            self._completed_cycle = snapshot
+        else:
+            self._notify_cycle(snapshot)
+
+    def _notify_cycle(self, snapshot: dict[Metric, StateType | datetime]) -> None:
+        """Send a completed cycle to the cycle subscribers."""
+        for sub in list(self._cycle_subscribers):
+            sub(snapshot)
+            self._stats.subscriber_calls += 1
+
+    @contextmanager
+    def _batched_dispatch(self) -> Iterator[None]:
+        """Hold subscriber notifications until the outermost pass ends."""
+        self._dispatch_depth += 1
+        try:
+            yield
+        finally:
+            self._dispatch_depth -= 1
+            if not self._dispatch_depth:
+                self._dispatch_changes()
+                snapshot, self._completed_cycle = self._completed_cycle, None
+                if snapshot is not None:
+                    self._notify_cycle(snapshot)
+
+    def _dispatch_changes(self) -> None:
+        """Send the values published since the last dispatch to subscribers."""
+        if not self._pending_changes:
+            return
+        changes = MappingProxyType(self._pending_changes)
+        self._pending_changes = {}
+        for metric, value in changes.items():
+            for sub in list(self._subscribers.get(metric, ())):
+                sub(value)
+                self._stats.subscriber_calls += 1
+        for batch_sub in list(self._batch_subscribers):
+            batch_sub(changes)
+            self._stats.subscriber_calls += 1
+
     def _update_available_metric(
         self, metric: Metric, state: StateType | datetime
     ) -> None:
-        """Update a metric value, notify subscribers, cascade recalculations."""
+        """Update a metric value, notify subscribers, mark dependents dirty."""
 
         # Inject age on first call
         self._available_metrics.setdefault(
             Metric.AGE, get_age(self._config[CONF_BIRTHDAY])
         )
+        previous = self._available_metrics.get(metric)
         self._available_metrics[metric] = state
+        if metric is Metric.WEIGHT and previous != state:
+            router = self._weight_router()
+            if router is not None:
+                router.update(self._name, self.current_weight)
 
-        # Notify subscribers
         info = self._dependencies.get(metric)
         if info:
-            subscribers = self._subscribers.get(metric, [])
-            if subscribers:
-                sub_state = _modify_state_for_subscriber(info, state)
-                for sub in subscribers:
-                    sub(sub_state)
-
-            # Cascade recalculation is handled by _trigger_dependent_recalculation
-            # in topological order — no per-update cascades needed.
+            if previous != state:
+                self._dirty.update(info.depended_by)
+
+            # Notify subscribers — a value that rounds to the one already
+            # published is not sent again.
+            sub_state = _modify_state_for_subscriber(info, state)
+            if metric in self._published and self._published[metric] == sub_state:
+                self._suppressed_notifications += 1
+            else:
+                self._published[metric] = sub_state
+                self._pending_changes[metric] = sub_state
+                if not self._dispatch_depth:
+                    self._dispatch_changes()
+
+            # Recalculation itself is done by the passes, in topological
+            # order — no per-update cascades needed.
@@ -0,0 +1,126 @@
+"""Metrics module — batch computation over columns of past measurements.
+
+Used to recompute a whole history at once (e.g. after a formula change)
+instead of replaying measurements through the live handler one by one.
+
+Each row is evaluated with the very same calculators, in the same pass
+order (weight-only metrics, then impedance metrics) and with the same
+dependency gating as ``BodyScaleMetricsHandler``, so every value is
+bit-identical to what the live path produces for that measurement.
+
+The formulas are branchy scalar code (mode switches, clamping, S400
+fallbacks, score tables); rewriting them as array expressions would
+duplicate every formula and could not guarantee identical floats, so the
+speed-up comes from skipping the handler machinery (listeners, TTL store,
+subscribers, filters) and reusing one prepared config for all rows.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.helpers.typing import StateType
+
+from ..const import CONF_BIRTHDAY, CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE
+from ..models import Metric
+from ..util import get_age
+from . import (
+    _EVALUATION_PLANS,
+    _METRIC_DEPS,
+    _SOURCE_METRICS,
+    _can_compute,
+    _prepare_config,
+)
+
+# Every metric the batch returns a column for.
+BATCH_METRICS: tuple[Metric, ...] = tuple(
+    m for m in _METRIC_DEPS if m not in _SOURCE_METRICS
+)
+
+
+@dataclass(frozen=True)
+class MeasurementColumns:
+    """Columnar measurements for one profile — one entry per measurement.
+
+    ``weight`` is mandatory. Impedance columns are only read when the
+    profile's impedance mode uses them; ``None`` entries mark a measurement
+    without that reading. When ``age`` is omitted it is derived from the
+    profile birthday, at each timestamp if ``timestamps`` are given.
+    """
+
+    weight: Sequence[float | None]
+    impedance: Sequence[float | None] | None = None
+    impedance_low: Sequence[float | None] | None = None
+    impedance_high: Sequence[float | None] | None = None
+    age: Sequence[int] | None = None
+    timestamps: Sequence[datetime] | None = None
+
+    def __post_init__(self) -> None:
+        """Reject columns whose length does not match the weight column."""
+        rows = len(self.weight)
+        for name in (
+            "impedance",
+            "impedance_low",
+            "impedance_high",
+            "age",
+            "timestamps",
+        ):
+            column = getattr(self, name)
+            if column is not None and len(column) != rows:
+                raise ValueError(
+                    f"Column '{name}' has {len(column)} rows, expected {rows}"
+                )
+
+
+def compute_batch(
+    config: Mapping[str, Any], columns: MeasurementColumns
+) -> dict[Metric, list[StateType | None]]:
+    """Compute every derived metric for each measurement row.
+
+    Returns one list per metric of :data:`BATCH_METRICS`, aligned with the
+    input rows. A metric that cannot be computed for a row (missing weight
+    or impedance, or not available in this impedance mode) is ``None``.
+    """
+    prepared = _prepare_config(config)
+    impedance_mode = prepared.get(CONF_IMPEDANCE_MODE, IMPEDANCE_MODE_NONE)
+    plan = _EVALUATION_PLANS.get(impedance_mode, _EVALUATION_PLANS[IMPEDANCE_MODE_NONE])
+    order = plan.full
+
+    impedance_columns: tuple[tuple[Metric, Sequence[float | None] | None], ...] = (
+        (Metric.IMPEDANCE, columns.impedance),
+        (Metric.IMPEDANCE_LOW, columns.impedance_low),
+        (Metric.IMPEDANCE_HIGH, columns.impedance_high),
+    )
+    current_age = get_age(prepared[CONF_BIRTHDAY])
+
+    results: dict[Metric, list[StateType | None]] = {m: [] for m in BATCH_METRICS}
+    for row, weight in enumerate(columns.weight):
+        metrics: dict[Metric, StateType | datetime] = {}
+        if columns.age is not None:
+            metrics[Metric.AGE] = columns.age[row]
+        elif columns.timestamps is not None:
+            metrics[Metric.AGE] = get_age(
+                prepared[CONF_BIRTHDAY], columns.timestamps[row]
+            )
+        else:
+            metrics[Metric.AGE] = current_age
+
+        computed: dict[Metric, StateType] = {}
+        if weight is not None:
+            metrics[Metric.WEIGHT] = weight
+            for metric, column in impedance_columns:
+                if column is not None and column[row] is not None:
+                    metrics[metric] = column[row]
+
+            for metric in order:
+                if not _can_compute(metric, impedance_mode, metrics):
+                    continue
+                val = _METRIC_DEPS[metric].calculate(prepared, metrics)
+                if val is not None:
+                    metrics[metric] = computed[metric] = val
+
+        for metric, values in results.items():
+            values.append(computed.get(metric))
+
+    return results
@@ -0,0 +1,251 @@
+"""Metrics module — shared listeners for the scale's source sensors.
+
+Several profiles usually read the same physical scale. Instead of every
+handler tracking the weight/impedance entities on its own, one
+``SensorDispatcher`` (kept in ``hass.data[DOMAIN]``) listens once per
+entity, parses the raw state once per event and hands the same
+``SensorReading`` to every subscribed handler.
+
+Every handler still receives each reading: a profile that rejects a
+measurement must drop its stale impedance and last accepted weight, so
+routing only to the accepting profile would change the filters' results.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNAVAILABLE
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    EventStateReportedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_state_report_event,
+)
+
+from ..const import (
+    CONSTRAINT_IMPEDANCE_MAX,
+    CONSTRAINT_IMPEDANCE_MIN,
+    CONSTRAINT_WEIGHT_MAX,
+    CONSTRAINT_WEIGHT_MIN,
+    UNIT_POUNDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SensorReading:
+    """A source sensor state, parsed and validated once for every profile.
+
+    ``value`` is the normalized reading (kg for weights) or None when the
+    state is not usable; ``problem`` is the sensor problem to report, and
+    ``reset`` marks a weight below the minimum (scale back to zero).
+    """
+
+    value: float | None = None
+    problem: str | None = None
+    reset: bool = False
+
+
+def parse_weight(state: State) -> SensorReading:
+    """Parse a weight sensor state."""
+    raw = state.state
+
+    if raw == STATE_UNAVAILABLE:
+        _LOGGER.debug("[%s] Weight sensor unavailable — ignoring", state.entity_id)
+        return SensorReading()
+
+    try:
+        val = float(raw)
+    except ValueError:
+        return SensorReading(problem="invalid_format")
+
+    if val < CONSTRAINT_WEIGHT_MIN:
+        if val == 0.0:
+            _LOGGER.debug(
+                "[%s] Weight 0.0 kg — scale reset, ignoring silently", state.entity_id
+            )
+            return SensorReading(reset=True)
+        _LOGGER.debug("Weight %.2f kg below minimum — ignoring (scale reset)", val)
+        return SensorReading(problem="low", reset=True)
+    if val > CONSTRAINT_WEIGHT_MAX:
+        return SensorReading(problem="high")
+
+    if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == UNIT_POUNDS:
+        val *= 0.45359237
+
+    return SensorReading(value=val)
+
+
+def parse_impedance(state: State) -> SensorReading:
+    """Parse an impedance sensor state."""
+    raw = state.state
+
+    if raw == STATE_UNAVAILABLE:
+        _LOGGER.debug("Impedance sensor unavailable — ignoring (scale disconnected)")
+        return SensorReading()
+
+    try:
+        val = float(raw)
+    except ValueError:
+        return SensorReading(problem="invalid_format")
+
+    if val < CONSTRAINT_IMPEDANCE_MIN:
+        if val == 0.0:
+            _LOGGER.debug("Impedance 0.0 — scale reset, ignoring silently")
+            return SensorReading()
+        _LOGGER.debug("Impedance %.2f below minimum — ignoring", val)
+        return SensorReading(problem="low")
+    if val > CONSTRAINT_IMPEDANCE_MAX:
+        return SensorReading(problem="high")
+
+    return SensorReading(value=val)
+
+
+SensorCallback = Callable[[str, State, SensorReading | None], None]
+SensorParser = Callable[[State], SensorReading]
+
+
+@dataclass(frozen=True, slots=True)
+class _Subscription:
+    callback: SensorCallback
+    parser: SensorParser | None
+    # Measurement sensors also get state_reported (same value written
+    # again) and are deduplicated on last_reported.
+    reported: bool
+
+
+class SensorDispatcher:
+    """Track each source sensor once and fan its readings out to handlers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._subscriptions: dict[str, list[_Subscription]] = {}
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+        self._last_reported_ts: dict[str, float] = {}
+
+    @property
+    def tracked_entities(self) -> frozenset[str]:
+        """Return the entity ids currently listened to."""
+        return frozenset(self._listeners)
+
+    @callback
+    def subscribe(
+        self,
+        entity_id: str,
+        callback_func: SensorCallback,
+        parser: SensorParser | None = None,
+        *,
+        reported: bool = True,
+    ) -> CALLBACK_TYPE:
+        """Route the states of an entity to a handler callback.
+
+        ``parser`` turns the state into the ``SensorReading`` passed to the
+        callback; it runs once per event for all subscribers sharing it.
+        """
+        subscription = _Subscription(callback_func, parser, reported)
+        self._subscriptions.setdefault(entity_id, []).append(subscription)
+        if entity_id not in self._listeners:
+            self._listeners[entity_id] = self._track(entity_id)
+
+        @callback
+        def _remove_subscription() -> None:
+            """Remove the subscription and stop tracking an unused entity."""
+            subscriptions = self._subscriptions.get(entity_id, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(entity_id, None)
+                self._last_reported_ts.pop(entity_id, None)
+                remove = self._listeners.pop(entity_id, None)
+                if remove is not None:
+                    remove()
+
+        return _remove_subscription
+
+    def _track(self, entity_id: str) -> CALLBACK_TYPE:
+        """Listen to state_changed and state_reported of one entity."""
+
+        @callback
+        def _on_state_change(event: Event[EventStateChangedData]) -> None:
+            """Handle state_changed — fires when value actually changes."""
+            new_state = event.data.get("new_state")
+            _LOGGER.debug("[state_changed] received: %s", entity_id)
+            if new_state is None:
+                return
+            ts = new_state.last_reported.timestamp()
+            duplicate = self._last_reported_ts.get(entity_id) == ts
+            self._last_reported_ts[entity_id] = ts
+            self._dispatch(entity_id, new_state, skip_reported=duplicate)
+
+        @callback
+        def _on_state_report(event: Event[EventStateReportedData]) -> None:
+            """Handle state_reported — fires on every write, even if value unchanged."""
+            _LOGGER.debug("[state_reported] received: %s", entity_id)
+            new_state = self._hass.states.get(entity_id)
+            if new_state is None:
+                return
+            self._last_reported_ts[entity_id] = new_state.last_reported.timestamp()
+            self._dispatch(entity_id, new_state, reported_only=True)
+
+        removers = (
+            async_track_state_change_event(self._hass, [entity_id], _on_state_change),
+            async_track_state_report_event(self._hass, [entity_id], _on_state_report),
+        )
+
+        def _remove_all() -> None:
+            for remove in removers:
+                remove()
+
+        return _remove_all
+
+    def _dispatch(
+        self,
+        entity_id: str,
+        state: State,
+        *,
+        skip_reported: bool = False,
+        reported_only: bool = False,
+    ) -> None:
+        """Parse the state once per parser and call every subscriber.
+
+        A subscriber that raises is logged and skipped: the other profiles
+        of the scale still get the reading.
+        """
+        readings: dict[SensorParser, SensorReading] = {}
+        for subscription in list(self._subscriptions.get(entity_id, ())):
+            if subscription.reported:
+                if skip_reported:
+                    continue
+            elif reported_only:
+                continue
+            try:
+                reading: SensorReading | None = None
+                if subscription.parser is not None:
+                    reading = readings.get(subscription.parser)
+                    if reading is None:
+                        reading = readings[subscription.parser] = subscription.parser(
+                            state
+                        )
+                subscription.callback(entity_id, state, reading)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _LOGGER.exception(
+                    "SensorDispatcher: subscriber of %s failed", entity_id
+                )
+
+    @callback
+    def unload(self) -> None:
+        """Stop every listener."""
+        for remove in self._listeners.values():
+            remove()
+        self._listeners.clear()
+        self._subscriptions.clear()
+        self._last_reported_ts.clear()
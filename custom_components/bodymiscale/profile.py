@@ -17,18 +17,43 @@ confirmation to the matching NotificationFilter.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import secrets
+import time
 import unicodedata
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate
+from math import inf
+from types import MappingProxyType
 from typing import Any, cast
 
-from homeassistant.const import CONF_NAME
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import (
+    CONF_NAME,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_NEAREST_TOLERANCE,
@@ -40,14 +65,26 @@ from .const import (
     CONF_WEIGHT_MAX,
     CONF_WEIGHT_MIN,
     DOMAIN,
+    EVENT_MOBILE_APP_NOTIFICATION_ACTION,
     HANDLERS,
+    NOTIFICATION_ACTION_PREFIX,
     NOTIFICATION_TAG,
+    NOTIFY_TIMEOUT,
+    PENDING_MEASUREMENT_TIMEOUT,
+    PENDING_QUEUE_SIZE,
+    PENDING_SAVE_DELAY,
+    PENDING_STORAGE_KEY,
+    PENDING_STORAGE_VERSION,
+    PROFILE_ID_ROUTER,
     PROFILE_METHOD_ID,
     PROFILE_METHOD_NEAREST,
     PROFILE_METHOD_NONE,
     PROFILE_METHOD_NOTIFY,
     PROFILE_METHOD_WEIGHT,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
 )
+from .models import Metric
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +128,105 @@ class NoFilterProfile(ProfileFilter):
 # ---------------------------------------------------------------------------
 
 
+def parse_profile_id(state: State | None) -> int | None:
+    """Return the numeric profile ID of a sensor state, None if not numeric."""
+    if state is None:
+        return None
+    try:
+        return int(float(state.state))
+    except ValueError, TypeError:
+        return None
+
+
+class ProfileIdRouter:
+    """Dispatch table from the scale's current profile ID to its profiles.
+
+    One instance lives in ``hass.data[DOMAIN]``; handlers register their
+    profile ID sensor and expected ID when they are set up. Each sensor is
+    tracked once and its parsed ID cached on every state change, so a
+    measurement is routed with one dict lookup instead of every handler
+    reading and parsing the same entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # name (casefolded) → (sensor entity id, expected ID)
+        self._profiles: dict[str, tuple[str, int]] = {}
+        # sensor entity id → expected ID → names (casefolded)
+        self._table: dict[str, dict[int, set[str]]] = {}
+        self._current: dict[str, int | None] = {}
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+
+    @property
+    def tracked_entities(self) -> frozenset[str]:
+        """Return the profile ID sensors currently listened to."""
+        return frozenset(self._listeners)
+
+    def is_registered(self, name: str) -> bool:
+        """Return True if the profile is routed by this table."""
+        return name.casefold() in self._profiles
+
+    @callback
+    def register(self, name: str, sensor_entity_id: str, profile_id: int) -> None:
+        """Route ``profile_id`` read on ``sensor_entity_id`` to a profile."""
+        self.unregister(name)
+        key = name.casefold()
+        self._profiles[key] = (sensor_entity_id, profile_id)
+        self._table.setdefault(sensor_entity_id, {}).setdefault(profile_id, set()).add(
+            key
+        )
+        if sensor_entity_id not in self._listeners:
+            self._current[sensor_entity_id] = parse_profile_id(
+                self._hass.states.get(sensor_entity_id)
+            )
+            self._listeners[sensor_entity_id] = async_track_state_change_event(
+                self._hass, [sensor_entity_id], self._on_profile_id_change
+            )
+
+    @callback
+    def unregister(self, name: str) -> None:
+        """Drop a profile, and stop tracking a sensor no profile uses."""
+        previous = self._profiles.pop(name.casefold(), None)
+        if previous is None:
+            return
+        sensor_entity_id, profile_id = previous
+        table = self._table[sensor_entity_id]
+        table[profile_id].discard(name.casefold())
+        if not table[profile_id]:
+            del table[profile_id]
+        if not table:
+            del self._table[sensor_entity_id]
+            self._current.pop(sensor_entity_id, None)
+            self._listeners.pop(sensor_entity_id)()
+
+    @callback
+    def _on_profile_id_change(self, event: Event[EventStateChangedData]) -> None:
+        """Cache the parsed ID whenever the sensor changes."""
+        entity_id = event.data["entity_id"]
+        self._current[entity_id] = parse_profile_id(event.data.get("new_state"))
+
+    def current_id(self, sensor_entity_id: str) -> int | None:
+        """Return the cached profile ID of a tracked sensor."""
+        return self._current.get(sensor_entity_id)
+
+    def owners(self, sensor_entity_id: str) -> frozenset[str]:
+        """Return the profiles (casefolded) owning the sensor's current ID."""
+        current_id = self._current.get(sensor_entity_id)
+        if current_id is None:
+            return frozenset()
+        return frozenset(self._table.get(sensor_entity_id, {}).get(current_id, ()))
+
+    @callback
+    def unload(self) -> None:
+        """Stop every listener and clear the table."""
+        for remove in self._listeners.values():
+            remove()
+        self._listeners.clear()
+        self._profiles.clear()
+        self._table.clear()
+        self._current.clear()
+
+
 class ProfileIdFilter(ProfileFilter):
     """Filter measurements by profile ID from the scale sensor."""
 
@@ -109,6 +245,21 @@ class ProfileIdFilter(ProfileFilter):
             )
             return False
 
+        name = config.get(CONF_NAME)
+        router: ProfileIdRouter | None = hass.data.get(DOMAIN, {}).get(
+            PROFILE_ID_ROUTER
+        )
+        if router is not None and name is not None and router.is_registered(str(name)):
+            if str(name).casefold() not in router.owners(sensor_entity_id):
+                _LOGGER.debug(
+                    "Profile-ID filter: %s=%s routed away from %s — rejected",
+                    sensor_entity_id,
+                    router.current_id(sensor_entity_id),
+                    name,
+                )
+                return False
+            return True
+
         state = hass.states.get(sensor_entity_id)
         if state is None:
             _LOGGER.debug(
@@ -140,8 +291,117 @@ class ProfileIdFilter(ProfileFilter):
 # ---------------------------------------------------------------------------
 
 
+class WeightRangeIndex:
+    """Sorted index of the weight ranges of every weight-range profile.
+
+    One instance lives in ``hass.data[DOMAIN]``; handlers add their range
+    under their config entry id when they are set up and remove it on
+    unload, so entry reloads update it incrementally. Keys are opaque:
+    profiles whose names differ only in case keep their own range. Ranges
+    are sorted by start, next to the running
+    maximum of their ends: a bisect finds the last range starting before a
+    bound and the running maximum tells when no earlier range can reach
+    it, so lookups stay exact when legacy entries overlap. The config flow
+    keeps new ranges non-overlapping; should legacy entries still overlap,
+    the range starting last wins.
+    """
+
+    def __init__(self) -> None:
+        self._ranges: dict[str, tuple[float, float]] = {}
+        self._index: list[tuple[float, float, str]] = []
+        self._max_ends: list[float] = []
+
+    @classmethod
+    def from_configs(
+        cls,
+        configs: Mapping[str, Mapping[str, Any]] | Iterable[Mapping[str, Any]],
+    ) -> WeightRangeIndex:
+        """Build an index from the weight-range profiles among ``configs``.
+
+        ``configs`` maps config entry ids to configs; a plain iterable of
+        configs (data of a flow not yet saved) is keyed by position.
+        """
+        items = (
+            configs.items()
+            if isinstance(configs, Mapping)
+            else ((f"#{position}", config) for position, config in enumerate(configs))
+        )
+        index = cls()
+        for key, config in items:
+            if config.get(CONF_PROFILE_METHOD) != PROFILE_METHOD_WEIGHT:
+                continue
+            w_min = config.get(CONF_WEIGHT_MIN)
+            w_max = config.get(CONF_WEIGHT_MAX)
+            if w_min is not None and w_max is not None:
+                index.update(key, float(w_min), float(w_max))
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed ranges."""
+        return len(self._index)
+
+    def range_of(self, key: str) -> tuple[float, float] | None:
+        """Return the indexed range of a profile."""
+        return self._ranges.get(key)
+
+    @callback
+    def update(self, key: str, w_min: float, w_max: float) -> None:
+        """Index the ``[w_min, w_max[`` range of a profile."""
+        self.remove(key)
+        self._ranges[key] = (w_min, w_max)
+        insort(self._index, (w_min, w_max, key))
+        self._rebuild_max_ends()
+
+    @callback
+    def remove(self, key: str) -> None:
+        """Drop a profile from the index."""
+        previous = self._ranges.pop(key, None)
+        if previous is not None:
+            del self._index[bisect_left(self._index, (*previous, key))]
+            self._rebuild_max_ends()
+
+    def _rebuild_max_ends(self) -> None:
+        self._max_ends = list(accumulate((end for _, end, _ in self._index), max))
+
+    def _last_ending_after(self, position: int, bound: float) -> str | None:
+        """Return the last range up to ``position`` that ends after ``bound``."""
+        while position >= 0 and self._max_ends[position] > bound:
+            _start, end, key = self._index[position]
+            if end > bound:
+                return key
+            position -= 1
+        return None
+
+    def owner(self, weight: float) -> str | None:
+        """Return the key of the profile whose range contains ``weight``."""
+        position = bisect_right(self._index, (weight, inf, "")) - 1
+        return self._last_ending_after(position, weight)
+
+    def overlapping(self, w_min: float, w_max: float) -> str | None:
+        """Return the key of a profile whose range overlaps ``[w_min, w_max[``.
+
+        A range overlaps when it starts before ``w_max`` and ends after
+        ``w_min``.
+        """
+        position = bisect_left(self._index, (w_max, -inf, "")) - 1
+        return self._last_ending_after(position, w_min)
+
+
+def _weight_ranges(hass: HomeAssistant) -> WeightRangeIndex | None:
+    """Return the domain weight-range index, if the integration is set up."""
+    return hass.data.get(DOMAIN, {}).get(WEIGHT_RANGES)
+
+
 class WeightRangeFilter(ProfileFilter):
-    """Filter measurements by weight range."""
+    """Filter measurements by weight range.
+
+    ``index_key`` is the key of the profile's range in the domain
+    ``WeightRangeIndex`` (its config entry id), set by the handler that
+    indexed it.
+    """
+
+    def __init__(self) -> None:
+        self.index_key: str | None = None
 
     def accepts(
         self, hass: HomeAssistant, config: dict[str, Any], weight: float
@@ -166,6 +426,21 @@ class WeightRangeFilter(ProfileFilter):
                 w_max,
             )
             return False
+
+        # With the integration set up, the domain index is the single
+        # routing decision shared by every weight-range profile.
+        key = self.index_key
+        index = _weight_ranges(hass)
+        if index is not None and key is not None and index.range_of(key) is not None:
+            owner = index.owner(float(weight))
+            if owner != key:
+                _LOGGER.debug(
+                    "Weight-range filter: %.2f kg routed to %s — rejected for %s",
+                    weight,
+                    owner,
+                    config.get(CONF_NAME),
+                )
+                return False
         return True
 
 
@@ -174,6 +449,107 @@ class WeightRangeFilter(ProfileFilter):
 # ---------------------------------------------------------------------------
 
 
+class NearestWeightRouter:
+    """Sorted index of the current weight of every profile.
+
+    One instance lives in ``hass.data[DOMAIN]``; handlers push their weight
+    whenever it changes. A measurement is resolved to its winning profile
+    with a bisect lookup, and the decision is cached until the index
+    changes, so every handler receiving the same weight reuses it.
+    """
+
+    def __init__(self) -> None:
+        self._weights: dict[str, float] = {}
+        self._index: list[tuple[float, str]] = []
+        self._version: int = 0
+        self._decision: tuple[float, int, str, float] | None = None
+
+    @classmethod
+    def from_handlers(cls, handlers: Any) -> NearestWeightRouter:
+        """Build a router from the current weight of each handler."""
+        router = cls()
+        for handler in handlers:
+            name = handler.config.get(CONF_NAME)
+            if name is not None:
+                router.update(str(name), handler.current_weight)
+        return router
+
+    def weight_of(self, name: str) -> float | None:
+        """Return the indexed weight of a profile (name is case-insensitive)."""
+        return self._weights.get(name.casefold())
+
+    @callback
+    def update(self, name: str, weight: float | None) -> None:
+        """Index the current weight of a profile; None removes it."""
+        key = name.casefold()
+        previous = self._weights.get(key)
+        if previous == weight:
+            return
+        if previous is not None:
+            del self._index[bisect_left(self._index, (previous, key))]
+            del self._weights[key]
+        if weight is not None:
+            self._weights[key] = weight
+            insort(self._index, (weight, key))
+        self._version += 1
+
+    @callback
+    def remove(self, name: str) -> None:
+        """Drop a profile from the index."""
+        self.update(name, None)
+
+    def resolve(self, weight: float) -> tuple[str, float] | None:
+        """Return the winning profile (casefolded) and its distance.
+
+        Equal distances are broken alphabetically. Returns None when no
+        profile has a current weight.
+        """
+        decision = self._decision
+        if (
+            decision is not None
+            and decision[0] == weight
+            and decision[1] == self._version
+        ):
+            return decision[2], decision[3]
+        if not self._index:
+            return None
+
+        # Neighbours of the insertion point are the nearest weights; every
+        # profile at the best distance sits next to them.
+        position = bisect_left(self._index, (weight, ""))
+        below = position - 1
+        best_distance = min(
+            abs(self._index[i][0] - weight)
+            for i in (below, position)
+            if 0 <= i < len(self._index)
+        )
+        tied: list[str] = []
+        while below >= 0 and abs(self._index[below][0] - weight) == best_distance:
+            tied.append(self._index[below][1])
+            below -= 1
+        while (
+            position < len(self._index)
+            and abs(self._index[position][0] - weight) == best_distance
+        ):
+            tied.append(self._index[position][1])
+            position += 1
+
+        winner = min(tied)
+        self._decision = (weight, self._version, winner, best_distance)
+        return winner, best_distance
+
+
+def _weight_router(hass: HomeAssistant) -> NearestWeightRouter:
+    """Return the domain router, or a one-off index when none is running."""
+    domain_data = hass.data.get(DOMAIN, {})
+    router: NearestWeightRouter | None = domain_data.get(WEIGHT_ROUTER)
+    if router is None:
+        router = NearestWeightRouter.from_handlers(
+            domain_data.get(HANDLERS, {}).values()
+        )
+    return router
+
+
 class NearestWeightFilter(ProfileFilter):
     """Assign the measurement to the user whose current weight is closest."""
 
@@ -182,40 +558,21 @@ class NearestWeightFilter(ProfileFilter):
     ) -> bool:
         """Return True if this user's current weight is nearest to the measurement."""
         current_name = config.get(CONF_NAME)
-        current_name_cf = str(current_name).casefold() if current_name else ""
         if not current_name:
             _LOGGER.warning("Nearest-weight filter: missing user name — rejected")
             return False
 
-        domain_data = hass.data.get(DOMAIN, {})
-        handlers = domain_data.get(HANDLERS, {})
-
-        candidates: list[tuple[float, str]] = []
-        current_distance: float | None = None
-
-        for handler in handlers.values():
-            handler_config = handler.config
-
-            handler_name = handler_config.get(CONF_NAME)
-            current_weight = handler.current_weight
-            # Only consider handlers that have a known current weight
-            if handler_name is None or current_weight is None:
-                continue
-
-            distance = abs(float(current_weight) - float(weight))
-            candidates.append((distance, str(handler_name).casefold()))
-
-            if str(handler_name).casefold() == current_name_cf:
-                current_distance = distance
-
-        if current_distance is None or not candidates:
+        router = _weight_router(hass)
+        current_weight = router.weight_of(str(current_name))
+        decision = router.resolve(float(weight))
+        if current_weight is None or decision is None:
             _LOGGER.debug(
                 "Nearest-weight filter: no current weight available for %s — rejected",
                 current_name,
             )
             return False
 
-        best_distance = min(distance for distance, _name in candidates)
+        winner, best_distance = decision
         tolerance = float(config.get(CONF_NEAREST_TOLERANCE, 5))
         if best_distance > tolerance:
             _LOGGER.debug(
@@ -226,11 +583,7 @@ class NearestWeightFilter(ProfileFilter):
             )
             return False
 
-        tied_names = sorted(
-            name for distance, name in candidates if distance == best_distance
-        )
-
-        if current_distance != best_distance:
+        if abs(current_weight - float(weight)) != best_distance:
             _LOGGER.debug(
                 "Nearest-weight filter: %.2f kg not nearest for %s (best %.2f) — rejected",
                 weight,
@@ -239,10 +592,10 @@ class NearestWeightFilter(ProfileFilter):
             )
             return False
 
-        if current_name_cf != tied_names[0]:
+        if str(current_name).casefold() != winner:
             _LOGGER.debug(
                 "Nearest-weight filter: tie broken in favor of %s — rejected for %s",
-                tied_names[0],
+                winner,
                 current_name,
             )
             return False
@@ -290,6 +643,74 @@ class NotificationFilter(ProfileFilter):
 # ---------------------------------------------------------------------------
 
 
+def _load_notify_translations(language: str) -> dict[str, Any]:
+    """Load notify translations from the translation files (executor).
+
+    Falls back to English when the language has no file or no notify keys.
+    """
+    translations_dir = os.path.join(os.path.dirname(__file__), "translations")
+
+    for lang in (language, "en"):
+        path = os.path.join(translations_dir, f"{lang}.json")
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = cast(dict[str, Any], json.load(f))
+                notify: dict[str, Any] = data.get("common", {})
+                if notify:
+                    return dict(notify)
+            except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                _LOGGER.debug("Failed to load translations for lang=%s", lang)
+    return {}
+
+
+@dataclass(slots=True)
+class PendingMeasurement:
+    """A weighing waiting for the user to confirm who stepped on the scale.
+
+    ``measured`` is the ``last_reported`` time of the weight state, the
+    same for every handler receiving it, so it identifies the weighing.
+    """
+
+    measurement_id: str
+    sensor: str
+    weight: float
+    measured: datetime
+    impedance: dict[Metric, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON representation stored on disk."""
+        return {
+            "id": self.measurement_id,
+            "sensor": self.sensor,
+            "weight": self.weight,
+            "measured": self.measured.isoformat(),
+            "impedance": {
+                metric.value: value for metric, value in self.impedance.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> PendingMeasurement | None:
+        """Rebuild a stored measurement, None if the data is not usable."""
+        try:
+            measured = dt_util.parse_datetime(data["measured"])
+            if measured is None:
+                return None
+            return cls(
+                measurement_id=str(data["id"]),
+                sensor=str(data["sensor"]),
+                weight=float(data["weight"]),
+                measured=measured,
+                impedance={
+                    Metric(metric): float(value)
+                    for metric, value in data.get("impedance", {}).items()
+                },
+            )
+        except KeyError, TypeError, ValueError:
+            return None
+
+
 class NotificationCoordinator:
     """Sends interactive push notifications and routes action events.
 
@@ -301,25 +722,58 @@ class NotificationCoordinator:
 
     Flow
     ----
-    1. BodyScaleMetricsHandler detects a weight change and calls
-       coordinator.async_notify(weight).
+    1. BodyScaleMetricsHandler detects a weight change, queues it with
+       coordinator.add_measurement() and calls
+       coordinator.async_notify(weight, measurement_id).
     2. The coordinator sends a notification to the configured mobile device(s)
-       with one action button per registered user name.
+       with one action button per registered user name; each action carries
+       the config entry ID of the user and the measurement ID.
     3. The user taps their name → HA fires mobile_app_notification_action.
-    4. _on_notification_action() finds the matching NotificationFilter and
-       calls filter.confirm().
-    5. On the next weight update (same measurement cycle), the metrics handler
-       calls profile_filter.accepts() which returns True once.
+    4. _on_notification_action() finds the matching NotificationFilter,
+       calls filter.confirm() and hands the queued measurement to the
+       handler.
+    5. The handler replays it; profile_filter.accepts() returns True once.
+
+    Up to ``PENDING_QUEUE_SIZE`` measurements wait for a confirmation, so
+    people weighing back-to-back can each confirm later. The queue is saved
+    with a debounced ``Store`` write and survives restarts; measurements
+    expire ``PENDING_MEASUREMENT_TIMEOUT`` seconds after the weighing.
     """
 
     def __init__(self, hass: HomeAssistant) -> None:
         self._hass = hass
         # entry_id → (user_name, NotificationFilter, device_id, handler)
         self._entries: dict[str, tuple[str, NotificationFilter, str, Any]] = {}
+        # language → "common" translations, loaded once per language
+        self._translations: dict[str, dict[str, Any]] = {}
         self._remove_listener = hass.bus.async_listen(
-            "mobile_app_notification_action",
+            EVENT_MOBILE_APP_NOTIFICATION_ACTION,
             self._on_notification_action,
+            event_filter=_is_own_action,
         )
+        self._remove_config_listener = hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._on_core_config_update
+        )
+        # device_id → resolved notify service, until a registry or notify
+        # service change may have made it stale
+        self._notify_services: dict[str, str] = {}
+        # device_id → duration of the last successful notification (seconds)
+        self._delivery_times: dict[str, float] = {}
+        # measurement_id → measurement, oldest first
+        self._pending: dict[str, PendingMeasurement] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, PENDING_STORAGE_VERSION, PENDING_STORAGE_KEY
+        )
+        self._remove_cache_listeners: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._on_device_registry_update
+            ),
+            hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._on_entity_registry_update
+            ),
+            hass.bus.async_listen(EVENT_SERVICE_REGISTERED, self._on_service_change),
+            hass.bus.async_listen(EVENT_SERVICE_REMOVED, self._on_service_change),
+        ]
 
     def register(
         self,
@@ -335,6 +789,7 @@ class NotificationCoordinator:
         ``handler.accept_pending_measurement()`` after the user confirms
         their identity via the interactive notification.
         """
+        self.unregister(entry_id)
         self._entries[entry_id] = (user_name, notify_filter, device_id, handler)
         _LOGGER.debug(
             "NotificationCoordinator: registered entry '%s' (device=%s)",
@@ -351,38 +806,146 @@ class NotificationCoordinator:
         return bool(self._entries)
 
     def unload(self) -> None:
-        """Remove the global event listener and clear entries."""
+        """Remove the global event listeners and clear entries."""
         self._remove_listener()
+        self._remove_config_listener()
+        for remove in self._remove_cache_listeners:
+            remove()
+        self._remove_cache_listeners.clear()
         self._entries.clear()
+        self._translations.clear()
+        self._notify_services.clear()
+        self._delivery_times.clear()
+
+    async def async_load(self) -> None:
+        """Load the translations and the measurements still pending."""
+        await self.async_load_translations()
+        data = await self._store.async_load()
+        if data:
+            for item in data.get("pending", []):
+                measurement = PendingMeasurement.from_dict(item)
+                if measurement is not None:
+                    self._pending[measurement.measurement_id] = measurement
+            self._prune_pending()
+
+    async def async_save_pending(self) -> None:
+        """Write the pending measurements now (before the coordinator goes)."""
+        await self._store.async_save(self._data_to_save())
 
-    async def _get_notify_translations(self, language: str) -> dict[str, Any]:
-        """Load notify translations from the translation file."""
-        translations_dir = os.path.join(os.path.dirname(__file__), "translations")
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the pending measurements to store."""
+        return {
+            "pending": [measurement.as_dict() for measurement in self._pending.values()]
+        }
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Save the queue once a burst of changes has settled."""
+        self._store.async_delay_save(self._data_to_save, PENDING_SAVE_DELAY)
 
-        for lang in (language, "en"):
-            path = os.path.join(translations_dir, f"{lang}.json")
-            if os.path.exists(path):
-                try:
+    @callback
+    def _prune_pending(self) -> bool:
+        """Drop expired measurements; return True if any was dropped."""
+        expired_before = dt_util.utcnow() - timedelta(
+            seconds=PENDING_MEASUREMENT_TIMEOUT
+        )
+        expired = [
+            measurement_id
+            for measurement_id, measurement in self._pending.items()
+            if measurement.measured < expired_before
+        ]
+        for measurement_id in expired:
+            _LOGGER.debug(
+                "NotificationCoordinator: pending measurement %s expired",
+                measurement_id,
+            )
+            del self._pending[measurement_id]
+        return bool(expired)
+
+    @property
+    def pending_measurements(self) -> list[PendingMeasurement]:
+        """Return the measurements waiting for a confirmation, oldest first."""
+        return list(self._pending.values())
+
+    def _latest_pending(self, sensor: str) -> PendingMeasurement | None:
+        """Return the newest pending measurement of a weight sensor."""
+        for measurement in reversed(self._pending.values()):
+            if measurement.sensor == sensor:
+                return measurement
+        return None
 
-                    def _load(p: str = path) -> dict[str, Any]:
-                        with open(p, encoding="utf-8") as f:
-                            return cast(dict[str, Any], json.load(f))
+    @callback
+    def add_measurement(
+        self, sensor: str, weight: float, measured: datetime
+    ) -> PendingMeasurement | None:
+        """Queue a weighing; None if another handler already queued it."""
+        self._prune_pending()
+        latest = self._latest_pending(sensor)
+        if latest is not None and latest.measured == measured:
+            return None
 
-                    data: dict[str, Any] = cast(
-                        dict[str, Any], await self._hass.async_add_executor_job(_load)
-                    )
-                    notify: dict[str, Any] = data.get("common", {})
-                    if notify:
-                        return dict(notify)
-                except Exception:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-                    _LOGGER.debug("Failed to load translations for lang=%s", lang)
-        return {}
-
-    async def async_notify(self, weight: float) -> None:
+        measurement = PendingMeasurement(
+            measurement_id=secrets.token_hex(4),
+            sensor=sensor,
+            weight=weight,
+            measured=measured,
+        )
+        self._pending[measurement.measurement_id] = measurement
+        while len(self._pending) > PENDING_QUEUE_SIZE:
+            oldest = next(iter(self._pending))
+            _LOGGER.debug(
+                "NotificationCoordinator: queue full — dropping measurement %s",
+                oldest,
+            )
+            del self._pending[oldest]
+        self._schedule_save()
+        return measurement
+
+    @callback
+    def add_impedance(self, sensor: str, metric: Metric, value: float) -> None:
+        """Attach an impedance reading to the newest weighing of the scale."""
+        measurement = self._latest_pending(sensor)
+        if measurement is None or measurement.impedance.get(metric) == value:
+            return
+        measurement.impedance[metric] = value
+        self._schedule_save()
+
+    async def async_load_translations(self) -> None:
+        """Load the notify translations of the configured language.
+
+        Called when the coordinator is created, so the first weighing does
+        not wait for the translation file.
+        """
+        await self._get_notify_translations(self._hass.config.language)
+
+    @callback
+    def _on_core_config_update(self, event: Event) -> None:
+        """Drop cached translations when the language changes."""
+        if "language" not in event.data:
+            return
+        self._translations.clear()
+        self._hass.async_create_task(self.async_load_translations())
+
+    async def _get_notify_translations(self, language: str) -> dict[str, Any]:
+        """Return the notify translations, loading them on the first use."""
+        translations = self._translations.get(language)
+        if translations is None:
+            translations = await self._hass.async_add_executor_job(
+                _load_notify_translations, language
+            )
+            self._translations[language] = translations
+        return translations
+
+    async def async_notify(
+        self, weight: float, measurement_id: str | None = None
+    ) -> None:
         """Send an interactive notification to all registered devices.
 
         Users sharing a device receive a single notification listing all names.
         Users on separate devices each receive their own notification.
+        ``measurement_id`` is embedded in the actions so the confirmation
+        replays that queued measurement.
         """
         if not self._entries:
             return
@@ -430,39 +993,123 @@ class NotificationCoordinator:
             _LOGGER.debug("Failed to format notification message: %s", message_tpl)
             message = f"New measurement: {weight:.1f} kg"
 
-        for device_id, entry_names in by_device.items():
-            service_name = await self._resolve_notify_service(device_id)
-            if service_name is None:
-                _LOGGER.warning(
-                    "NotificationCoordinator: cannot resolve notify service for "
-                    "device_id=%s — skipping",
-                    device_id,
+        # Devices are notified concurrently: the phone of the person on the
+        # scale must not wait for the other devices of the household.
+        await asyncio.gather(
+            *(
+                self._async_notify_device(
+                    device_id, entry_names, title, message, measurement_id
                 )
-                continue
+                for device_id, entry_names in by_device.items()
+            )
+        )
 
-            actions = [
-                {"action": name.upper(), "title": name} for _, name in entry_names
-            ]
-
-            await self._hass.services.async_call(
-                "notify",
-                service_name,
-                {
-                    "title": title,
-                    "message": message,
-                    "data": {
-                        "tag": NOTIFICATION_TAG,
-                        "actions": actions,
-                        # On iOS the actions appear as buttons; on Android as
-                        # inline reply options.  Both use the same format.
+    @property
+    def delivery_times(self) -> Mapping[str, float]:
+        """Return how long the last notification took per device (seconds)."""
+        return MappingProxyType(self._delivery_times)
+
+    async def _async_notify_device(
+        self,
+        device_id: str,
+        entry_names: list[tuple[str, str]],
+        title: str,
+        message: str,
+        measurement_id: str | None,
+    ) -> None:
+        """Send the notification to one device.
+
+        Errors and timeouts are logged and do not affect the other devices.
+        """
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(NOTIFY_TIMEOUT):
+                service_name = await self._async_get_notify_service(device_id)
+                if service_name is None:
+                    _LOGGER.warning(
+                        "NotificationCoordinator: cannot resolve notify service for "
+                        "device_id=%s — skipping",
+                        device_id,
+                    )
+                    return
+
+                actions = [
+                    {
+                        "action": notification_action(entry_id, measurement_id),
+                        "title": name,
+                    }
+                    for entry_id, name in entry_names
+                ]
+
+                await self._hass.services.async_call(
+                    "notify",
+                    service_name,
+                    {
+                        "title": title,
+                        "message": message,
+                        "data": {
+                            "tag": NOTIFICATION_TAG,
+                            "actions": actions,
+                            # On iOS the actions appear as buttons; on Android as
+                            # inline reply options.  Both use the same format.
+                        },
                     },
-                },
+                    # Wait for the delivery so the timeout, the error
+                    # isolation and the timing cover it.
+                    blocking=True,
+                )
+        except TimeoutError:
+            _LOGGER.warning(
+                "NotificationCoordinator: notification to device_id=%s timed out "
+                "after %.0f s",
+                device_id,
+                NOTIFY_TIMEOUT,
             )
-            _LOGGER.debug(
-                "NotificationCoordinator: sent to %s — actions: %s",
-                service_name,
-                [a["title"] for a in actions],
+            return
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOGGER.exception(
+                "NotificationCoordinator: notification to device_id=%s failed",
+                device_id,
             )
+            return
+
+        elapsed = time.monotonic() - started
+        self._delivery_times[device_id] = elapsed
+        _LOGGER.debug(
+            "NotificationCoordinator: sent to %s in %.3f s — actions: %s",
+            service_name,
+            elapsed,
+            [a["title"] for a in actions],
+        )
+
+    @callback
+    def _on_device_registry_update(self, event: Event) -> None:
+        """Forget the service resolved for an updated or removed device."""
+        self._notify_services.pop(event.data.get("device_id", ""), None)
+
+    @callback
+    def _on_entity_registry_update(self, event: Event) -> None:
+        """Forget every resolved service when entities change.
+
+        Strategy 2 matches entity unique_ids, and a removed entity no longer
+        tells which device it belonged to.
+        """
+        self._notify_services.clear()
+
+    @callback
+    def _on_service_change(self, event: Event) -> None:
+        """Forget every resolved service when a notify service comes or goes."""
+        if event.data.get("domain") == "notify":
+            self._notify_services.clear()
+
+    async def _async_get_notify_service(self, device_id: str) -> str | None:
+        """Return the notify service of a device, resolving it once."""
+        service_name = self._notify_services.get(device_id)
+        if service_name is None:
+            service_name = await self._resolve_notify_service(device_id)
+            if service_name is not None:
+                self._notify_services[device_id] = service_name
+        return service_name
 
     async def _resolve_notify_service(self, device_id: str) -> str | None:
         """Return the notify service name for a mobile_app device_id.
@@ -594,7 +1241,8 @@ class NotificationCoordinator:
 
         This method is a @callback — it runs in the HA event loop thread,
         making it safe to call other @callback methods and schedule coroutines
-        via hass.async_create_task().
+        via hass.async_create_task(). Actions of other notifications never
+        reach it: the listener's event filter only lets ours through.
 
         Flow:
         1. confirm() arms the NotificationFilter flag.
@@ -604,26 +1252,63 @@ class NotificationCoordinator:
            via hass.async_create_task() — safe because we are in the event loop.
         """
         action: str = event.data.get("action", "")
+        # The action names the config entry, so users whose names only
+        # differ in case are still told apart.
+        entry_id, _, measurement_id = action[
+            len(NOTIFICATION_ACTION_PREFIX) :
+        ].partition(":")
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            _LOGGER.debug(
+                "NotificationCoordinator: action '%s' did not match any user", action
+            )
+            return
 
-        for _entry_id, (name, notify_filter, _, handler) in self._entries.items():
-            if action.upper() == name.upper():
+        measurement: PendingMeasurement | None = None
+        if measurement_id:
+            self._prune_pending()
+            measurement = self._pending.pop(measurement_id, None)
+            if measurement is None:
                 _LOGGER.debug(
-                    "NotificationCoordinator: action '%s' → entry '%s' confirmed",
+                    "NotificationCoordinator: measurement %s expired or already "
+                    "confirmed — action '%s' ignored",
+                    measurement_id,
                     action,
-                    name,
                 )
-                # Step 1: arm the filter so the next accepts() returns True.
-                notify_filter.confirm()
-                # Step 2: replay the pending measurement synchronously.
-                # accept_pending_measurement() is a plain method, safe to call
-                # from a @callback because it only calls other @callbacks and
-                # schedules coroutines via async_create_task().
-                handler.accept_pending_measurement()
                 return
+            self._schedule_save()
 
+        name, notify_filter, _, handler = entry
         _LOGGER.debug(
-            "NotificationCoordinator: action '%s' did not match any user", action
+            "NotificationCoordinator: action '%s' → entry '%s' confirmed",
+            action,
+            name,
         )
+        # Step 1: arm the filter so the next accepts() returns True.
+        notify_filter.confirm()
+        # Step 2: replay the pending measurement synchronously.
+        # accept_pending_measurement() is a plain method, safe to call
+        # from a @callback because it only calls other @callbacks and
+        # schedules coroutines via async_create_task().
+        if measurement is None:
+            handler.accept_pending_measurement()
+        else:
+            handler.accept_pending_measurement(measurement)
+
+
+def notification_action(entry_id: str, measurement_id: str | None = None) -> str:
+    """Return the notification action id of a user's entry (and measurement)."""
+    action = f"{NOTIFICATION_ACTION_PREFIX}{entry_id}"
+    if measurement_id is not None:
+        action = f"{action}:{measurement_id}"
+    return action
+
+
+@callback
+def _is_own_action(event_data: Mapping[str, Any]) -> bool:
+    """Return True for actions of bodymiscale notifications."""
+    action = event_data.get("action")
+    return isinstance(action, str) and action.startswith(NOTIFICATION_ACTION_PREFIX)
 
 
 # ---------------------------------------------------------------------------
@@ -8,11 +8,12 @@ from typing import Any, cast
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
+    SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfMass
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfMass, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -31,6 +32,7 @@ from .const import (
     ATTR_INTRACELLULAR_WATER,
     ATTR_LAST_MEASUREMENT_TIME,
     ATTR_LBM,
+    ATTR_MEASUREMENT_LATENCY,
     ATTR_METABOLIC,
     ATTR_MUSCLE,
     ATTR_PROTEIN,
@@ -48,7 +50,7 @@ from .const import (
     IMPEDANCE_MODE_STANDARD,
 )
 from .entity import BodyScaleBaseEntity
-from .metrics import BodyScaleMetricsHandler
+from .metrics import BodyScaleMetricsHandler, CycleLatency
 from .models import Metric
 from .util import get_bmi_label, get_ideal_weight
 
@@ -328,6 +330,30 @@ _DUAL_SENSORS: tuple[
     ),
 )
 
+# Diagnostic sensor — where the time of the last measurement cycle went.
+LATENCY_DESCRIPTION = SensorEntityDescription(
+    key=ATTR_MEASUREMENT_LATENCY,
+    translation_key="measurement_latency",
+    icon="mdi:timer-outline",
+    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    entity_registry_enabled_default=False,
+)
+
+# Description of every metric exposed as a sensor, whatever the impedance mode.
+METRIC_DESCRIPTIONS: Mapping[Metric, SensorEntityDescription] = {
+    metric: description
+    for description, metric, _ in (
+        *_BASE_SENSORS,
+        *_IMPEDANCE_SENSORS,
+        *_STANDARD_ONLY_SENSORS,
+        *_DUAL_SENSORS,
+    )
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -342,7 +368,7 @@ async def async_setup_entry(
     impedance_mode = handler.config.get(CONF_IMPEDANCE_MODE, "none")
 
     # Base sensors — always created
-    new_sensors: list[BodyScaleSensor] = [
+    new_sensors: list[BodyScaleBaseEntity] = [
         BodyScaleSensor(handler, description, metric, get_attributes)
         for description, metric, get_attributes in _BASE_SENSORS
     ]
@@ -368,9 +394,50 @@ async def async_setup_entry(
             for description, metric, get_attributes in _DUAL_SENSORS
         )
 
+    # Latency diagnostic sensor — disabled until the user enables it
+    new_sensors.append(BodyScaleLatencySensor(handler))
+
     async_add_entities(new_sensors)
 
 
+class BodyScaleLatencySensor(BodyScaleBaseEntity, SensorEntity):
+    """Latency breakdown of the last measurement cycle of a profile.
+
+    The state is the time from the weight reading to the state write of
+    the main entity, in milliseconds; the ``ingest``, ``filter``,
+    ``compute`` and ``publish`` attributes split it into the stages of
+    :class:`CycleLatency`. Not restored: a latency measured before a
+    restart says nothing about the current setup.
+    """
+
+    def __init__(self, handler: BodyScaleMetricsHandler) -> None:
+        super().__init__(handler, LATENCY_DESCRIPTION)
+
+    async def async_added_to_hass(self) -> None:
+        """Show the last breakdown and follow the next ones."""
+        await super().async_added_to_hass()
+        latency = self._handler.last_cycle_latency
+        if latency is not None:
+            self._update_latency(latency)
+
+        def on_latency(latency: CycleLatency) -> None:
+            """Handle the breakdown of a cycle that was just published."""
+            self._update_latency(latency)
+            # Already the end of the debounced write — no need to queue it.
+            self.async_write_ha_state()
+
+        self.async_on_remove(self._handler.subscribe_latency(on_latency))
+
+    def _update_latency(self, latency: CycleLatency) -> None:
+        self._attr_native_value = round(latency.total * 1000, 1)
+        self._attr_extra_state_attributes = {
+            "ingest": round(latency.ingest * 1000, 1),
+            "filter": round(latency.filter * 1000, 1),
+            "compute": round(latency.compute * 1000, 3),
+            "publish": round(latency.publish * 1000, 1),
+        }
+
+
 class BodyScaleSensor(BodyScaleBaseEntity, RestoreSensor):
     """Body scale sensor with cold-start state restoration.
 
@@ -442,24 +509,31 @@ class BodyScaleSensor(BodyScaleBaseEntity, RestoreSensor):
         # ── Live updates ──────────────────────────────────────────────────
         def on_value(value: StateType | datetime) -> None:
             """Handle a new sensor value and update the entity state."""
+            native_value: StateType | datetime
             if self.entity_description.key == ATTR_LAST_MEASUREMENT_TIME:
                 if isinstance(value, datetime):
-                    self._attr_native_value = value
+                    native_value = value
                 elif isinstance(value, str):
                     try:
-                        self._attr_native_value = datetime.fromisoformat(value)
+                        native_value = datetime.fromisoformat(value)
                     except ValueError:
-                        self._attr_native_value = None
+                        native_value = None
                 else:
-                    self._attr_native_value = value
+                    native_value = value
             else:
                 if isinstance(value, (int, float)):
                     precision = self.entity_description.suggested_display_precision
-                    self._attr_native_value = round(
+                    native_value = round(
                         float(value), precision if precision is not None else 2
                     )
                 else:
-                    self._attr_native_value = value
+                    native_value = value
+
+            # Nothing to write — e.g. the handler's initial replay of a value
+            # that was just restored.
+            if native_value is not None and native_value == self._attr_native_value:
+                return
+            self._attr_native_value = native_value
 
             if self._get_attributes:
                 self._attr_extra_state_attributes = dict(
@@ -468,6 +542,6 @@ class BodyScaleSensor(BodyScaleBaseEntity, RestoreSensor):
                     )
                 )
 
-            self.async_write_ha_state()
+            self.async_schedule_write()
 
         self.async_on_remove(self._handler.subscribe(self._metric, on_value))
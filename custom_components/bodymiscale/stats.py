@@ -0,0 +1,172 @@
+"""Long-term statistics for bodymiscale.
+
+Measurements are sparse (a few per day at most), so every metric is stored
+as external hourly statistics — ``bodymiscale:<profile>_<metric>`` — with
+the mean, min and max of the measurements taken during each hour.
+
+Live measurement cycles and the recompute_history backfill both go through
+this module, so they write the same statistic ids and aggregate the
+measurements of an hour the same way.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .models import Metric
+from .sensor import METRIC_DESCRIPTIONS
+
+# Metrics exported as statistics: every numeric measurement sensor.
+STATISTIC_METRICS: tuple[Metric, ...] = tuple(
+    metric
+    for metric, description in METRIC_DESCRIPTIONS.items()
+    if description.state_class is SensorStateClass.MEASUREMENT
+)
+
+
+def statistic_id(profile_name: str, metric: Metric) -> str:
+    """Return the external statistic id of a profile metric."""
+    return f"{DOMAIN}:{slugify(profile_name)}_{metric.value}"
+
+
+def statistic_metadata(profile_name: str, metric: Metric) -> StatisticMetaData:
+    """Return the metadata of a profile metric statistic."""
+    description = METRIC_DESCRIPTIONS[metric]
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.ARITHMETIC,
+        has_sum=False,
+        name=f"{profile_name} {metric.value.replace('_', ' ')}",
+        source=DOMAIN,
+        statistic_id=statistic_id(profile_name, metric),
+        unit_class=None,
+        unit_of_measurement=description.native_unit_of_measurement,
+    )
+
+
+def _hour_start(timestamp: datetime) -> datetime:
+    """Return the start of the UTC hour holding ``timestamp``."""
+    return dt_util.as_utc(timestamp).replace(minute=0, second=0, microsecond=0)
+
+
+def _hourly_row(hour: datetime, bucket: Sequence[float]) -> StatisticData:
+    """Return the statistic row of the measurements taken during an hour."""
+    return StatisticData(
+        start=hour, mean=sum(bucket) / len(bucket), min=min(bucket), max=max(bucket)
+    )
+
+
+def hourly_statistics(
+    timestamps: Sequence[datetime], values: Sequence[StateType]
+) -> list[StatisticData]:
+    """Aggregate measurements into hourly mean/min/max rows.
+
+    ``timestamps`` must be in chronological order; non-numeric values are
+    ignored.
+    """
+    rows: list[StatisticData] = []
+    hour: datetime | None = None
+    bucket: list[float] = []
+
+    def _close() -> None:
+        if hour is not None and bucket:
+            rows.append(_hourly_row(hour, bucket))
+
+    for timestamp, value in zip(timestamps, values, strict=True):
+        if not isinstance(value, (int, float)):
+            continue
+        start = _hour_start(timestamp)
+        if start != hour:
+            _close()
+            hour = start
+            bucket = []
+        bucket.append(float(value))
+    _close()
+
+    return rows
+
+
+@callback
+def async_import_metric_statistics(
+    hass: HomeAssistant,
+    profile_name: str,
+    timestamps: Sequence[datetime],
+    columns: Mapping[Metric, Sequence[StateType]],
+    metrics: Iterable[Metric] = STATISTIC_METRICS,
+) -> int:
+    """Queue hourly statistics of the given metric columns for import.
+
+    Returns the number of hourly rows queued. Existing rows for the same
+    hours are overwritten by the recorder.
+    """
+    imported = 0
+    for metric in metrics:
+        values = columns.get(metric)
+        if values is None:
+            continue
+        rows = hourly_statistics(timestamps, values)
+        if not rows:
+            continue
+        async_add_external_statistics(
+            hass, statistic_metadata(profile_name, metric), rows
+        )
+        imported += len(rows)
+    return imported
+
+
+class CycleStatistics:
+    """Import the completed measurement cycles of a profile as statistics.
+
+    The measurements of the current hour are kept, so the row rewritten
+    after each cycle holds their mean/min/max — the same row the backfill
+    writes for that hour. After a restart the hour starts over from the
+    next measurement.
+    """
+
+    def __init__(self, hass: HomeAssistant, profile_name: str) -> None:
+        self._hass = hass
+        self._profile_name = profile_name
+        self._hour: datetime | None = None
+        self._buckets: dict[Metric, list[float]] = {}
+
+    @callback
+    def async_import(self, metrics: Mapping[Metric, StateType | datetime]) -> int:
+        """Queue the hourly rows updated by a completed cycle.
+
+        Returns the number of rows queued.
+        """
+        measured = metrics.get(Metric.LAST_MEASUREMENT_TIME)
+        if not isinstance(measured, datetime):
+            return 0
+        hour = _hour_start(measured)
+        if hour != self._hour:
+            self._hour = hour
+            self._buckets = {}
+
+        imported = 0
+        for metric in STATISTIC_METRICS:
+            value = metrics.get(metric)
+            if not isinstance(value, (int, float)):
+                continue
+            bucket = self._buckets.setdefault(metric, [])
+            bucket.append(float(value))
+            async_add_external_statistics(
+                self._hass,
+                statistic_metadata(self._profile_name, metric),
+                [_hourly_row(hour, bucket)],
+            )
+            imported += 1
+        return imported
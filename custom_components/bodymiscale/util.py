@@ -107,11 +107,11 @@ def get_bmi_label(bmi: float) -> str:
     return "massive_obesity"
 
 
-def get_age(date_str: str) -> int:
-    """Get current age from birthdate string (YYYY-MM-DD)."""
+def get_age(date_str: str, at: datetime | None = None) -> int:
+    """Get age from birthdate string (YYYY-MM-DD), today or at a given date."""
     try:
         born = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.today()
+        today = at if at is not None else datetime.today()
         age = today.year - born.year
         if (today.month, today.day) < (born.month, born.day):
             age -= 1
@@ -0,0 +1,122 @@
+"""Fixtures for the bodymiscale benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from .harness import (
+    TIMING_FIELDS,
+    BenchmarkResults,
+    Comparison,
+    Timing,
+    calibrate,
+    compare,
+    format_table,
+    load_baseline,
+    measure,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+TIMING_ATTEMPTS = 3
+
+_RESULTS_KEY = pytest.StashKey[BenchmarkResults]()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request: pytest.FixtureRequest) -> Iterator[BenchmarkResults]:
+    """Collect the results of the session and write them on teardown."""
+    results = BenchmarkResults()
+    request.config.stash[_RESULTS_KEY] = results
+    yield results
+    path = request.config.getoption("--bench-json")
+    if path and results.cases:
+        results.write(Path(path))
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(
+    request: pytest.FixtureRequest,
+) -> dict[str, dict[str, Any]] | None:
+    """Return the baseline cases when --bench-compare is given."""
+    if not request.config.getoption("--bench-compare"):
+        return None
+    path = Path(request.config.getoption("--bench-baseline") or DEFAULT_BASELINE)
+    if not path.exists():
+        pytest.fail(
+            f"No benchmark baseline at {path}: record one with "
+            f"pytest tests/benchmarks --bench --bench-json {path}",
+            pytrace=False,
+        )
+    return load_baseline(path)
+
+
+@pytest.fixture
+def bench(
+    request: pytest.FixtureRequest,
+    benchmark_results: BenchmarkResults,
+    benchmark_baseline: dict[str, dict[str, Any]] | None,
+) -> Callable[..., Timing]:
+    """Return a function timing a callable and recording it under a name.
+
+    With --bench-compare, a gated case fails when one of its fields
+    regressed beyond --bench-tolerance (timings) or
+    --bench-counter-tolerance (allocations, subscriber calls) compared
+    with the baseline. A timing regression is measured again, up to
+    ``TIMING_ATTEMPTS`` times, before it is reported.
+    """
+    timing_tolerance: float = request.config.getoption("--bench-tolerance")
+    counter_tolerance: float = request.config.getoption("--bench-counter-tolerance")
+
+    def _bench(
+        name: str,
+        func: Callable[[], object],
+        *,
+        rounds: int = 200,
+        warmup: int = 20,
+        number: int = 1,
+        gate: bool = True,
+        **extra: Any,
+    ) -> Timing:
+        baseline = benchmark_baseline.get(name) if benchmark_baseline else None
+        comparisons: list[Comparison] = []
+        for _attempt in range(TIMING_ATTEMPTS):
+            timing = measure(func, rounds=rounds, warmup=warmup, number=number)
+            benchmark_results.record(name, timing, calibrate(), **extra)
+            if not gate or baseline is None:
+                return timing
+            comparisons = compare(
+                name,
+                benchmark_results.cases[name],
+                baseline,
+                timing_tolerance,
+                counter_tolerance,
+            )
+            # Only a timing regression can be load noise worth re-measuring.
+            if not any(c.regressed for c in comparisons if c.field in TIMING_FIELDS):
+                break
+
+        benchmark_results.comparisons.extend(comparisons)
+        if any(comparison.regressed for comparison in comparisons):
+            pytest.fail(
+                f"{name} regressed compared with the baseline:\n"
+                + format_table(comparisons),
+                pytrace=False,
+            )
+        return timing
+
+    return _bench
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Print the comparison with the baseline of every benchmark case."""
+    results = config.stash.get(_RESULTS_KEY, None)
+    if results is None or not results.comparisons:
+        return
+    terminalreporter.section("benchmark comparison")
+    terminalreporter.write_line(format_table(results.comparisons))
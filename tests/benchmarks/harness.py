@@ -0,0 +1,262 @@
+"""Minimal timing harness for the bodymiscale benchmarks.
+
+No benchmark plugin is needed: each case is a plain callable timed with
+``perf_counter_ns`` over a fixed number of rounds (after a warm-up, with
+the garbage collector paused like ``timeit`` does). Results are collected
+per session and written as JSON so runs of two commits can be compared.
+
+``compare`` checks a run against a committed baseline (``baseline.json``):
+every gated field present in both must stay within a relative tolerance,
+a loose one for timings and a tight one for the deterministic counters.
+Timings are gated as a ratio to a calibration workload timed right after
+each case, which cancels out most of the machine speed and load. It does
+not cancel out the interpreter, so a baseline is only used by runs of the
+Python version it was recorded with.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+RESULTS_FORMAT_VERSION = 1
+
+# Fields checked against the baseline (lower is better for all of them).
+# Timings are compared relative to the calibration workload, so a slower
+# or busier machine does not count as a regression; the counters are
+# deterministic.
+TIMING_FIELDS: tuple[str, ...] = ("relative_cost",)
+COUNTER_FIELDS: tuple[str, ...] = ("alloc_bytes", "subscriber_calls")
+
+
+@dataclass(frozen=True, slots=True)
+class Timing:
+    """Timing statistics of one benchmark case, in nanoseconds per call."""
+
+    rounds: int
+    min_ns: float
+    median_ns: float
+    mean_ns: float
+    p95_ns: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Return the throughput derived from the median call time."""
+        return 1e9 / self.median_ns if self.median_ns else 0.0
+
+
+def measure(
+    func: Callable[[], object],
+    *,
+    rounds: int = 200,
+    warmup: int = 20,
+    number: int = 1,
+    repeat: int = 3,
+) -> Timing:
+    """Time ``func`` over ``rounds`` samples after ``warmup`` untimed calls.
+
+    Each sample times ``number`` consecutive calls and keeps the mean, so
+    calls of a few microseconds are not dominated by the timer resolution.
+    The samples are taken ``repeat`` times and the block with the lowest
+    median is kept: like ``timeit.repeat``, slower blocks measure other
+    load on the machine rather than the code.
+    """
+    for _ in range(warmup):
+        func()
+
+    blocks: list[list[float]] = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            samples: list[float] = []
+            for _ in range(rounds):
+                start = perf_counter_ns()
+                for _ in range(number):
+                    func()
+                samples.append((perf_counter_ns() - start) / number)
+            samples.sort()
+            blocks.append(samples)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    samples = min(blocks, key=statistics.median)
+    return Timing(
+        rounds=rounds,
+        min_ns=samples[0],
+        median_ns=statistics.median(samples),
+        mean_ns=statistics.fmean(samples),
+        p95_ns=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    )
+
+
+def _calibration_workload() -> None:
+    """Run a fixed pure-Python workload (arithmetic, dict and attribute use)."""
+    values: dict[int, float] = {}
+    for index in range(500):
+        values[index] = index * 0.5 + values.get(index - 1, 0.0)
+    sorted(values.values(), reverse=True)
+
+
+def calibrate() -> float:
+    """Return the median time (ns) of the calibration workload right now."""
+    return measure(_calibration_workload, rounds=50, warmup=5).median_ns
+
+
+def measure_allocations(func: Callable[[], object], *, repeat: int = 4) -> int:
+    """Return the peak memory (bytes) allocated by one call of ``func``.
+
+    The lowest of ``repeat`` traced calls is kept, leaving out one-off
+    growth such as a cache or dict resize.
+    """
+    peaks: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return min(peaks)
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """One gated field of a case compared with the baseline."""
+
+    case: str
+    field: str
+    baseline: float
+    current: float
+    tolerance: float
+
+    @property
+    def change(self) -> float:
+        """Return the relative change from the baseline (0.1 = 10 % worse)."""
+        if not self.baseline:
+            return 0.0 if not self.current else float("inf")
+        return (self.current - self.baseline) / self.baseline
+
+    @property
+    def decimals(self) -> int:
+        """Return the decimals worth showing for the compared values."""
+        return 3 if max(self.baseline, self.current) < 100 else 0
+
+    @property
+    def regressed(self) -> bool:
+        """Return True when the change exceeds the tolerance."""
+        return self.change > self.tolerance
+
+
+def compare(
+    name: str,
+    case: dict[str, Any],
+    baseline: dict[str, Any],
+    timing_tolerance: float,
+    counter_tolerance: float,
+) -> list[Comparison]:
+    """Compare the gated fields of a case with its baseline entry."""
+    fields = [(field, timing_tolerance) for field in TIMING_FIELDS] + [
+        (field, counter_tolerance) for field in COUNTER_FIELDS
+    ]
+    return [
+        Comparison(name, field, float(baseline[field]), float(case[field]), tolerance)
+        for field, tolerance in fields
+        if field in case and field in baseline
+    ]
+
+
+def format_table(comparisons: list[Comparison]) -> str:
+    """Return the comparisons as a plain text diff table."""
+    header = ("case", "field", "baseline", "current", "change", "limit", "")
+    rows = [header] + [
+        (
+            c.case,
+            c.field,
+            f"{c.baseline:,.{c.decimals}f}",
+            f"{c.current:,.{c.decimals}f}",
+            f"{c.change:+.1%}",
+            f"{c.tolerance:+.0%}",
+            "REGRESSED" if c.regressed else "ok",
+        )
+        for c in comparisons
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) for cell, width in zip(row, widths, strict=True)
+        ).rstrip()
+        for row in rows
+    )
+
+
+def _python_release(version: str) -> str:
+    """Return the ``major.minor`` part of a Python version."""
+    return ".".join(version.split(".")[:2])
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    """Return the cases of a results file written by ``BenchmarkResults``.
+
+    Raises ``ValueError`` when the file was recorded with another Python
+    release than the running one: its numbers cannot gate this run.
+    """
+    data = json.loads(path.read_text())
+    if data.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    recorded = str(data.get("python", ""))
+    running = sys.version.split()[0]
+    if _python_release(recorded) != _python_release(running):
+        raise ValueError(
+            f"{path} was recorded with Python {recorded or 'unknown'}, this run "
+            f"uses Python {running}: refresh it with --bench-json {path}"
+        )
+    return data["cases"]
+
+
+class BenchmarkResults:
+    """Benchmark results of one session, keyed by case name."""
+
+    def __init__(self) -> None:
+        self.cases: dict[str, dict[str, Any]] = {}
+        self.comparisons: list[Comparison] = []
+
+    def record(
+        self, name: str, timing: Timing, calibration_ns: float, **extra: Any
+    ) -> None:
+        """Store the timing (and any extra counters) of a case."""
+        self.cases[name] = {
+            **asdict(timing),
+            "ops_per_sec": timing.ops_per_sec,
+            "calibration_ns": calibration_ns,
+            "relative_cost": timing.median_ns / calibration_ns,
+            **extra,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the results with the metadata of the run."""
+        return {
+            "version": RESULTS_FORMAT_VERSION,
+            "created": datetime.now(UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cases": dict(sorted(self.cases.items())),
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the results to ``path`` as JSON."""
+        path.write_text(json.dumps(self.as_dict(), indent=2) + "\n")
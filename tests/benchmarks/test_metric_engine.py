@@ -0,0 +1,281 @@
+"""Benchmarks of the metric engine and the measurement pipeline.
+
+Run with ``pytest tests/benchmarks --bench [--bench-json results.json]``;
+add ``--bench-compare`` to fail on regressions against ``baseline.json``.
+The baseline depends on the machine and the Python release, so it is not
+committed: record it with ``--bench-json tests/benchmarks/baseline.json``
+on the machine the comparisons run on, with the project's Python (a
+baseline recorded with another Python release is refused).
+
+* ``handler[<mode>]`` — one measurement (weight, then the impedance
+  reading(s) of the mode) through ``BodyScaleMetricsHandler._state_changed``,
+  including every recalculation pass and subscriber dispatch. Also
+  records the subscriber calls and the peak bytes allocated per measurement.
+* ``formula[<metric>-<mode>]`` — one call of a calculator from
+  ``_METRIC_DEPS`` on the inputs of a real measurement.
+* ``profiles[<n>]`` — one measurement dispatched to ``n`` weight-range
+  profiles sharing the same scale sensors.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from itertools import cycle
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.bodymiscale.const import (
+    CONF_BIRTHDAY,
+    CONF_CALCULATION_MODE,
+    CONF_GENDER,
+    CONF_HEIGHT,
+    CONF_IMPEDANCE_MODE,
+    CONF_PROFILE_METHOD,
+    CONF_SENSOR_IMPEDANCE,
+    CONF_SENSOR_IMPEDANCE_HIGH,
+    CONF_SENSOR_IMPEDANCE_LOW,
+    CONF_SENSOR_WEIGHT,
+    CONF_WEIGHT_MAX,
+    CONF_WEIGHT_MIN,
+    DOMAIN,
+    IMPEDANCE_MODE_DUAL,
+    IMPEDANCE_MODE_NONE,
+    IMPEDANCE_MODE_STANDARD,
+    PROFILE_METHOD_NONE,
+    PROFILE_METHOD_WEIGHT,
+    SENSOR_DISPATCHER,
+    WEIGHT_RANGES,
+)
+from custom_components.bodymiscale.metrics import (
+    _EVALUATION_PLANS,
+    _METRIC_DEPS,
+    BodyScaleMetricsHandler,
+    _prepare_config,
+)
+from custom_components.bodymiscale.metrics.batch import (
+    MeasurementColumns,
+    compute_batch,
+)
+from custom_components.bodymiscale.metrics.dispatcher import SensorDispatcher
+from custom_components.bodymiscale.models import Gender, Metric
+from custom_components.bodymiscale.profile import WeightRangeIndex
+
+from .harness import Timing, measure_allocations
+
+pytestmark = pytest.mark.benchmark
+
+WEIGHT_SENSOR = "sensor.bench_weight"
+IMPEDANCE_SENSOR = "sensor.bench_impedance"
+IMPEDANCE_LOW_SENSOR = "sensor.bench_impedance_low"
+IMPEDANCE_HIGH_SENSOR = "sensor.bench_impedance_high"
+
+# Two alternating weighings, so every measurement changes the inputs and
+# runs the full recalculation instead of the unchanged-value shortcut.
+_WEIGHTS = ("72.15", "72.65")
+_IMPEDANCES = ("512", "508")
+_IMPEDANCES_LOW = ("480", "476")
+_IMPEDANCES_HIGH = ("530", "525")
+
+_MODE_SENSORS: dict[str, tuple[tuple[str, tuple[str, str]], ...]] = {
+    IMPEDANCE_MODE_NONE: ((WEIGHT_SENSOR, _WEIGHTS),),
+    IMPEDANCE_MODE_STANDARD: (
+        (WEIGHT_SENSOR, _WEIGHTS),
+        (IMPEDANCE_SENSOR, _IMPEDANCES),
+    ),
+    IMPEDANCE_MODE_DUAL: (
+        (WEIGHT_SENSOR, _WEIGHTS),
+        (IMPEDANCE_LOW_SENSOR, _IMPEDANCES_LOW),
+        (IMPEDANCE_HIGH_SENSOR, _IMPEDANCES_HIGH),
+    ),
+}
+
+
+def bench_config(
+    impedance_mode: str,
+    name: str = "Bench",
+    profile_method: str = PROFILE_METHOD_NONE,
+    **extra: Any,
+) -> dict[str, Any]:
+    """Return a profile config reading the benchmark sensors."""
+    config: dict[str, Any] = {
+        "name": name,
+        CONF_BIRTHDAY: "1988-05-14",
+        CONF_GENDER: Gender.MALE,
+        CONF_HEIGHT: 178.0,
+        CONF_CALCULATION_MODE: "xiaomi",
+        CONF_IMPEDANCE_MODE: impedance_mode,
+        CONF_PROFILE_METHOD: profile_method,
+        CONF_SENSOR_WEIGHT: WEIGHT_SENSOR,
+        **extra,
+    }
+    if impedance_mode == IMPEDANCE_MODE_STANDARD:
+        config[CONF_SENSOR_IMPEDANCE] = IMPEDANCE_SENSOR
+    elif impedance_mode == IMPEDANCE_MODE_DUAL:
+        config[CONF_SENSOR_IMPEDANCE_LOW] = IMPEDANCE_LOW_SENSOR
+        config[CONF_SENSOR_IMPEDANCE_HIGH] = IMPEDANCE_HIGH_SENSOR
+    return config
+
+
+def measurement_states(impedance_mode: str) -> Iterator[tuple[State, ...]]:
+    """Yield the sensor states of successive measurements, alternating values."""
+    sensors = _MODE_SENSORS[impedance_mode]
+    for index in cycle((0, 1)):
+        yield tuple(State(entity_id, values[index]) for entity_id, values in sensors)
+
+
+def subscribe_all(handler: BodyScaleMetricsHandler) -> list[int]:
+    """Subscribe a counting callback to every metric, like the sensor entities."""
+    calls = [0]
+
+    def _count(_value: Any) -> None:
+        calls[0] += 1
+
+    for metric in Metric:
+        handler.subscribe(metric, _count)
+    return calls
+
+
+def handler_measurement(
+    handler: BodyScaleMetricsHandler, impedance_mode: str
+) -> Callable[[], None]:
+    """Return a callable feeding one measurement to the handler."""
+    states = measurement_states(impedance_mode)
+
+    def _measure() -> None:
+        for state in next(states):
+            handler._state_changed(state.entity_id, state)
+
+    return _measure
+
+
+@pytest.mark.parametrize(
+    "impedance_mode",
+    [IMPEDANCE_MODE_NONE, IMPEDANCE_MODE_STANDARD, IMPEDANCE_MODE_DUAL],
+)
+async def test_bench_handler_measurement(
+    hass: HomeAssistant, bench: Callable[..., Timing], impedance_mode: str
+) -> None:
+    """Per-measurement latency of the handler, end to end."""
+    handler = BodyScaleMetricsHandler(
+        hass, bench_config(impedance_mode), config_entry_id="bench"
+    )
+    calls = subscribe_all(handler)
+    measure_once = handler_measurement(handler, impedance_mode)
+    measure_once()
+
+    # Counters over both alternating weighings, then one traced measurement.
+    before = calls[0]
+    measure_once()
+    measure_once()
+    subscriber_calls = (calls[0] - before) / 2
+    alloc_bytes = measure_allocations(measure_once)
+
+    timing = bench(
+        f"handler[{impedance_mode}]",
+        measure_once,
+        subscriber_calls=subscriber_calls,
+        alloc_bytes=alloc_bytes,
+    )
+
+    assert subscriber_calls > 0
+    assert timing.median_ns > 0
+    handler.unload()
+
+
+def _formula_cases() -> Iterator[Any]:
+    """Yield every calculator reachable in each impedance mode."""
+    for impedance_mode in (IMPEDANCE_MODE_STANDARD, IMPEDANCE_MODE_DUAL):
+        for metric in _EVALUATION_PLANS[impedance_mode].full:
+            yield pytest.param(
+                metric, impedance_mode, id=f"{metric.value}-{impedance_mode}"
+            )
+
+
+@pytest.mark.parametrize(("metric", "impedance_mode"), _formula_cases())
+def test_bench_formula(
+    bench: Callable[..., Timing], metric: Metric, impedance_mode: str
+) -> None:
+    """Throughput of one calculator on the inputs of a real measurement."""
+    config = bench_config(impedance_mode)
+    columns = MeasurementColumns(
+        weight=[float(_WEIGHTS[0])],
+        impedance=[float(_IMPEDANCES[0])],
+        impedance_low=[float(_IMPEDANCES_LOW[0])],
+        impedance_high=[float(_IMPEDANCES_HIGH[0])],
+        age=[37],
+    )
+    metrics: dict[Metric, Any] = {
+        Metric.AGE: 37.0,
+        Metric.WEIGHT: float(_WEIGHTS[0]),
+        Metric.IMPEDANCE: float(_IMPEDANCES[0]),
+        Metric.IMPEDANCE_LOW: float(_IMPEDANCES_LOW[0]),
+        Metric.IMPEDANCE_HIGH: float(_IMPEDANCES_HIGH[0]),
+    }
+    metrics.update(
+        {m: values[0] for m, values in compute_batch(config, columns).items()}
+    )
+    prepared = _prepare_config(config)
+    calculate = _METRIC_DEPS[metric].calculate
+
+    timing = bench(
+        f"formula[{metric.value}-{impedance_mode}]",
+        lambda: calculate(prepared, metrics),
+        rounds=200,
+        warmup=200,
+        number=50,
+        # Sub-microsecond calls are too sensitive to the machine load to
+        # gate; the handler cases cover them end to end.
+        gate=False,
+        module=calculate.__module__.rsplit(".", 1)[-1],
+    )
+
+    assert calculate(prepared, metrics) is not None
+    assert timing.median_ns > 0
+
+
+@pytest.mark.parametrize("profiles", [1, 10, 100])
+async def test_bench_shared_scale_profiles(
+    hass: HomeAssistant, bench: Callable[..., Timing], profiles: int
+) -> None:
+    """Per-measurement latency with many profiles on the same scale."""
+    dispatcher = SensorDispatcher(hass)
+    hass.data[DOMAIN] = {
+        SENSOR_DISPATCHER: dispatcher,
+        WEIGHT_RANGES: WeightRangeIndex(),
+    }
+    # Non-overlapping ranges between 20 and 200 kg; the benchmark weights
+    # fall in exactly one of them.
+    width = 180.0 / profiles
+    handlers = [
+        BodyScaleMetricsHandler(
+            hass,
+            bench_config(
+                IMPEDANCE_MODE_STANDARD,
+                name=f"Bench {index}",
+                profile_method=PROFILE_METHOD_WEIGHT,
+                **{
+                    CONF_WEIGHT_MIN: 20.0 + index * width,
+                    CONF_WEIGHT_MAX: 20.0 + (index + 1) * width - 0.01,
+                },
+            ),
+            config_entry_id=f"bench_{index}",
+        )
+        for index in range(profiles)
+    ]
+    calls = [subscribe_all(handler) for handler in handlers]
+    states = measurement_states(IMPEDANCE_MODE_STANDARD)
+
+    def _measure() -> None:
+        for state in next(states):
+            dispatcher._dispatch(state.entity_id, state)
+
+    timing = bench(f"profiles[{profiles}]", _measure, rounds=100, warmup=10)
+
+    assert sum(count[0] for count in calls) > 0
+    assert timing.median_ns > 0
+    for handler in handlers:
+        handler.unload()
+    dispatcher.unload()
+    hass.data.pop(DOMAIN)
@@ -0,0 +1,158 @@
+"""Tests for bodymiscale metrics/batch.py (columnar history computation)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.bodymiscale.const import (
+    ALGO_SCIENCE,
+    ALGO_XIAOMI,
+    CONF_BIRTHDAY,
+    CONF_CALCULATION_MODE,
+    CONF_GENDER,
+    CONF_HEIGHT,
+    CONF_IMPEDANCE_MODE,
+    CONF_SENSOR_IMPEDANCE,
+    CONF_SENSOR_IMPEDANCE_HIGH,
+    CONF_SENSOR_IMPEDANCE_LOW,
+    CONF_SENSOR_WEIGHT,
+    IMPEDANCE_MODE_DUAL,
+    IMPEDANCE_MODE_NONE,
+    IMPEDANCE_MODE_STANDARD,
+)
+from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.metrics.batch import (
+    BATCH_METRICS,
+    MeasurementColumns,
+    compute_batch,
+)
+from custom_components.bodymiscale.models import Gender, Metric
+
+_WEIGHTS = [58.4, 72.15, 95.0]
+_IMPEDANCES = [455.0, 512.0, 610.0]
+_IMPEDANCES_LOW = [430.0, 480.0, 520.0]
+_IMPEDANCES_HIGH = [470.0, 530.0, 575.0]
+
+
+def _make_config(calculation_mode: str, impedance_mode: str) -> dict[str, Any]:
+    return {
+        "name": "Batch",
+        CONF_BIRTHDAY: "1988-04-02",
+        CONF_GENDER: Gender.MALE,
+        CONF_HEIGHT: 178,
+        CONF_CALCULATION_MODE: calculation_mode,
+        CONF_IMPEDANCE_MODE: impedance_mode,
+        CONF_SENSOR_WEIGHT: "sensor.batch_weight",
+        CONF_SENSOR_IMPEDANCE: "sensor.batch_imp",
+        CONF_SENSOR_IMPEDANCE_LOW: "sensor.batch_imp_low",
+        CONF_SENSOR_IMPEDANCE_HIGH: "sensor.batch_imp_high",
+    }
+
+
+# ===========================================================================
+# compute_batch — parity with the live handler
+# ===========================================================================
+
+
+@pytest.mark.parametrize("calculation_mode", [ALGO_XIAOMI, ALGO_SCIENCE])
+@pytest.mark.parametrize(
+    "impedance_mode",
+    [IMPEDANCE_MODE_NONE, IMPEDANCE_MODE_STANDARD, IMPEDANCE_MODE_DUAL],
+)
+async def test_compute_batch_matches_handler(
+    hass: HomeAssistant, calculation_mode: str, impedance_mode: str
+) -> None:
+    """Every batch value must be bit-identical to a fresh handler's result."""
+    config = _make_config(calculation_mode, impedance_mode)
+    results = compute_batch(
+        config,
+        MeasurementColumns(
+            weight=_WEIGHTS,
+            impedance=_IMPEDANCES,
+            impedance_low=_IMPEDANCES_LOW,
+            impedance_high=_IMPEDANCES_HIGH,
+        ),
+    )
+
+    for row, weight in enumerate(_WEIGHTS):
+        handler = BodyScaleMetricsHandler(hass, config, config_entry_id=f"e{row}")
+        hass.states.async_set("sensor.batch_weight", str(weight))
+        if impedance_mode == IMPEDANCE_MODE_STANDARD:
+            hass.states.async_set("sensor.batch_imp", str(_IMPEDANCES[row]))
+        elif impedance_mode == IMPEDANCE_MODE_DUAL:
+            hass.states.async_set("sensor.batch_imp_low", str(_IMPEDANCES_LOW[row]))
+            hass.states.async_set("sensor.batch_imp_high", str(_IMPEDANCES_HIGH[row]))
+        await hass.async_block_till_done()
+
+        if impedance_mode != IMPEDANCE_MODE_NONE:
+            assert Metric.BODY_SCORE in handler._available_metrics
+        for metric in BATCH_METRICS:
+            assert results[metric][row] == handler._available_metrics.get(metric), (
+                metric
+            )
+        handler.unload()
+        for entity_id in (
+            "sensor.batch_weight",
+            "sensor.batch_imp",
+            "sensor.batch_imp_low",
+            "sensor.batch_imp_high",
+        ):
+            hass.states.async_remove(entity_id)
+
+
+# ===========================================================================
+# compute_batch — columns
+# ===========================================================================
+
+
+def test_compute_batch_missing_readings_yield_none() -> None:
+    """Rows without weight or impedance must leave the dependent metrics empty."""
+    config = _make_config(ALGO_XIAOMI, IMPEDANCE_MODE_STANDARD)
+    results = compute_batch(
+        config,
+        MeasurementColumns(weight=[70.0, None], impedance=[None, 500.0]),
+    )
+
+    assert results[Metric.BMI][0] is not None
+    assert results[Metric.FAT_PERCENTAGE][0] is None
+    assert all(values[1] is None for values in results.values())
+
+
+def test_compute_batch_none_mode_skips_impedance_metrics() -> None:
+    """Without impedance mode, impedance columns must be ignored."""
+    config = _make_config(ALGO_XIAOMI, IMPEDANCE_MODE_NONE)
+    results = compute_batch(
+        config, MeasurementColumns(weight=[70.0], impedance=[500.0])
+    )
+
+    assert results[Metric.BMI][0] is not None
+    assert results[Metric.LBM][0] is None
+    assert results[Metric.BODY_SCORE][0] is None
+
+
+def test_compute_batch_age_from_timestamps() -> None:
+    """Age must be taken at each measurement time when timestamps are given."""
+    config = _make_config(ALGO_XIAOMI, IMPEDANCE_MODE_NONE)
+    timestamps = [
+        datetime(2008, 1, 1, tzinfo=UTC),
+        datetime(2025, 1, 1, tzinfo=UTC),
+    ]
+    by_time = compute_batch(
+        config, MeasurementColumns(weight=[70.0, 70.0], timestamps=timestamps)
+    )
+    by_age = compute_batch(
+        config, MeasurementColumns(weight=[70.0, 70.0], age=[19, 36])
+    )
+
+    assert by_time == by_age
+    assert by_time[Metric.BMR][0] != by_time[Metric.BMR][1]
+
+
+def test_measurement_columns_length_mismatch_raises() -> None:
+    """Columns shorter or longer than the weight column must be rejected."""
+    with pytest.raises(ValueError, match="impedance"):
+        MeasurementColumns(weight=[70.0, 71.0], impedance=[500.0])
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import patch
 
+import pytest
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
@@ -27,8 +29,10 @@ from custom_components.bodymiscale.const import (
     CONF_SENSOR_IMPEDANCE_LOW,
     CONF_SENSOR_PROFILE_ID,
     CONF_SENSOR_WEIGHT,
+    CONF_SETTLE_WINDOW,
     CONF_WEIGHT_MAX,
     CONF_WEIGHT_MIN,
+    CONF_WRITE_WINDOW,
     DOMAIN,
     IMPEDANCE_MODE_DUAL,
     IMPEDANCE_MODE_NONE,
@@ -40,6 +44,7 @@ from custom_components.bodymiscale.const import (
     PROFILE_METHOD_WEIGHT,
 )
 from custom_components.bodymiscale.models import Gender
+from custom_components.bodymiscale.profile import WeightRangeIndex
 
 # ---------------------------------------------------------------------------
 # Shared step data helpers
@@ -496,6 +501,38 @@ async def test_flow_profile_weight_range_overlap(hass: HomeAssistant) -> None:
     assert result["errors"].get("base") == "weight_range_overlap"
 
 
+@pytest.mark.parametrize(
+    "names",
+    [
+        pytest.param((None, "Bob"), id="unnamed"),
+        pytest.param(("carol", "Carol"), id="names_differing_in_case"),
+    ],
+)
+async def test_flow_profile_weight_range_overlap_every_entry(
+    hass: HomeAssistant, names: tuple[str | None, str]
+) -> None:
+    """Every existing range counts, even unnamed or sharing a name's case."""
+    for name, (w_min, w_max) in zip(names, ((50.0, 65.0), (80.0, 100.0)), strict=True):
+        data: dict[str, Any] = {
+            CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+            CONF_WEIGHT_MIN: w_min,
+            CONF_WEIGHT_MAX: w_max,
+        }
+        if name is not None:
+            data["name"] = name
+        MockConfigEntry(
+            domain=DOMAIN, title=name or "legacy", data=data, version=4
+        ).add_to_hass(hass)
+
+    result = await _reach_profile_step(hass, PROFILE_METHOD_WEIGHT)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_WEIGHT_MIN: 55.0, CONF_WEIGHT_MAX: 60.0},  # overlaps 50-65
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"].get("base") == "weight_range_overlap"
+
+
 async def test_flow_profile_notify_weight_min_too_high(hass: HomeAssistant) -> None:
     """Notify weight_min above constraint → error 'weight_limit'."""
     result = await _reach_profile_step(hass, PROFILE_METHOD_NOTIFY)
@@ -692,6 +729,26 @@ def test_get_profile_schema_none_method_returns_none() -> None:
     assert _get_profile_schema(PROFILE_METHOD_NONE, {}) is None
 
 
+def test_get_sensors_schema_settle_window_only_with_impedance() -> None:
+    """The settle window must only be offered when impedance is expected."""
+    from custom_components.bodymiscale.config_flow import _get_sensors_schema
+
+    standard = _get_sensors_schema(IMPEDANCE_MODE_STANDARD, PROFILE_METHOD_NONE, {})
+    none = _get_sensors_schema(IMPEDANCE_MODE_NONE, PROFILE_METHOD_NONE, {})
+
+    assert CONF_SETTLE_WINDOW in standard.schema
+    assert CONF_SETTLE_WINDOW not in none.schema
+
+
+def test_get_sensors_schema_offers_write_window() -> None:
+    """The state write window applies to every impedance mode."""
+    from custom_components.bodymiscale.config_flow import _get_sensors_schema
+
+    for mode in (IMPEDANCE_MODE_NONE, IMPEDANCE_MODE_STANDARD):
+        schema = _get_sensors_schema(mode, PROFILE_METHOD_NONE, {})
+        assert CONF_WRITE_WINDOW in schema.schema
+
+
 def test_get_profile_schema_unknown_method_returns_none() -> None:
     """An unrecognized method must fall through to None (defensive branch)."""
     from custom_components.bodymiscale.config_flow import _get_profile_schema
@@ -790,7 +847,7 @@ def test_validate_weight_missing_min_or_max() -> None:
     from custom_components.bodymiscale.config_flow import _validate_weight
 
     errors: dict[str, str] = {}
-    _validate_weight({CONF_WEIGHT_MAX: 80.0}, errors, [])
+    _validate_weight({CONF_WEIGHT_MAX: 80.0}, errors, WeightRangeIndex())
     assert errors["base"] == "weight_range_invalid"
 
 
@@ -799,7 +856,9 @@ def test_validate_weight_min_too_high() -> None:
     from custom_components.bodymiscale.config_flow import _validate_weight
 
     errors: dict[str, str] = {}
-    _validate_weight({CONF_WEIGHT_MIN: 5000.0, CONF_WEIGHT_MAX: 5001.0}, errors, [])
+    _validate_weight(
+        {CONF_WEIGHT_MIN: 5000.0, CONF_WEIGHT_MAX: 5001.0}, errors, WeightRangeIndex()
+    )
     assert errors[CONF_WEIGHT_MIN] == "weight_limit"
 
 
@@ -808,7 +867,9 @@ def test_validate_weight_max_too_low() -> None:
     from custom_components.bodymiscale.config_flow import _validate_weight
 
     errors: dict[str, str] = {}
-    _validate_weight({CONF_WEIGHT_MIN: -5.0, CONF_WEIGHT_MAX: 0.0}, errors, [])
+    _validate_weight(
+        {CONF_WEIGHT_MIN: -5.0, CONF_WEIGHT_MAX: 0.0}, errors, WeightRangeIndex()
+    )
     assert errors[CONF_WEIGHT_MAX] == "weight_low"
 
 
@@ -817,7 +878,9 @@ def test_validate_weight_max_too_high() -> None:
     from custom_components.bodymiscale.config_flow import _validate_weight
 
     errors: dict[str, str] = {}
-    _validate_weight({CONF_WEIGHT_MIN: 50.0, CONF_WEIGHT_MAX: 5000.0}, errors, [])
+    _validate_weight(
+        {CONF_WEIGHT_MIN: 50.0, CONF_WEIGHT_MAX: 5000.0}, errors, WeightRangeIndex()
+    )
     assert errors[CONF_WEIGHT_MAX] == "weight_limit"
 
 
@@ -0,0 +1,83 @@
+"""Tests for bodymiscale diagnostics.py."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bodymiscale.const import (
+    CONF_BIRTHDAY,
+    CONF_SENSOR_WEIGHT,
+    DOMAIN,
+    HANDLERS,
+    NOTIFICATION_COORDINATOR,
+    PROFILE_ID_ROUTER,
+    SENSOR_DISPATCHER,
+    WRITE_SCHEDULER,
+)
+from custom_components.bodymiscale.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.bodymiscale.entity import StateWriteScheduler
+from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.metrics.dispatcher import SensorDispatcher
+from custom_components.bodymiscale.profile import ProfileIdRouter
+
+
+async def test_diagnostics_report_handler_counters(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Diagnostics must expose the handler counters and the domain objects."""
+    dispatcher = SensorDispatcher(hass)
+    hass.data[DOMAIN] = {
+        HANDLERS: {},
+        NOTIFICATION_COORDINATOR: None,
+        WRITE_SCHEDULER: StateWriteScheduler(hass),
+        PROFILE_ID_ROUTER: ProfileIdRouter(hass),
+        SENSOR_DISPATCHER: dispatcher,
+    }
+    config = {**mock_config_entry.data, **mock_config_entry.options}
+    handler = BodyScaleMetricsHandler(hass, config, mock_config_entry.entry_id)
+    hass.data[DOMAIN][HANDLERS][mock_config_entry.entry_id] = handler
+
+    hass.states.async_set(config[CONF_SENSOR_WEIGHT], "70.0")
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["entry"]["options"][CONF_BIRTHDAY] == "**REDACTED**"
+    stats = diagnostics["handler"]
+    assert stats["passes"] >= 1
+    assert stats["computed"] >= 1
+    assert stats["pass_duration_ms"]["samples"] == stats["passes"]
+    assert stats["pass_duration_ms"]["p95"] >= stats["pass_duration_ms"]["p50"]
+    assert stats["rejections"] == {}
+    # No main entity wrote the cycle yet.
+    assert stats["last_cycle_latency"] is None
+    assert diagnostics["domain"]["profiles"] == 1
+    assert diagnostics["domain"]["tracked_sensors"] == [config[CONF_SENSOR_WEIGHT]]
+    assert diagnostics["domain"]["state_writes"]["pending"] == 0
+    assert "notifications" not in diagnostics["domain"]
+
+    handler.cycle_written()
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+    assert set(diagnostics["handler"]["last_cycle_latency"]) == {
+        "ingest",
+        "filter",
+        "compute",
+        "publish",
+    }
+
+    handler.unload()
+    dispatcher.unload()
+    hass.data.pop(DOMAIN)
+
+
+async def test_diagnostics_without_loaded_handler(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Diagnostics of an entry that is not loaded must not fail."""
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["handler"] is None
+    assert diagnostics["domain"] == {"profiles": 0}
@@ -0,0 +1,213 @@
+"""Tests for bodymiscale metrics/dispatcher.py (shared sensor listeners)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_REPORTED,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.bodymiscale.const import (
+    CONF_BIRTHDAY,
+    CONF_CALCULATION_MODE,
+    CONF_GENDER,
+    CONF_HEIGHT,
+    CONF_IMPEDANCE_MODE,
+    CONF_SENSOR_WEIGHT,
+    DOMAIN,
+    IMPEDANCE_MODE_NONE,
+    SENSOR_DISPATCHER,
+    UNIT_POUNDS,
+)
+from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.metrics.dispatcher import (
+    SensorDispatcher,
+    SensorReading,
+    parse_impedance,
+    parse_weight,
+)
+from custom_components.bodymiscale.models import Gender, Metric
+
+# ===========================================================================
+# parse_weight / parse_impedance
+# ===========================================================================
+
+
+def test_parse_weight_normalizes_pounds() -> None:
+    """A weight in pounds must be converted to kilograms."""
+    reading = parse_weight(
+        State("sensor.w", "154.32", {ATTR_UNIT_OF_MEASUREMENT: UNIT_POUNDS})
+    )
+    assert reading.value is not None
+    assert round(reading.value, 2) == 70.0
+    assert reading.problem is None
+
+
+def test_parse_weight_problems_and_resets() -> None:
+    """Unusable weights must carry the problem and reset flags."""
+    assert parse_weight(State("sensor.w", STATE_UNAVAILABLE)) == SensorReading()
+    assert parse_weight(State("sensor.w", "abc")) == SensorReading(
+        problem="invalid_format"
+    )
+    assert parse_weight(State("sensor.w", "0")) == SensorReading(reset=True)
+    assert parse_weight(State("sensor.w", "2")) == SensorReading(
+        problem="low", reset=True
+    )
+    assert parse_weight(State("sensor.w", "500")) == SensorReading(problem="high")
+
+
+def test_parse_impedance_problems() -> None:
+    """Impedance readings out of range must report a problem, zero is silent."""
+    assert parse_impedance(State("sensor.i", "500")) == SensorReading(value=500.0)
+    assert parse_impedance(State("sensor.i", "0")) == SensorReading()
+    assert parse_impedance(State("sensor.i", "10")) == SensorReading(problem="low")
+    assert parse_impedance(State("sensor.i", "5000")) == SensorReading(problem="high")
+
+
+# ===========================================================================
+# SensorDispatcher
+# ===========================================================================
+
+
+async def test_dispatcher_parses_once_for_every_subscriber(
+    hass: HomeAssistant,
+) -> None:
+    """One event must be parsed once and delivered to each subscriber."""
+    dispatcher = SensorDispatcher(hass)
+    parsed: list[str] = []
+
+    def _parser(state: State) -> SensorReading:
+        parsed.append(state.state)
+        return parse_weight(state)
+
+    received: list[tuple[str, Any]] = []
+    for name in ("alice", "bob", "carol"):
+        dispatcher.subscribe(
+            "sensor.shared_weight",
+            lambda entity_id, state, reading, name=name: received.append(
+                (name, reading)
+            ),
+            _parser,
+        )
+    assert dispatcher.tracked_entities == {"sensor.shared_weight"}
+
+    hass.states.async_set("sensor.shared_weight", "70.0")
+    await hass.async_block_till_done()
+
+    assert parsed == ["70.0"]
+    assert [name for name, _reading in received] == ["alice", "bob", "carol"]
+    assert {reading.value for _name, reading in received} == {70.0}
+    dispatcher.unload()
+
+
+async def test_dispatcher_isolates_failing_subscriber(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A subscriber that raises must not keep the reading from the others."""
+    dispatcher = SensorDispatcher(hass)
+    received: list[Any] = []
+
+    def _failing(entity_id: str, state: State, reading: Any) -> None:
+        raise RuntimeError("boom")
+
+    dispatcher.subscribe("sensor.shared_failing", _failing, parse_weight)
+    dispatcher.subscribe(
+        "sensor.shared_failing",
+        lambda entity_id, state, reading: received.append(reading),
+        parse_weight,
+    )
+
+    hass.states.async_set("sensor.shared_failing", "70.0")
+    await hass.async_block_till_done()
+
+    assert [reading.value for reading in received] == [70.0]
+    assert "subscriber of sensor.shared_failing failed" in caplog.text
+    dispatcher.unload()
+
+
+async def test_dispatcher_stabilized_subscribers_skip_state_reported(
+    hass: HomeAssistant,
+) -> None:
+    """state_reported must only reach measurement subscribers."""
+    hass.states.async_set("sensor.shared_reported", "70.0")
+    dispatcher = SensorDispatcher(hass)
+    measurement: list[Any] = []
+    stabilized: list[Any] = []
+    dispatcher.subscribe(
+        "sensor.shared_reported",
+        lambda entity_id, state, reading: measurement.append(reading),
+        parse_weight,
+    )
+    dispatcher.subscribe(
+        "sensor.shared_reported",
+        lambda entity_id, state, reading: stabilized.append(reading),
+        reported=False,
+    )
+
+    hass.bus.async_fire(EVENT_STATE_REPORTED, {"entity_id": "sensor.shared_reported"})
+    await hass.async_block_till_done()
+
+    assert len(measurement) == 1
+    assert stabilized == []
+    dispatcher.unload()
+
+
+async def test_dispatcher_stops_tracking_after_last_unsubscribe(
+    hass: HomeAssistant,
+) -> None:
+    """An entity must stay tracked until its last subscriber leaves."""
+    dispatcher = SensorDispatcher(hass)
+    received: list[Any] = []
+    remove_first = dispatcher.subscribe(
+        "sensor.shared_unsub", lambda *args: received.append(args), parse_weight
+    )
+    remove_second = dispatcher.subscribe(
+        "sensor.shared_unsub", lambda *args: received.append(args), parse_weight
+    )
+
+    remove_first()
+    assert dispatcher.tracked_entities == {"sensor.shared_unsub"}
+    remove_second()
+    assert dispatcher.tracked_entities == frozenset()
+
+    hass.states.async_set("sensor.shared_unsub", "70.0")
+    await hass.async_block_till_done()
+    assert received == []
+
+
+async def test_handlers_share_the_domain_dispatcher(hass: HomeAssistant) -> None:
+    """Profiles on the same scale must share one listener per sensor."""
+    dispatcher = SensorDispatcher(hass)
+    hass.data[DOMAIN] = {SENSOR_DISPATCHER: dispatcher}
+    handlers = [
+        BodyScaleMetricsHandler(
+            hass,
+            {
+                "name": name,
+                CONF_BIRTHDAY: "1990-01-15",
+                CONF_GENDER: Gender.FEMALE,
+                CONF_HEIGHT: 165.0,
+                CONF_CALCULATION_MODE: "xiaomi",
+                CONF_IMPEDANCE_MODE: IMPEDANCE_MODE_NONE,
+                CONF_SENSOR_WEIGHT: "sensor.household_weight",
+            },
+            config_entry_id=name,
+        )
+        for name in ("Alice", "Bob")
+    ]
+    assert dispatcher.tracked_entities == {"sensor.household_weight"}
+
+    hass.states.async_set("sensor.household_weight", "70.0")
+    await hass.async_block_till_done()
+    assert [h.current_weight for h in handlers] == [70.0, 70.0]
+    assert all(Metric.BMI in h._available_metrics for h in handlers)
+
+    for handler in handlers:
+        handler.unload()
+    assert dispatcher.tracked_entities == frozenset()
+    hass.data.pop(DOMAIN)
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock
 
 import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.bodymiscale.entity import BodyScaleBaseEntity
+from custom_components.bodymiscale.const import (
+    CONF_WRITE_WINDOW,
+    DOMAIN,
+    UPDATE_DELAY,
+    WRITE_SCHEDULER,
+)
+from custom_components.bodymiscale.entity import (
+    BodyScaleBaseEntity,
+    StateWriteScheduler,
+)
 from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
 
 # ---------------------------------------------------------------------------
@@ -42,3 +56,136 @@ def test_entity_description_missing_raises() -> None:
 
     with pytest.raises(ValueError, match="entity_description"):
         _BadEntity(handler)
+
+
+def _make_entity(key: str = "bmi") -> BodyScaleBaseEntity:
+    entity = BodyScaleBaseEntity(_make_handler(), EntityDescription(key=key))
+    entity.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
+    return entity
+
+
+# ===========================================================================
+# StateWriteScheduler
+# ===========================================================================
+
+
+async def test_scheduler_coalesces_writes_into_one_flush(hass: HomeAssistant) -> None:
+    """Entities queued within the window must be written by a single flush."""
+    scheduler = StateWriteScheduler(hass, window=1.0)
+    first, second = _make_entity("bmi"), _make_entity("weight")
+
+    scheduler.schedule(first)
+    scheduler.schedule(second)
+    scheduler.schedule(first)
+    assert scheduler.pending == 2
+    first.async_write_ha_state.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    first.async_write_ha_state.assert_called_once()
+    second.async_write_ha_state.assert_called_once()
+    assert scheduler.pending == 0
+    assert scheduler.flushes == 1
+    assert scheduler.entities_written == 2
+    assert scheduler.last_flush_size == 2
+    assert scheduler.largest_flush == 2
+
+
+async def test_scheduler_shorter_window_brings_flush_forward(
+    hass: HomeAssistant,
+) -> None:
+    """A write with a shorter window must not wait for a longer one."""
+    scheduler = StateWriteScheduler(hass, window=5.0)
+    slow, fast = _make_entity("bmi"), _make_entity("weight")
+
+    scheduler.schedule(slow)
+    scheduler.schedule(fast, 0.5)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    slow.async_write_ha_state.assert_called_once()
+    fast.async_write_ha_state.assert_called_once()
+    assert scheduler.flushes == 1
+
+    # A longer window never delays a flush already due sooner.
+    scheduler.schedule(fast, 0.5)
+    scheduler.schedule(slow)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert scheduler.flushes == 2
+
+
+async def test_scheduler_flush_of_one_owner_keeps_the_others_queued(
+    hass: HomeAssistant,
+) -> None:
+    """Flushing a profile must leave the other profiles' writes to their window."""
+    scheduler = StateWriteScheduler(hass, window=1.0)
+    alice, bob = _make_entity("bmi"), _make_entity("weight")
+
+    scheduler.schedule(alice, owner="entry_alice")
+    scheduler.schedule(bob, owner="entry_bob")
+    scheduler.flush("entry_alice")
+
+    alice.async_write_ha_state.assert_called_once()
+    bob.async_write_ha_state.assert_not_called()
+    assert scheduler.pending == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    bob.async_write_ha_state.assert_called_once()
+    assert scheduler.pending == 0
+    assert scheduler.flushes == 2
+
+
+async def test_scheduler_discard_and_unload_drop_queued_writes(
+    hass: HomeAssistant,
+) -> None:
+    """Discarded entities and writes queued at unload must never be written."""
+    scheduler = StateWriteScheduler(hass, window=1.0)
+    removed, kept = _make_entity("bmi"), _make_entity("weight")
+
+    scheduler.schedule(removed)
+    scheduler.schedule(kept)
+    scheduler.discard(removed)
+    scheduler.flush()
+
+    removed.async_write_ha_state.assert_not_called()
+    kept.async_write_ha_state.assert_called_once()
+
+    scheduler.schedule(kept)
+    scheduler.unload()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert kept.async_write_ha_state.call_count == 1
+    assert scheduler.flushes == 1
+
+
+async def test_schedule_write_without_scheduler_writes_now(
+    hass: HomeAssistant,
+) -> None:
+    """Outside a set-up config entry, the write must happen immediately."""
+    entity = _make_entity()
+    entity.hass = hass
+
+    entity.async_schedule_write()
+    entity.async_write_ha_state.assert_called_once()
+
+    scheduler = StateWriteScheduler(hass)
+    hass.data[DOMAIN] = {WRITE_SCHEDULER: scheduler}
+    entity.async_schedule_write()
+    assert scheduler.pending == 1
+    assert entity.async_write_ha_state.call_count == 1
+
+    scheduler.unload()
+    hass.data.pop(DOMAIN)
+
+
+def test_entity_write_window_from_profile_options() -> None:
+    """The write window must come from the profile options, 2 s by default."""
+    handler = _make_handler()
+    entity = BodyScaleBaseEntity(handler, EntityDescription(key="bmi"))
+    assert entity.write_window == UPDATE_DELAY
+
+    handler.config[CONF_WRITE_WINDOW] = 0.5
+    assert entity.write_window == 0.5
@@ -0,0 +1,319 @@
+"""Tests for bodymiscale history.py and stats.py (recompute_history service)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from pytest_homeassistant_custom_component.typing import RecorderInstanceGenerator
+
+from custom_components.bodymiscale.const import (
+    CONF_BIRTHDAY,
+    CONF_CALCULATION_MODE,
+    CONF_GENDER,
+    CONF_HEIGHT,
+    CONF_IMPEDANCE_MODE,
+    CONF_SENSOR_IMPEDANCE,
+    CONF_SENSOR_WEIGHT,
+    DOMAIN,
+    HANDLERS,
+    IMPEDANCE_MODE_STANDARD,
+    SERVICE_RECOMPUTE_HISTORY,
+)
+from custom_components.bodymiscale.history import (
+    MEASUREMENT_WINDOW,
+    _build_columns,
+    _measurement_times,
+    _Series,
+    async_recompute_history,
+    async_setup_services,
+    async_unload_services,
+)
+from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.models import Gender, Metric
+from custom_components.bodymiscale.stats import hourly_statistics, statistic_id
+
+_T0 = datetime(2026, 3, 2, 7, 15, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Allow the recorder to be set up before the hass fixture."""
+
+
+def _state(entity_id: str, value: str, when: datetime) -> State:
+    return State(entity_id, value, last_changed=when, last_updated=when)
+
+
+# ===========================================================================
+# stats — statistic ids and hourly aggregation
+# ===========================================================================
+
+
+def test_statistic_id_is_slugified() -> None:
+    """The profile name must be slugified into an external statistic id."""
+    assert statistic_id("Jean Pierre", Metric.BMI) == "bodymiscale:jean_pierre_bmi"
+
+
+def test_hourly_statistics_groups_by_hour() -> None:
+    """Measurements of the same hour must be merged into mean/min/max."""
+    rows = hourly_statistics(
+        [_T0, _T0 + timedelta(minutes=20), _T0 + timedelta(hours=2)],
+        [70.0, 72.0, 71.0],
+    )
+
+    assert [row["start"] for row in rows] == [
+        _T0.replace(minute=0),
+        _T0.replace(minute=0) + timedelta(hours=2),
+    ]
+    assert rows[0]["mean"] == 71.0
+    assert rows[0]["min"] == 70.0
+    assert rows[0]["max"] == 72.0
+    assert rows[1]["mean"] == 71.0
+
+
+def test_hourly_statistics_skips_missing_values() -> None:
+    """Rows where a metric could not be computed must be ignored."""
+    assert hourly_statistics([_T0, _T0], [None, "thin"]) == []
+
+
+# ===========================================================================
+# history — pairing helpers
+# ===========================================================================
+
+
+def test_series_value_at_returns_latest_earlier_value() -> None:
+    """value_at must return the last value recorded at or before the time."""
+    series = _Series.from_states(
+        [
+            _state("sensor.w", "70.0", _T0),
+            _state("sensor.w", "unavailable", _T0 + timedelta(minutes=1)),
+            _state("sensor.w", "71.5", _T0 + timedelta(days=1)),
+        ]
+    )
+
+    assert series.value_at(_T0 - timedelta(seconds=1)) is None
+    assert series.value_at(_T0 + timedelta(hours=3)) == 70.0
+    assert series.value_at(_T0 + timedelta(days=2)) == 71.5
+
+
+def test_measurement_times_merges_close_stamps_and_clips_window() -> None:
+    """Double stamps of one cycle and times outside the window are dropped."""
+    start = _T0 - timedelta(hours=1)
+    end = _T0 + timedelta(days=1)
+    states = [
+        # State at the window start — an older measurement.
+        _state("sensor.t", (start - timedelta(days=3)).isoformat(), start),
+        _state("sensor.t", _T0.isoformat(), _T0),
+        _state(
+            "sensor.t",
+            (_T0 + timedelta(seconds=5)).isoformat(),
+            _T0 + timedelta(seconds=5),
+        ),
+        _state("sensor.t", "unknown", _T0 + timedelta(hours=1)),
+        _state("sensor.t", end.isoformat(), end),
+    ]
+
+    assert _measurement_times(states, start, end, None) == [_T0]
+    assert _measurement_times(states, start, end, _T0 - timedelta(seconds=1)) == []
+
+
+def test_build_columns_pairs_impedance_recorded_after_weight() -> None:
+    """Impedance recorded within the window after the stamp belongs to it."""
+    weight = _Series([_T0], [80.0])
+    impedance = _Series([_T0 + timedelta(seconds=8)], [510.0])
+
+    columns = _build_columns(
+        [_T0, _T0 + timedelta(days=1)],
+        {Metric.WEIGHT: weight, Metric.IMPEDANCE: impedance},
+    )
+
+    assert list(columns.weight) == [80.0, 80.0]
+    # The same readings the next day record no new state.
+    assert list(columns.impedance or []) == [510.0, 510.0]
+    assert columns.impedance_low is None
+
+
+def test_build_columns_pairs_impedance_recorded_before_stamp() -> None:
+    """The stamp may follow its impedance; an unchanged one is kept."""
+    first = _T0
+    second = _T0 + MEASUREMENT_WINDOW + timedelta(seconds=20)
+    impedance = _Series(
+        [first - timedelta(seconds=2), first + timedelta(seconds=10)], [505.0, 510.0]
+    )
+
+    columns = _build_columns(
+        [first, second],
+        {Metric.WEIGHT: _Series([_T0], [80.0]), Metric.IMPEDANCE: impedance},
+    )
+
+    assert list(columns.impedance or []) == [510.0, 510.0]
+
+
+def test_build_columns_ignores_readings_after_window() -> None:
+    """A reading recorded after the window must not be paired."""
+    impedance = _Series([_T0 + MEASUREMENT_WINDOW * 2], [510.0])
+
+    columns = _build_columns(
+        [_T0], {Metric.WEIGHT: _Series([_T0], [80.0]), Metric.IMPEDANCE: impedance}
+    )
+
+    assert list(columns.impedance or []) == [None]
+
+
+# ===========================================================================
+# recompute_history — service
+# ===========================================================================
+
+
+async def test_service_registration_is_idempotent(hass: HomeAssistant) -> None:
+    """Registering twice must keep a single service; unload must remove it."""
+    async_setup_services(hass)
+    async_setup_services(hass)
+    assert hass.services.has_service(DOMAIN, SERVICE_RECOMPUTE_HISTORY)
+
+    async_unload_services(hass)
+    assert not hass.services.has_service(DOMAIN, SERVICE_RECOMPUTE_HISTORY)
+
+
+async def test_service_unknown_profile_raises(hass: HomeAssistant) -> None:
+    """Calling the service for an unknown entry must raise a validation error."""
+    async_setup_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RECOMPUTE_HISTORY,
+            {ATTR_CONFIG_ENTRY_ID: "missing"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_service_requires_recorder(hass: HomeAssistant) -> None:
+    """Without the recorder, the service must raise a validation error."""
+    hass.data[DOMAIN] = {HANDLERS: {"e1": object()}}
+    async_setup_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_RECOMPUTE_HISTORY,
+            {ATTR_CONFIG_ENTRY_ID: "e1"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+def _make_handler(hass: HomeAssistant) -> BodyScaleMetricsHandler:
+    config: dict[str, Any] = {
+        "name": "Bob",
+        CONF_BIRTHDAY: "1985-06-20",
+        CONF_GENDER: Gender.MALE,
+        CONF_HEIGHT: 180.0,
+        CONF_CALCULATION_MODE: "xiaomi",
+        CONF_IMPEDANCE_MODE: IMPEDANCE_MODE_STANDARD,
+        CONF_SENSOR_WEIGHT: "sensor.scale_weight",
+        CONF_SENSOR_IMPEDANCE: "sensor.scale_impedance",
+    }
+    return BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+
+async def test_recompute_history_without_profile_sensors_raises(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """A profile whose sensors are not registered cannot be recomputed."""
+    handler = _make_handler(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await async_recompute_history(
+            hass, handler, _T0 - timedelta(days=1), _T0 + timedelta(days=1)
+        )
+    handler.unload()
+
+
+async def test_recompute_history_imports_statistics(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Recorded measurements must be recomputed and imported as statistics."""
+    registry = er.async_get(hass)
+    entity_ids = {
+        metric: registry.async_get_or_create(
+            "sensor", DOMAIN, f"{DOMAIN}_Bob_{metric.value}"
+        ).entity_id
+        for metric in (
+            Metric.LAST_MEASUREMENT_TIME,
+            Metric.WEIGHT,
+            Metric.IMPEDANCE,
+        )
+    }
+    handler = _make_handler(hass)
+
+    # The impedance of the last weighing equals the previous one: the
+    # recorder keeps no new state for it.
+    measurements = [
+        (_T0, "82.0", "520"),
+        (_T0 + timedelta(days=40), "80.0", "505"),
+        (_T0 + timedelta(days=44), "79.0", "505"),
+    ]
+    for when, weight, impedance in measurements:
+        freezer.move_to(when)
+        hass.states.async_set(entity_ids[Metric.WEIGHT], weight)
+        hass.states.async_set(
+            entity_ids[Metric.LAST_MEASUREMENT_TIME], when.isoformat()
+        )
+        freezer.tick(timedelta(seconds=4))
+        hass.states.async_set(entity_ids[Metric.IMPEDANCE], impedance)
+        await async_wait_recording_done(hass)
+
+    freezer.move_to(_T0 + timedelta(days=45))
+    start = _T0.replace(minute=0)
+    end = _T0 + timedelta(days=45)
+    found, imported = await async_recompute_history(hass, handler, start, end)
+    await async_wait_recording_done(hass)
+
+    assert found == 3
+    assert imported > 0
+    stats = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start,
+        end,
+        {
+            statistic_id("Bob", Metric.BMI),
+            statistic_id("Bob", Metric.FAT_PERCENTAGE),
+            statistic_id("Bob", Metric.IMPEDANCE),
+        },
+        "hour",
+        None,
+        {"mean"},
+    )
+    bmi = stats[statistic_id("Bob", Metric.BMI)]
+    assert [row["mean"] for row in bmi] == [
+        pytest.approx(82.0 / 1.8**2),
+        pytest.approx(80.0 / 1.8**2),
+        pytest.approx(79.0 / 1.8**2),
+    ]
+    assert len(stats[statistic_id("Bob", Metric.FAT_PERCENTAGE)]) == 3
+    # The impedance is imported like the live cycles do.
+    assert [row["mean"] for row in stats[statistic_id("Bob", Metric.IMPEDANCE)]] == [
+        520.0,
+        505.0,
+        505.0,
+    ]
+    handler.unload()
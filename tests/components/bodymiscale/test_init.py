@@ -35,9 +35,13 @@ from custom_components.bodymiscale.const import (
     MAIN_ENTITIES,
     NOTIFICATION_COORDINATOR,
     PROBLEM_NONE,
+    PROFILE_ID_ROUTER,
     PROFILE_METHOD_NONE,
     PROFILE_METHOD_NOTIFY,
+    SENSOR_DISPATCHER,
+    WRITE_SCHEDULER,
 )
+from custom_components.bodymiscale.entity import StateWriteScheduler
 from custom_components.bodymiscale.models import Gender, Metric
 from custom_components.bodymiscale.profile import NotificationCoordinator
 
@@ -84,6 +88,9 @@ def _make_domain_data(
         HANDLERS: {entry_id: h},
         MAIN_ENTITIES: {entry_id: e},
         NOTIFICATION_COORDINATOR: coordinator,
+        WRITE_SCHEDULER: MagicMock(),
+        SENSOR_DISPATCHER: MagicMock(),
+        PROFILE_ID_ROUTER: MagicMock(),
     }
 
 
@@ -135,6 +142,46 @@ async def test_setup_entry_registers_handler(
     assert mock_config_entry.entry_id in hass.data[DOMAIN][HANDLERS]
 
 
+async def test_setup_entry_flushes_state_writes_on_completed_cycle(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """A completed cycle must write the profile's queued states at once."""
+    mock_config_entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.bodymiscale.BodyScaleMetricsHandler"
+        ) as mock_handler_cls,
+        patch("custom_components.bodymiscale.Bodymiscale"),
+        patch("custom_components.bodymiscale.EntityComponent") as mock_component_cls,
+        patch.object(
+            hass.config_entries, "async_forward_entry_setups", new_callable=AsyncMock
+        ),
+    ):
+        mock_handler = MagicMock()
+        mock_handler.config = dict(mock_config_entry.data)
+        mock_handler_cls.return_value = mock_handler
+        mock_component_cls.return_value.async_add_entities = AsyncMock()
+
+        from custom_components.bodymiscale import async_setup_entry
+
+        assert await async_setup_entry(hass, mock_config_entry)
+
+    scheduler: StateWriteScheduler = hass.data[DOMAIN][WRITE_SCHEDULER]
+    entity, other_profile_entity = MagicMock(), MagicMock()
+    scheduler.schedule(entity, owner=mock_config_entry.entry_id)
+    scheduler.schedule(other_profile_entity, owner="other_entry")
+    on_cycle = mock_handler.subscribe_cycle.call_args_list[0].args[0]
+    on_cycle({Metric.WEIGHT: 70.0})
+
+    entity.async_write_ha_state.assert_called_once()
+    # Another profile's write keeps its own window.
+    other_profile_entity.async_write_ha_state.assert_not_called()
+    assert scheduler.pending == 1
+    scheduler.unload()
+
+
 async def test_setup_entry_unsupported_ha_version(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -262,6 +309,9 @@ async def test_setup_entry_notify_reuses_existing_coordinator(
         HANDLERS: {},
         MAIN_ENTITIES: {},
         NOTIFICATION_COORDINATOR: existing_coordinator,
+        WRITE_SCHEDULER: MagicMock(),
+        SENSOR_DISPATCHER: MagicMock(),
+        PROFILE_ID_ROUTER: MagicMock(),
     }
 
     with (
@@ -319,6 +369,9 @@ async def test_unload_entry_cleans_up(
         HANDLERS: {mock_config_entry.entry_id: mock_handler},
         MAIN_ENTITIES: {mock_config_entry.entry_id: mock_entity},
         NOTIFICATION_COORDINATOR: None,
+        WRITE_SCHEDULER: MagicMock(),
+        SENSOR_DISPATCHER: MagicMock(),
+        PROFILE_ID_ROUTER: MagicMock(),
     }
 
     with patch.object(
@@ -350,6 +403,9 @@ async def test_unload_entry_platform_failure_keeps_data(
         HANDLERS: {mock_config_entry.entry_id: mock_handler},
         MAIN_ENTITIES: {},
         NOTIFICATION_COORDINATOR: None,
+        WRITE_SCHEDULER: MagicMock(),
+        SENSOR_DISPATCHER: MagicMock(),
+        PROFILE_ID_ROUTER: MagicMock(),
     }
 
     with patch.object(
@@ -726,6 +782,7 @@ def _make_bodymiscale_handler(
     }
     handler.config_entry_id = "entry_test"
     handler.subscribe = MagicMock(return_value=lambda: None)
+    handler.subscribe_batch = MagicMock(return_value=lambda: None)
     handler.restore_metric = MagicMock()
     return handler
 
@@ -739,7 +796,6 @@ def test_bodymiscale_init_sets_up_entity_description() -> None:
 
     assert entity.entity_description.key == "bodymiscale"
     assert entity.entity_description.icon == "mdi:human"
-    assert entity._timer_handle is None
     assert entity._available_metrics == {}
 
 
@@ -762,7 +818,8 @@ async def test_bodymiscale_async_added_to_hass_no_previous_state(
 
     assert entity._available_metrics == {}
     handler.restore_metric.assert_not_called()
-    assert handler.subscribe.call_count == len(list(Metric))
+    handler.subscribe_batch.assert_called_once()
+    handler.subscribe.assert_not_called()
 
 
 async def test_bodymiscale_async_added_to_hass_restores_problem_state(
@@ -827,7 +884,7 @@ async def test_bodymiscale_async_added_to_hass_unknown_state_defaults_to_ok(
 async def test_bodymiscale_on_value_status_updates_state_and_schedules_write(
     hass: HomeAssistant,
 ) -> None:
-    """The internal on_value callback must map STATUS updates to attr_state."""
+    """The internal on_values callback must map STATUS updates to attr_state."""
     from custom_components.bodymiscale import Bodymiscale
 
     handler = _make_bodymiscale_handler()
@@ -836,13 +893,13 @@ async def test_bodymiscale_on_value_status_updates_state_and_schedules_write(
     entity.entity_id = "bodymiscale.alice"
     entity.async_write_ha_state = MagicMock()
 
-    captured: dict[str, Any] = {}
+    captured: list[Any] = []
 
-    def fake_subscribe(metric, callback_func):
-        captured.setdefault(metric, []).append(callback_func)
+    def fake_subscribe_batch(callback_func):
+        captured.append(callback_func)
         return lambda: None
 
-    handler.subscribe = MagicMock(side_effect=fake_subscribe)
+    handler.subscribe_batch = MagicMock(side_effect=fake_subscribe_batch)
 
     with patch(
         "homeassistant.helpers.restore_state.RestoreEntity.async_get_last_state",
@@ -851,22 +908,60 @@ async def test_bodymiscale_on_value_status_updates_state_and_schedules_write(
         await entity.async_added_to_hass()
 
     # Trigger a STATUS update — must flip attr_state to STATE_PROBLEM
-    status_cb = captured[Metric.STATUS][0]
-    status_cb("some_problem")
+    on_values = captured[0]
+    on_values({Metric.STATUS: "some_problem"})
     assert entity._attr_state == STATE_PROBLEM
     assert entity._available_metrics[ATTR_PROBLEM] == "some_problem"
-    assert entity._timer_handle is not None
+    entity.async_write_ha_state.assert_called_once()
 
     # A PROBLEM_NONE value must flip it back to STATE_OK
-    status_cb(PROBLEM_NONE)
+    on_values({Metric.STATUS: PROBLEM_NONE})
     assert entity._attr_state == STATE_OK
 
     # A non-status metric must be stored under its own key, not affect state
-    weight_cb = captured[Metric.WEIGHT][0]
-    weight_cb(70.2)
+    on_values({Metric.WEIGHT: 70.2})
     assert entity._available_metrics[Metric.WEIGHT.value] == 70.2
 
 
+async def test_bodymiscale_on_values_merges_batch_with_one_write(
+    hass: HomeAssistant,
+) -> None:
+    """A whole batch must be merged at once and schedule a single write."""
+    from custom_components.bodymiscale import Bodymiscale
+
+    handler = _make_bodymiscale_handler()
+    entity = Bodymiscale(handler)
+    entity.hass = hass
+    entity.entity_id = "bodymiscale.alice"
+
+    captured: list[Any] = []
+    handler.subscribe_batch = MagicMock(
+        side_effect=lambda cb: captured.append(cb) or (lambda: None)
+    )
+
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreEntity.async_get_last_state",
+        new=AsyncMock(return_value=None),
+    ):
+        await entity.async_added_to_hass()
+
+    scheduler = StateWriteScheduler(hass)
+    hass.data[DOMAIN] = {WRITE_SCHEDULER: scheduler}
+    entity.async_write_ha_state = MagicMock()
+
+    captured[0]({Metric.WEIGHT: 70.2, Metric.BMI: 22.9, Metric.STATUS: PROBLEM_NONE})
+
+    assert scheduler.pending == 1
+    entity.async_write_ha_state.assert_not_called()
+    assert entity._available_metrics[Metric.WEIGHT.value] == 70.2
+    assert entity._available_metrics[Metric.BMI.value] == 22.9
+    assert entity._attr_state == STATE_OK
+
+    scheduler.flush()
+    entity.async_write_ha_state.assert_called_once()
+    hass.data.pop(DOMAIN)
+
+
 async def test_bodymiscale_remove_all_unsubscribes(
     hass: HomeAssistant,
 ) -> None:
@@ -879,8 +974,8 @@ async def test_bodymiscale_remove_all_unsubscribes(
     entity.entity_id = "bodymiscale.alice"
 
     unsub_calls = []
-    handler.subscribe = MagicMock(
-        side_effect=lambda metric, cb: lambda: unsub_calls.append(metric)
+    handler.subscribe_batch = MagicMock(
+        side_effect=lambda cb: lambda: unsub_calls.append(cb)
     )
 
     registered_removers = []
@@ -894,7 +989,23 @@ async def test_bodymiscale_remove_all_unsubscribes(
 
     assert len(registered_removers) == 1
     registered_removers[0]()
-    assert len(unsub_calls) == len(list(Metric))
+    assert len(unsub_calls) == 1
+
+
+def test_bodymiscale_state_write_closes_cycle_latency() -> None:
+    """Every state write must be reported to the handler's latency clock."""
+    from custom_components.bodymiscale import Bodymiscale
+
+    handler = _make_bodymiscale_handler()
+    entity = Bodymiscale(handler)
+
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_write:
+        entity.async_write_ha_state()
+
+    mock_write.assert_called_once()
+    handler.cycle_written.assert_called_once()
 
 
 def test_bodymiscale_state_attributes_standard_impedance_hides_dual_keys() -> None:
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
 from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.bodymiscale.const import (
     CONF_BIRTHDAY,
@@ -17,27 +20,47 @@ from custom_components.bodymiscale.const import (
     CONF_HEIGHT,
     CONF_IMPEDANCE_MODE,
     CONF_INITIAL_WEIGHT,
+    CONF_PROFILE_ID,
     CONF_PROFILE_METHOD,
     CONF_SENSOR_IMPEDANCE,
     CONF_SENSOR_IMPEDANCE_HIGH,
     CONF_SENSOR_IMPEDANCE_LOW,
+    CONF_SENSOR_PROFILE_ID,
     CONF_SENSOR_STABILIZED,
     CONF_SENSOR_WEIGHT,
+    CONF_SETTLE_WINDOW,
     CONF_WEIGHT_MAX,
     CONF_WEIGHT_MIN,
+    DOMAIN,
     IMPEDANCE_MODE_DUAL,
     IMPEDANCE_MODE_NONE,
     IMPEDANCE_MODE_STANDARD,
+    PROFILE_ID_ROUTER,
+    PROFILE_METHOD_ID,
     PROFILE_METHOD_NEAREST,
     PROFILE_METHOD_NONE,
     PROFILE_METHOD_NOTIFY,
     PROFILE_METHOD_WEIGHT,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
+)
+from custom_components.bodymiscale.metrics import (
+    _EVALUATION_PLANS,
+    _METRIC_DEPS,
+    _METRIC_SLOTS,
+    _SOURCE_METRICS,
+    BodyScaleMetricsHandler,
+    CycleLatency,
+    HandlerStats,
+    _MetricsStore,
 )
-from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler, _MetricsStore
 from custom_components.bodymiscale.models import Gender, Metric
 from custom_components.bodymiscale.profile import (
+    NearestWeightRouter,
     NotificationCoordinator,
     NotificationFilter,
+    ProfileIdRouter,
+    WeightRangeIndex,
 )
 
 # ---------------------------------------------------------------------------
@@ -613,6 +636,80 @@ async def test_accept_pending_measurement_replays_impedance(
     handler.unload()
 
 
+async def test_notify_handlers_queue_one_measurement_per_weighing(
+    hass: HomeAssistant,
+) -> None:
+    """Notify profiles on the same scale must send one notification per weighing."""
+    coordinator = NotificationCoordinator(hass)
+    handlers = []
+    for entry_id in ("e1", "e2"):
+        handler = BodyScaleMetricsHandler(
+            hass,
+            _make_config(
+                weight_sensor="sensor.w_queue", profile_method=PROFILE_METHOD_NOTIFY
+            ),
+            config_entry_id=entry_id,
+        )
+        handler.set_notification_coordinator(coordinator)
+        handlers.append(handler)
+
+    with patch.object(coordinator, "async_notify", new=AsyncMock()) as mock_notify:
+        hass.states.async_set("sensor.w_queue", "70.0")
+        await hass.async_block_till_done()
+
+    (measurement,) = coordinator.pending_measurements
+    mock_notify.assert_awaited_once_with(70.0, measurement.measurement_id)
+    for handler in handlers:
+        handler.unload()
+    coordinator.unload()
+
+
+async def test_accept_queued_measurement_after_next_weighing(
+    hass: HomeAssistant,
+) -> None:
+    """A queued weighing must stay confirmable after a newer one arrives."""
+    config = _make_config(
+        height=175.0,
+        gender=Gender.MALE,
+        birthday="1990-03-10",
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_queued",
+        impedance_sensor="sensor.imp_queued",
+        profile_method=PROFILE_METHOD_NOTIFY,
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    coordinator = NotificationCoordinator(hass)
+    handler.set_notification_coordinator(coordinator)
+
+    weights: list[float] = []
+    impedances: list[float] = []
+    handler.subscribe(Metric.WEIGHT, lambda v: weights.append(float(v)))
+    handler.subscribe(Metric.IMPEDANCE, lambda v: impedances.append(float(v)))
+
+    with patch.object(coordinator, "async_notify", new=AsyncMock()):
+        hass.states.async_set("sensor.w_queued", "78.0")
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.imp_queued", "500")
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.w_queued", "62.0")
+        await hass.async_block_till_done()
+
+    first, second = coordinator.pending_measurements
+    assert (first.weight, second.weight) == (78.0, 62.0)
+    assert first.impedance == {Metric.IMPEDANCE: 500.0}
+
+    assert isinstance(handler.profile_filter, NotificationFilter)
+    handler.profile_filter.confirm()
+    handler.accept_pending_measurement(first)
+
+    assert weights[-1] == pytest.approx(78.0, abs=0.1)
+    assert impedances[-1] == pytest.approx(500.0)
+    # The newer weighing is still waiting in the handler slot.
+    assert handler._pending_weight == pytest.approx(62.0)
+    handler.unload()
+    coordinator.unload()
+
+
 # ===========================================================================
 # _process_impedance — with NotificationFilter (pending storage)
 # ===========================================================================
@@ -845,7 +942,893 @@ def test_metrics_store_contains_expired_derived_returns_false() -> None:
     store[Metric.BMI] = 22.0
     assert Metric.BMI not in store
     # Eviction as a side-effect of __contains__ must have removed it.
-    assert Metric.BMI not in store._derived
+    assert store._present == 0
+    assert store._values[_METRIC_SLOTS[Metric.BMI]] is None
+
+
+def test_metrics_store_pass_clock_reads_time_once() -> None:
+    """Lookups inside a pass must share a single clock reading."""
+    store = _MetricsStore(ttl=60)
+    store[Metric.WEIGHT] = 70.0
+    store[Metric.BMI] = 22.0
+    with (
+        patch(
+            "custom_components.bodymiscale.metrics.time.monotonic", return_value=1e9
+        ) as mock_monotonic,
+        store.pass_clock(),
+    ):
+        with store.pass_clock():
+            assert store.get(Metric.BMI) is None  # expired at pass start
+        store[Metric.BMI] = 23.0
+        assert store.get(Metric.BMI) == 23.0
+        assert store.get(Metric.BMR, "missing") == "missing"
+    assert mock_monotonic.call_count == 1
+    assert list(store) == [Metric.WEIGHT, Metric.BMI]
+
+
+def test_metrics_store_snapshot_coerces_numbers() -> None:
+    """The pass snapshot must hold floats for numeric values, others untouched."""
+    store = _MetricsStore(ttl=60)
+    store[Metric.AGE] = 35
+    store[Metric.WEIGHT] = "70.5"
+    store[Metric.STATUS] = "ok"
+    store[Metric.BMI] = 22.0
+
+    snapshot = store.snapshot()
+    assert snapshot == {
+        Metric.STATUS: "ok",
+        Metric.AGE: 35.0,
+        Metric.WEIGHT: 70.5,
+        Metric.BMI: 22.0,
+    }
+    assert isinstance(snapshot[Metric.AGE], float)
+
+
+async def test_handler_pass_reads_one_consistent_snapshot(
+    hass: HomeAssistant,
+) -> None:
+    """Metrics computed earlier in a pass must feed later ones even if expired."""
+    config = _make_config(
+        height=175.0,
+        gender=Gender.MALE,
+        birthday="1990-03-10",
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_snapshot",
+        impedance_sensor="sensor.imp_snapshot",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    # Every derived value expires as soon as it is stored.
+    handler._available_metrics._ttl = -1
+
+    seen: list[Mapping[Metric, Any]] = []
+    calculate = handler._dependencies[Metric.FAT_PERCENTAGE].calculate
+
+    def _spy(cfg: Mapping[str, Any], metrics: Mapping[Metric, Any]) -> Any:
+        seen.append(metrics)
+        return calculate(cfg, metrics)
+
+    fat_values: list[float] = []
+    handler.subscribe(Metric.FAT_PERCENTAGE, lambda v: fat_values.append(float(v)))
+    with patch.object(handler._dependencies[Metric.FAT_PERCENTAGE], "calculate", _spy):
+        hass.states.async_set("sensor.w_snapshot", "78.0")
+        hass.states.async_set("sensor.imp_snapshot", "500")
+        await hass.async_block_till_done()
+
+    assert fat_values
+    assert Metric.LBM in seen[-1]
+    with pytest.raises(TypeError):
+        seen[-1][Metric.LBM] = 0.0  # type: ignore[index]
+    handler.unload()
+
+
+def test_metrics_store_counts_evictions() -> None:
+    """Only expired derived values must be counted as evictions."""
+    store = _MetricsStore(ttl=0.0)
+    store[Metric.WEIGHT] = 70.0
+    store[Metric.BMI] = 22.0
+    del store[Metric.WEIGHT]
+    assert store.evictions == 0
+
+    assert Metric.BMI not in store
+    assert store.evictions == 1
+    assert len(store) == 0
+    assert store.evictions == 1
+
+
+async def test_handler_stats_count_passes_and_skips(hass: HomeAssistant) -> None:
+    """Each pass must be counted along with computed and skipped metrics."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_stats",
+        impedance_sensor="sensor.imp_stats",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    handler.subscribe(Metric.BMI, lambda _value: None)
+
+    hass.states.async_set("sensor.w_stats", "70.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+
+    stats = handler.stats
+    weight_only = len(handler._plan.weight_only)
+    assert stats.passes == 1
+    assert stats.computed == weight_only
+    assert stats.subscriber_calls == 1
+    assert len(stats.pass_durations) == 1
+
+    # Nothing changed since: the weight metrics are fresh and, without an
+    # impedance reading, the impedance metrics cannot be computed.
+    handler._run_pass(handler._plan.full)
+    assert stats.passes == 2
+    assert stats.computed == weight_only
+    assert stats.skipped_fresh == weight_only
+    assert stats.skipped_unmet == len(handler._plan.full) - weight_only
+    assert handler.ttl_evictions == 0
+
+    report = stats.as_dict()
+    assert report["passes"] == 2
+    assert report["pass_duration_ms"]["samples"] == 2
+    assert report["pass_duration_ms"]["p50"] <= report["pass_duration_ms"]["p95"]
+    handler.unload()
+
+
+async def test_handler_stats_count_rejections_per_filter(
+    hass: HomeAssistant,
+) -> None:
+    """Measurements rejected by the profile filter must be counted by class."""
+    config = _make_config(
+        weight_sensor="sensor.w_stats_reject",
+        profile_method=PROFILE_METHOD_WEIGHT,
+    )
+    config[CONF_WEIGHT_MIN] = 60.0
+    config[CONF_WEIGHT_MAX] = 80.0
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_stats_reject", "90.0")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.w_stats_reject", "95.0")
+    await hass.async_block_till_done()
+
+    name = type(handler._profile_filter).__name__
+    assert handler.stats.rejections == {name: 2}
+    assert handler.stats.as_dict()["rejections"] == {name: 2}
+    handler.unload()
+
+
+def test_handler_stats_without_passes() -> None:
+    """Percentiles must be empty before the first pass."""
+    assert HandlerStats().as_dict()["pass_duration_ms"] == {
+        "samples": 0,
+        "p50": None,
+        "p95": None,
+    }
+
+
+# ===========================================================================
+# BodyScaleMetricsHandler — cycle latency breakdown
+# ===========================================================================
+
+
+async def test_handler_cycle_latency_breakdown(hass: HomeAssistant) -> None:
+    """The stages must follow the readings, the passes and the state write."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_latency",
+        impedance_sensor="sensor.imp_latency",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    latencies: list[CycleLatency] = []
+    handler.subscribe_latency(latencies.append)
+    clock = [100.0]
+
+    with patch(
+        "custom_components.bodymiscale.metrics.time.perf_counter",
+        side_effect=lambda: clock[0],
+    ):
+        hass.states.async_set("sensor.w_latency", "70.0")
+        await hass.async_block_till_done()
+        clock[0] = 100.75
+        hass.states.async_set("sensor.imp_latency", "500")
+        await hass.async_block_till_done()
+        # Not written yet: nothing to report.
+        assert latencies == []
+
+        clock[0] = 102.75
+        handler.cycle_written()
+        # Only the first write after the cycle counts.
+        handler.cycle_written()
+
+    assert latencies == [
+        CycleLatency(ingest=0.75, filter=0.0, compute=0.0, publish=2.0)
+    ]
+    assert handler.last_cycle_latency is latencies[0]
+    assert latencies[0].total == pytest.approx(2.75)
+    handler.unload()
+
+
+async def test_handler_cycle_latency_settle_window_counts_as_ingest(
+    hass: HomeAssistant,
+) -> None:
+    """Waiting for an impedance that never comes must be counted as ingest."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_latency_settle",
+        impedance_sensor="sensor.imp_latency_settle",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    clock = [10.0]
+
+    with patch(
+        "custom_components.bodymiscale.metrics.time.perf_counter",
+        side_effect=lambda: clock[0],
+    ):
+        hass.states.async_set("sensor.w_latency_settle", "70.0")
+        await hass.async_block_till_done()
+        clock[0] = 15.0
+        assert handler._cancel_settle_timer()
+        handler._settle_measurement_cycle(dt_util.utcnow())
+        clock[0] = 17.0
+        handler.cycle_written()
+
+    latency = handler.last_cycle_latency
+    assert latency is not None
+    assert latency.ingest == 5.0
+    assert latency.publish == 2.0
+    handler.unload()
+
+
+async def test_handler_cycle_latency_notify_confirmation_is_filter(
+    hass: HomeAssistant,
+) -> None:
+    """For notify profiles, the wait for the confirmation is the filter stage."""
+    config = _make_config(
+        weight_sensor="sensor.w_latency_notify",
+        profile_method=PROFILE_METHOD_NOTIFY,
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    coordinator = MagicMock(spec=NotificationCoordinator)
+    coordinator.async_notify = AsyncMock()
+    handler.set_notification_coordinator(coordinator)
+    clock = [0.0]
+
+    with patch(
+        "custom_components.bodymiscale.metrics.time.perf_counter",
+        side_effect=lambda: clock[0],
+    ):
+        hass.states.async_set("sensor.w_latency_notify", "68.0")
+        await hass.async_block_till_done()
+        clock[0] = 30.0
+        assert isinstance(handler.profile_filter, NotificationFilter)
+        handler.profile_filter.confirm()
+        handler.accept_pending_measurement()
+        clock[0] = 32.0
+        handler.cycle_written()
+
+    assert handler.last_cycle_latency == CycleLatency(
+        ingest=0.0, filter=30.0, compute=0.0, publish=2.0
+    )
+    handler.unload()
+
+
+async def test_handler_cycle_latency_ignores_rejected_weighing(
+    hass: HomeAssistant,
+) -> None:
+    """A weighing rejected by the profile filter must not be reported."""
+    config = _make_config(
+        weight_sensor="sensor.w_latency_reject",
+        profile_method=PROFILE_METHOD_WEIGHT,
+    )
+    config[CONF_WEIGHT_MIN] = 60.0
+    config[CONF_WEIGHT_MAX] = 80.0
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_latency_reject", "90.0")
+    await hass.async_block_till_done()
+    handler.cycle_written()
+
+    assert handler.last_cycle_latency is None
+    handler.unload()
+
+
+# ===========================================================================
+# Evaluation plans — compiled once at import time
+# ===========================================================================
+
+
+@pytest.mark.parametrize("mode", list(_EVALUATION_PLANS))
+def test_evaluation_plan_orders_dependencies_first(mode: str) -> None:
+    """Every derived dependency must appear before the metric that needs it."""
+    plan = _EVALUATION_PLANS[mode]
+    for index, metric in enumerate(plan.full):
+        for dep in _METRIC_DEPS[metric].depends_on:
+            if dep not in _SOURCE_METRICS:
+                assert dep in plan.full[:index]
+
+
+def test_evaluation_plan_none_mode_only_weight_metrics() -> None:
+    """Without impedance, only the weight-only metrics are reachable."""
+    plan = _EVALUATION_PLANS[IMPEDANCE_MODE_NONE]
+    assert plan.full == plan.weight_only
+    assert set(plan.full) == {Metric.BMI, Metric.BMR, Metric.VISCERAL_FAT}
+    assert plan.impedance == ()
+
+
+def test_evaluation_plan_standard_mode_excludes_dual_metrics() -> None:
+    """Standard mode must skip dual-frequency metrics but keep the body score."""
+    plan = _EVALUATION_PLANS[IMPEDANCE_MODE_STANDARD]
+    assert Metric.ECW not in plan.full
+    assert Metric.SKELETAL_MUSCLE_MASS not in plan.full
+    assert plan.full[-1] is Metric.BODY_SCORE
+    assert set(plan.full) == {*plan.weight_only, *plan.impedance}
+
+
+def test_evaluation_plan_dual_mode_includes_dual_metrics() -> None:
+    """Dual mode must reach every derived metric of the dependency graph."""
+    plan = _EVALUATION_PLANS[IMPEDANCE_MODE_DUAL]
+    derived = {m for m in _METRIC_DEPS if m not in _SOURCE_METRICS}
+    assert set(plan.full) == derived
+
+
+def test_evaluation_plan_impedance_pass_recomputes_lbm_readers() -> None:
+    """BMR reads LBM: the impedance pass must recompute it after LBM."""
+    plan = _EVALUATION_PLANS[IMPEDANCE_MODE_DUAL]
+    assert Metric.BMR in plan.weight_only
+    assert plan.impedance.index(Metric.LBM) < plan.impedance.index(Metric.BMR)
+    assert plan.impedance.index(Metric.BMR) < plan.impedance.index(Metric.BODY_SCORE)
+
+
+async def test_handler_impedance_change_updates_bmr_in_same_cycle(
+    hass: HomeAssistant,
+) -> None:
+    """A new impedance with the same weight must update BMR from the new LBM."""
+    config = _make_config(
+        height=175.0,
+        gender=Gender.MALE,
+        birthday="1990-03-10",
+        impedance_mode=IMPEDANCE_MODE_DUAL,
+        weight_sensor="sensor.w_bmr_lbm",
+        impedance_low_sensor="sensor.imp_low_bmr_lbm",
+        impedance_high_sensor="sensor.imp_high_bmr_lbm",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    for impedance_low, impedance_high in (("520", "480"), ("440", "400")):
+        hass.states.async_set("sensor.w_bmr_lbm", "75.0")
+        hass.states.async_set("sensor.imp_low_bmr_lbm", impedance_low)
+        hass.states.async_set("sensor.imp_high_bmr_lbm", impedance_high)
+        await hass.async_block_till_done()
+
+    assert len(cycles) == 2
+    assert cycles[1][Metric.LBM] != cycles[0][Metric.LBM]
+    assert cycles[1][Metric.BMR] == pytest.approx(
+        370 + 21.6 * cycles[1][Metric.LBM], abs=2
+    )
+    assert Metric.BMR not in handler._dirty
+    handler.unload()
+
+
+async def test_handler_unknown_impedance_mode_uses_none_plan(
+    hass: HomeAssistant,
+) -> None:
+    """An unexpected impedance mode must fall back to the weight-only plan."""
+    config = _make_config(impedance_mode="bogus", weight_sensor="sensor.w_bogus")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    assert handler._plan is _EVALUATION_PLANS[IMPEDANCE_MODE_NONE]
+    handler.unload()
+
+
+# ===========================================================================
+# BodyScaleMetricsHandler — incremental recalculation
+# ===========================================================================
+
+
+def _count_calculations(
+    handler: BodyScaleMetricsHandler, metric: Metric
+) -> list[Metric]:
+    """Wrap a metric's calculate function and record every call."""
+    calls: list[Metric] = []
+    info = handler._dependencies[metric]
+    original = info.calculate
+
+    def _counting(config: Any, metrics: Any) -> Any:
+        calls.append(metric)
+        return original(config, metrics)
+
+    info.calculate = _counting
+    return calls
+
+
+async def test_handler_unchanged_weight_skips_recalculation(
+    hass: HomeAssistant,
+) -> None:
+    """Re-reporting the same weight must not recompute or republish BMI."""
+    config = _make_config(weight_sensor="sensor.w_same")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    calls = _count_calculations(handler, Metric.BMI)
+
+    hass.states.async_set("sensor.w_same", "70.0")
+    await hass.async_block_till_done()
+    assert calls == [Metric.BMI]
+
+    bmi_values: list[Any] = []
+    handler.subscribe(Metric.BMI, bmi_values.append)
+    bmi_values.clear()
+
+    hass.states.async_set("sensor.w_same", "70.0", force_update=True)
+    await hass.async_block_till_done()
+
+    assert calls == [Metric.BMI]
+    assert bmi_values == []
+    handler.unload()
+
+
+async def test_handler_changed_weight_recomputes_dependents(
+    hass: HomeAssistant,
+) -> None:
+    """A new weight must mark its dependents dirty and recompute them."""
+    config = _make_config(weight_sensor="sensor.w_change")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_change", "70.0")
+    await hass.async_block_till_done()
+    bmi_before = handler._available_metrics[Metric.BMI]
+
+    hass.states.async_set("sensor.w_change", "75.0")
+    await hass.async_block_till_done()
+
+    assert handler._available_metrics[Metric.BMI] != bmi_before
+    assert not handler._dirty & set(handler._plan.weight_only)
+    handler.unload()
+
+
+async def test_handler_impedance_change_skips_weight_only_metrics(
+    hass: HomeAssistant,
+) -> None:
+    """A new impedance must recompute its subgraph but leave BMI alone."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_inc",
+        impedance_sensor="sensor.imp_inc",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_inc", "70.0")
+    hass.states.async_set("sensor.imp_inc", "500")
+    await hass.async_block_till_done()
+
+    bmi_calls = _count_calculations(handler, Metric.BMI)
+    lbm_calls = _count_calculations(handler, Metric.LBM)
+    hass.states.async_set("sensor.imp_inc", "520")
+    await hass.async_block_till_done()
+
+    assert lbm_calls == [Metric.LBM]
+    assert bmi_calls == []
+    handler.unload()
+
+
+async def test_handler_rounded_unchanged_value_not_republished(
+    hass: HomeAssistant,
+) -> None:
+    """A recomputed metric rounding to the published value is not sent again."""
+    config = _make_config(weight_sensor="sensor.w_round")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_round", "70.0")
+    await hass.async_block_till_done()
+
+    bmi_values: list[Any] = []
+    handler.subscribe(Metric.BMI, bmi_values.append)
+    bmi_values.clear()
+
+    # 70.001 kg changes the raw BMI but not its one-decimal rounding.
+    hass.states.async_set("sensor.w_round", "70.001")
+    await hass.async_block_till_done()
+
+    assert bmi_values == []
+    handler.unload()
+
+
+async def test_handler_suppressed_notifications_counter(
+    hass: HomeAssistant,
+) -> None:
+    """Re-publishing an identical rounded value must only bump the counter."""
+    config = _make_config(weight_sensor="sensor.w_counter")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    assert handler.suppressed_notifications == 0
+
+    weight_values: list[Any] = []
+    handler.subscribe(Metric.WEIGHT, weight_values.append)
+
+    handler._update_available_metric(Metric.WEIGHT, 70.001)
+    handler._update_available_metric(Metric.WEIGHT, 70.0)
+    handler._update_available_metric(Metric.WEIGHT, 71.0)
+
+    assert weight_values == [70.0, 71.0]
+    assert handler.suppressed_notifications == 1
+    handler.unload()
+
+
+async def test_handler_pushes_weight_to_domain_router(
+    hass: HomeAssistant,
+) -> None:
+    """Accepted weights must be indexed by the router and removed on unload."""
+    router = NearestWeightRouter()
+    hass.data[DOMAIN] = {WEIGHT_ROUTER: router}
+    config = _make_config(weight_sensor="sensor.w_router")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    hass.states.async_set("sensor.w_router", "70.0")
+    await hass.async_block_till_done()
+    assert router.weight_of("TestUser") == 70.0
+
+    handler.unload()
+    assert router.weight_of("TestUser") is None
+    hass.data.pop(DOMAIN)
+
+
+async def test_handler_registers_weight_range_in_domain_index(
+    hass: HomeAssistant,
+) -> None:
+    """A weight-range profile must index its range and drop it on unload."""
+    ranges = WeightRangeIndex()
+    hass.data[DOMAIN] = {WEIGHT_RANGES: ranges}
+    config = _make_config(
+        weight_sensor="sensor.w_ranges", profile_method=PROFILE_METHOD_WEIGHT
+    )
+    config[CONF_WEIGHT_MIN] = 60.0
+    config[CONF_WEIGHT_MAX] = 80.0
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    assert ranges.owner(70.0) == "e1"
+
+    handler.unload()
+    assert len(ranges) == 0
+    hass.data.pop(DOMAIN)
+
+
+async def test_handlers_route_through_profile_id_router(
+    hass: HomeAssistant,
+) -> None:
+    """Only the profile owning the scale's current ID must take the weight."""
+    router = ProfileIdRouter(hass)
+    hass.data[DOMAIN] = {PROFILE_ID_ROUTER: router}
+    handlers = []
+    for name, profile_id in (("Alice", 1), ("Bob", 2)):
+        config = _make_config(
+            weight_sensor="sensor.w_profile_id", profile_method=PROFILE_METHOD_ID
+        )
+        config["name"] = name
+        config[CONF_SENSOR_PROFILE_ID] = "sensor.scale_profile"
+        config[CONF_PROFILE_ID] = profile_id
+        handlers.append(BodyScaleMetricsHandler(hass, config, config_entry_id=name))
+    assert router.tracked_entities == {"sensor.scale_profile"}
+
+    # The scale writes the profile ID right before the weight.
+    hass.states.async_set("sensor.scale_profile", "2")
+    hass.states.async_set("sensor.w_profile_id", "70.0")
+    await hass.async_block_till_done()
+    assert [h.current_weight for h in handlers] == [None, 70.0]
+
+    for handler in handlers:
+        handler.unload()
+    assert router.tracked_entities == frozenset()
+    hass.data.pop(DOMAIN)
+
+
+# ===========================================================================
+# BodyScaleMetricsHandler — batched dispatch
+# ===========================================================================
+
+
+async def test_handler_batch_subscriber_gets_one_snapshot_per_pass(
+    hass: HomeAssistant,
+) -> None:
+    """A weight pass must reach a batch subscriber once, with every change."""
+    config = _make_config(weight_sensor="sensor.w_batch")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    batches: list[Mapping[Metric, Any]] = []
+    handler.subscribe_batch(batches.append)
+    # Nothing published yet — no initial snapshot.
+    assert batches == []
+
+    hass.states.async_set("sensor.w_batch", "70.0")
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    snapshot = batches[0]
+    assert snapshot[Metric.WEIGHT] == 70.0
+    assert Metric.BMI in snapshot
+    assert Metric.LAST_MEASUREMENT_TIME in snapshot
+    with pytest.raises(TypeError):
+        snapshot[Metric.WEIGHT] = 1.0  # type: ignore[index]
+
+    # Same weight again: only the measurement time changes.
+    hass.states.async_set("sensor.w_batch", "70.0", force_update=True)
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert set(batches[1]) == {Metric.LAST_MEASUREMENT_TIME}
+    handler.unload()
+
+
+async def test_handler_batch_per_metric_subscribers_get_their_key(
+    hass: HomeAssistant,
+) -> None:
+    """Per-metric subscribers must only receive their own key after a pass."""
+    config = _make_config(weight_sensor="sensor.w_batch_key")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    order: list[str] = []
+    handler.subscribe(Metric.BMI, lambda value: order.append(f"bmi={value}"))
+    handler.subscribe_batch(lambda changes: order.append("batch"))
+
+    hass.states.async_set("sensor.w_batch_key", "72.0")
+    await hass.async_block_till_done()
+
+    bmi = [entry for entry in order if entry.startswith("bmi=")]
+    assert len(bmi) == 1
+    assert order[-1] == "batch"
+    assert order.count("batch") == 1
+    handler.unload()
+
+
+async def test_handler_batch_subscribe_replays_and_unsubscribes(
+    hass: HomeAssistant,
+) -> None:
+    """Subscribing replays current values; unsubscribing stops deliveries."""
+    config = _make_config(weight_sensor="sensor.w_batch_unsub")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    hass.states.async_set("sensor.w_batch_unsub", "70.0")
+    await hass.async_block_till_done()
+
+    batches: list[Mapping[Metric, Any]] = []
+    remove = handler.subscribe_batch(batches.append)
+    assert len(batches) == 1
+    assert batches[0][Metric.WEIGHT] == 70.0
+
+    remove()
+    hass.states.async_set("sensor.w_batch_unsub", "71.0")
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    handler.unload()
+
+
+# ===========================================================================
+# BodyScaleMetricsHandler — measurement cycle assembler
+# ===========================================================================
+
+
+async def test_handler_assembler_runs_one_pass_per_weighing(
+    hass: HomeAssistant,
+) -> None:
+    """Weight then impedance must produce a single recalculation."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_assemble",
+        impedance_sensor="sensor.imp_assemble",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    bmi_calls = _count_calculations(handler, Metric.BMI)
+    batches: list[Mapping[Metric, Any]] = []
+    handler.subscribe_batch(batches.append)
+
+    hass.states.async_set("sensor.w_assemble", "70.0")
+    await hass.async_block_till_done()
+    # Waiting for the impedance — nothing derived yet.
+    assert bmi_calls == []
+    assert Metric.BMI not in handler._available_metrics
+
+    hass.states.async_set("sensor.imp_assemble", "500")
+    await hass.async_block_till_done()
+
+    assert bmi_calls == [Metric.BMI]
+    assert Metric.BMI in batches[-1]
+    assert Metric.FAT_PERCENTAGE in batches[-1]
+    assert handler._settle_cancel is None
+    handler.unload()
+
+
+async def test_handler_assembler_settles_without_impedance(
+    hass: HomeAssistant,
+) -> None:
+    """Without impedance, weight-only metrics must follow the settle window."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_settle",
+        impedance_sensor="sensor.imp_settle",
+    )
+    config[CONF_SETTLE_WINDOW] = 3
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    hass.states.async_set("sensor.w_settle", "70.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert Metric.BMI not in handler._available_metrics
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+
+    assert Metric.BMI in handler._available_metrics
+    assert Metric.FAT_PERCENTAGE not in handler._available_metrics
+    assert len(cycles) == 1
+    handler.unload()
+
+
+async def test_handler_assembler_stabilized_before_impedance(
+    hass: HomeAssistant,
+) -> None:
+    """Stabilized ON before the impedance must wait for it: one cycle, one pass."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_stab_wait",
+        impedance_sensor="sensor.imp_stab_wait",
+        stabilized_sensor="binary_sensor.stab_wait",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    bmi_calls = _count_calculations(handler, Metric.BMI)
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    hass.states.async_set("sensor.w_stab_wait", "70.0")
+    await hass.async_block_till_done()
+    hass.states.async_set("binary_sensor.stab_wait", "on")
+    await hass.async_block_till_done()
+    assert cycles == []
+    assert handler._settle_cancel is not None
+
+    hass.states.async_set("sensor.imp_stab_wait", "500")
+    await hass.async_block_till_done()
+
+    assert bmi_calls == [Metric.BMI]
+    assert len(cycles) == 1
+    assert Metric.FAT_PERCENTAGE in cycles[0]
+    assert handler._settle_cancel is None
+    handler.unload()
+
+
+async def test_handler_assembler_late_impedance_corrects_cycle(
+    hass: HomeAssistant,
+) -> None:
+    """An impedance after the settle window must not complete a second cycle."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_late_imp",
+        impedance_sensor="sensor.imp_late_imp",
+    )
+    config[CONF_SETTLE_WINDOW] = 3
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    bmi_calls = _count_calculations(handler, Metric.BMI)
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    hass.states.async_set("sensor.w_late_imp", "70.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert len(cycles) == 1
+    measured = handler._available_metrics[Metric.LAST_MEASUREMENT_TIME]
+
+    hass.states.async_set("sensor.imp_late_imp", "500")
+    await hass.async_block_till_done()
+
+    assert len(cycles) == 1
+    assert bmi_calls == [Metric.BMI]
+    assert Metric.FAT_PERCENTAGE in handler._available_metrics
+    assert handler._available_metrics[Metric.LAST_MEASUREMENT_TIME] == measured
+    handler.unload()
+
+
+async def test_handler_assembler_startup_replay_does_not_wait(
+    hass: HomeAssistant,
+) -> None:
+    """A weight replayed at startup without impedance must be used at once."""
+    hass.states.async_set("sensor.w_boot_settle", "70.0")
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_boot_settle",
+        impedance_sensor="sensor.imp_boot_settle",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    assert Metric.BMI in handler._available_metrics
+    assert handler._settle_cancel is None
+    handler.unload()
+
+
+# ===========================================================================
+# BodyScaleMetricsHandler — completed measurement cycles
+# ===========================================================================
+
+
+async def test_handler_cycle_waits_for_impedance(hass: HomeAssistant) -> None:
+    """In standard mode a cycle completes on the impedance, not the weight."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_cycle",
+        impedance_sensor="sensor.imp_cycle",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    cycles: list[Any] = []
+    remove = handler.subscribe_cycle(cycles.append)
+
+    hass.states.async_set("sensor.w_cycle", "70.0")
+    await hass.async_block_till_done()
+    assert cycles == []
+
+    hass.states.async_set("sensor.imp_cycle", "500")
+    await hass.async_block_till_done()
+    assert len(cycles) == 1
+    assert cycles[0][Metric.WEIGHT] == 70.0
+    assert Metric.FAT_PERCENTAGE in cycles[0]
+    assert Metric.LAST_MEASUREMENT_TIME in cycles[0]
+
+    remove()
+    hass.states.async_set("sensor.imp_cycle", "510")
+    await hass.async_block_till_done()
+    assert len(cycles) == 1
+    handler.unload()
+
+
+async def test_handler_cycle_notified_after_its_values(
+    hass: HomeAssistant,
+) -> None:
+    """Cycle subscribers must run once the values of the cycle were dispatched."""
+    config = _make_config(
+        impedance_mode=IMPEDANCE_MODE_STANDARD,
+        weight_sensor="sensor.w_cycle_order",
+        impedance_sensor="sensor.imp_cycle_order",
+    )
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    calls: list[str] = []
+    handler.subscribe_batch(lambda changes: calls.append("values"))
+    handler.subscribe_cycle(lambda snapshot: calls.append("cycle"))
+
+    hass.states.async_set("sensor.w_cycle_order", "70.0")
+    hass.states.async_set("sensor.imp_cycle_order", "500")
+    await hass.async_block_till_done()
+
+    assert calls[-2:] == ["values", "cycle"]
+    assert calls.count("cycle") == 1
+    handler.unload()
+
+
+async def test_handler_cycle_on_weight_without_impedance(
+    hass: HomeAssistant,
+) -> None:
+    """Without impedance, every accepted weight completes a cycle."""
+    config = _make_config(weight_sensor="sensor.w_cycle_none")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    hass.states.async_set("sensor.w_cycle_none", "70.0")
+    await hass.async_block_till_done()
+
+    assert len(cycles) == 1
+    assert Metric.BMI in cycles[0]
+    handler.unload()
+
+
+async def test_handler_cycle_not_emitted_while_bootstrapping(
+    hass: HomeAssistant,
+) -> None:
+    """The startup replay must not report an already completed cycle again."""
+    config = _make_config(weight_sensor="sensor.w_cycle_boot")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    cycles: list[Any] = []
+    handler.subscribe_cycle(cycles.append)
+
+    handler._bootstrapping = True
+    handler._state_changed("sensor.w_cycle_boot", State("sensor.w_cycle_boot", "70"))
+    handler._bootstrapping = False
+
+    assert cycles == []
+    handler.unload()
 
 
 # ===========================================================================
@@ -926,7 +1909,7 @@ async def test_handler_nearest_without_initial_weight_does_not_bootstrap(
 async def test_handler_stabilized_sensor_triggers_weight_only_recalc(
     hass: HomeAssistant,
 ) -> None:
-    """Turning the stabilized sensor ON must force a weight-only recalculation."""
+    """Turning the stabilized sensor ON must run a weight-only recalculation."""
     config = _make_config(
         height=170.0,
         gender=Gender.MALE,
@@ -939,14 +1922,37 @@ async def test_handler_stabilized_sensor_triggers_weight_only_recalc(
     hass.states.async_set("sensor.w_stab", "80.0")
     await hass.async_block_till_done()
 
-    bmi_values: list[Any] = []
-    handler.subscribe(Metric.BMI, bmi_values.append)
-    bmi_values.clear()
+    calls = _count_calculations(handler, Metric.BMI)
+    # Simulate TTL expiry — an up-to-date BMI would be skipped by the pass.
+    del handler._available_metrics[Metric.BMI]
 
     hass.states.async_set("binary_sensor.stabilized", "on")
     await hass.async_block_till_done()
 
-    assert bmi_values, "Stabilized ON must trigger a weight-only recalculation"
+    assert calls, "Stabilized ON must trigger a weight-only recalculation"
+    handler.unload()
+
+
+async def test_handler_stabilized_rejected_weight_does_not_stamp(
+    hass: HomeAssistant,
+) -> None:
+    """Stabilized ON after a rejected weight must not stamp a measurement time."""
+    config = _make_config(
+        weight_sensor="sensor.w_stab_rejected",
+        profile_method=PROFILE_METHOD_WEIGHT,
+        stabilized_sensor="binary_sensor.stabilized_rejected",
+    )
+    config[CONF_WEIGHT_MIN] = 60.0
+    config[CONF_WEIGHT_MAX] = 80.0
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+    stamps: list[Any] = []
+    handler.subscribe(Metric.LAST_MEASUREMENT_TIME, stamps.append)
+
+    hass.states.async_set("sensor.w_stab_rejected", "90.0")
+    hass.states.async_set("binary_sensor.stabilized_rejected", "on")
+    await hass.async_block_till_done()
+
+    assert stamps == []
     handler.unload()
 
 
@@ -969,14 +1975,13 @@ async def test_handler_stabilized_sensor_triggers_impedance_pass_when_accepted(
     hass.states.async_set("sensor.imp_stab", "500")
     await hass.async_block_till_done()
 
-    fat_values: list[Any] = []
-    handler.subscribe(Metric.FAT_PERCENTAGE, fat_values.append)
-    fat_values.clear()
+    calls = _count_calculations(handler, Metric.FAT_PERCENTAGE)
+    del handler._available_metrics[Metric.FAT_PERCENTAGE]
 
     hass.states.async_set("binary_sensor.stabilized_imp", "on")
     await hass.async_block_till_done()
 
-    assert fat_values, "Stabilized ON must trigger the impedance pass"
+    assert calls, "Stabilized ON must trigger the impedance pass"
     handler.unload()
 
 
@@ -1091,6 +2096,21 @@ async def test_handler_bootstrap_replays_existing_sensor_state(
     handler.unload()
 
 
+async def test_handler_bootstrap_does_not_stamp_measurement_time(
+    hass: HomeAssistant,
+) -> None:
+    """Replaying existing sensor states at startup is not a new measurement."""
+    hass.states.async_set("sensor.w_preexisting_stamp", "66.0")
+    await hass.async_block_till_done()
+
+    config = _make_config(weight_sensor="sensor.w_preexisting_stamp")
+    handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
+
+    assert handler.current_weight == pytest.approx(66.0, abs=0.01)
+    assert Metric.LAST_MEASUREMENT_TIME not in handler._available_metrics
+    handler.unload()
+
+
 # ===========================================================================
 # _on_state_change / _on_state_report — timestamp dedup
 # ===========================================================================
@@ -1127,7 +2147,7 @@ async def test_state_changed_duplicate_timestamp_is_deduped(
 async def test_state_reported_processes_unchanged_value(
     hass: HomeAssistant,
 ) -> None:
-    """A state_reported event (even for an unchanged value) must be processed."""
+    """A state_reported event must be processed without republishing the value."""
     config = _make_config(weight_sensor="sensor.w_reported")
     handler = BodyScaleMetricsHandler(hass, config, config_entry_id="e1")
 
@@ -1137,6 +2157,10 @@ async def test_state_reported_processes_unchanged_value(
     weight_values: list[Any] = []
     handler.subscribe(Metric.WEIGHT, weight_values.append)
     weight_values.clear()
+    time_values: list[Any] = []
+    handler.subscribe(Metric.LAST_MEASUREMENT_TIME, time_values.append)
+    time_values.clear()
+    suppressed = handler.suppressed_notifications
 
     hass.bus.async_fire(
         EVENT_STATE_REPORTED,
@@ -1144,7 +2168,9 @@ async def test_state_reported_processes_unchanged_value(
     )
     await hass.async_block_till_done()
 
-    assert weight_values, "state_reported must re-process the current value"
+    assert time_values, "state_reported must re-process the current value"
+    assert weight_values == []
+    assert handler.suppressed_notifications > suppressed
     handler.unload()
 
 
@@ -2,25 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_NAME,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from custom_components.bodymiscale.const import (
     CONF_NEAREST_TOLERANCE,
     CONF_NOTIFY_WEIGHT_MAX,
     CONF_NOTIFY_WEIGHT_MIN,
+    CONF_PROFILE_ID,
+    CONF_PROFILE_METHOD,
+    CONF_SENSOR_PROFILE_ID,
+    CONF_WEIGHT_MAX,
+    CONF_WEIGHT_MIN,
     DOMAIN,
     EVENT_MOBILE_APP_NOTIFICATION_ACTION,
     HANDLERS,
+    NOTIFICATION_ACTION_PREFIX,
+    PENDING_MEASUREMENT_TIMEOUT,
+    PENDING_QUEUE_SIZE,
+    PENDING_SAVE_DELAY,
+    PENDING_STORAGE_KEY,
+    PROFILE_ID_ROUTER,
     PROFILE_METHOD_NEAREST,
+    PROFILE_METHOD_WEIGHT,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
 )
+from custom_components.bodymiscale.models import Metric
 from custom_components.bodymiscale.profile import (
     NearestWeightFilter,
+    NearestWeightRouter,
     NotificationCoordinator,
     NotificationFilter,
+    ProfileIdFilter,
+    ProfileIdRouter,
+    WeightRangeFilter,
+    WeightRangeIndex,
     build_profile_filter,
+    notification_action,
 )
 
 # ===========================================================================
@@ -155,6 +188,265 @@ async def test_nearest_case_insensitive_name_match(hass: HomeAssistant) -> None:
     assert f.accepts(hass, config, 65.0) is True
 
 
+# ===========================================================================
+# NearestWeightRouter
+# ===========================================================================
+
+
+def _scan_winner(weights: dict[str, float], weight: float) -> tuple[str, float]:
+    """Return the winner of a linear scan with alphabetical tie-break."""
+    best = min(abs(w - weight) for w in weights.values())
+    return min(n for n, w in weights.items() if abs(w - weight) == best), best
+
+
+def test_router_matches_linear_scan() -> None:
+    """The bisect lookup must pick the same profile as a full scan."""
+    weights = {
+        "alice": 58.4,
+        "bob": 81.0,
+        "carol": 70.0,
+        "dave": 70.0,
+        "eve": 64.2,
+        "frank": 75.8,
+    }
+    router = NearestWeightRouter()
+    for name, weight in weights.items():
+        router.update(name, weight)
+
+    for measured in (40.0, 58.4, 61.3, 67.1, 70.0, 72.9, 75.8, 78.4, 120.0):
+        assert router.resolve(measured) == _scan_winner(weights, measured)
+
+
+def test_router_update_and_remove_reindex() -> None:
+    """Moving or removing a profile must invalidate the cached decision."""
+    router = NearestWeightRouter()
+    router.update("Alice", 65.0)
+    router.update("Bob", 80.0)
+    assert router.resolve(72.0) == ("alice", 7.0)
+
+    router.update("Bob", 74.0)
+    assert router.resolve(72.0) == ("bob", 2.0)
+    assert router.weight_of("BOB") == 74.0
+
+    router.remove("bob")
+    assert router.weight_of("Bob") is None
+    assert router.resolve(72.0) == ("alice", 7.0)
+
+    router.remove("alice")
+    assert router.resolve(72.0) is None
+
+
+async def test_nearest_uses_domain_router(hass: HomeAssistant) -> None:
+    """With a running router, the filter must not need the handler scan."""
+    router = NearestWeightRouter()
+    router.update("Alice", 65.0)
+    router.update("Bob", 80.0)
+    hass.data[DOMAIN] = {HANDLERS: {}, WEIGHT_ROUTER: router}
+
+    f = NearestWeightFilter()
+    assert f.accepts(hass, {CONF_NAME: "Alice"}, 66.0) is True
+    assert f.accepts(hass, {CONF_NAME: "Bob"}, 66.0) is False
+    assert f.accepts(hass, {CONF_NAME: "Carol"}, 66.0) is False
+
+
+# ===========================================================================
+# WeightRangeIndex
+# ===========================================================================
+
+
+def test_weight_range_index_owner() -> None:
+    """A weight must resolve to the profile whose [min, max[ contains it."""
+    index = WeightRangeIndex()
+    index.update("alice", 50.0, 65.0)
+    index.update("bob", 80.0, 100.0)
+    index.update("carol", 65.0, 80.0)
+
+    assert index.owner(49.9) is None
+    assert index.owner(50.0) == "alice"
+    assert index.owner(64.99) == "alice"
+    assert index.owner(65.0) == "carol"
+    assert index.owner(80.0) == "bob"
+    assert index.owner(100.0) is None
+
+
+def test_weight_range_index_update_and_remove() -> None:
+    """Moving or removing a range must reindex it."""
+    index = WeightRangeIndex()
+    index.update("alice", 50.0, 65.0)
+    index.update("alice", 70.0, 90.0)
+    assert len(index) == 1
+    assert index.range_of("alice") == (70.0, 90.0)
+    assert index.owner(60.0) is None
+    assert index.owner(75.0) == "alice"
+
+    index.remove("alice")
+    assert len(index) == 0
+    assert index.owner(75.0) is None
+
+
+def test_weight_range_index_overlapping() -> None:
+    """Overlap detection must match the pairwise interval test."""
+    index = WeightRangeIndex.from_configs(
+        {
+            "alice": {
+                CONF_NAME: "Alice",
+                CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+                CONF_WEIGHT_MIN: 50.0,
+                CONF_WEIGHT_MAX: 65.0,
+            },
+            "bob": {
+                CONF_NAME: "Bob",
+                CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+                CONF_WEIGHT_MIN: 80.0,
+                CONF_WEIGHT_MAX: 100.0,
+            },
+            # Not a weight-range profile — ignored.
+            "carol": {CONF_NAME: "Carol", CONF_PROFILE_METHOD: PROFILE_METHOD_NEAREST},
+        }
+    )
+    assert len(index) == 2
+    assert index.overlapping(65.0, 80.0) is None
+    assert index.overlapping(40.0, 50.0) is None
+    assert index.overlapping(60.0, 70.0) == "alice"
+    assert index.overlapping(70.0, 85.0) == "bob"
+    assert index.overlapping(30.0, 120.0) == "bob"
+
+
+def test_weight_range_index_from_configs_keeps_every_range() -> None:
+    """Unnamed configs and names differing in case must all be indexed."""
+    index = WeightRangeIndex.from_configs(
+        [
+            {
+                CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+                CONF_WEIGHT_MIN: 50.0,
+                CONF_WEIGHT_MAX: 60.0,
+            },
+            {
+                CONF_NAME: "alice",
+                CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+                CONF_WEIGHT_MIN: 60.0,
+                CONF_WEIGHT_MAX: 70.0,
+            },
+            {
+                CONF_NAME: "Alice",
+                CONF_PROFILE_METHOD: PROFILE_METHOD_WEIGHT,
+                CONF_WEIGHT_MIN: 80.0,
+                CONF_WEIGHT_MAX: 90.0,
+            },
+        ]
+    )
+    assert len(index) == 3
+    assert index.overlapping(55.0, 56.0) == "#0"
+    assert index.overlapping(65.0, 66.0) == "#1"
+    assert index.overlapping(85.0, 86.0) == "#2"
+
+
+def test_weight_range_index_with_overlapping_legacy_ranges() -> None:
+    """A wide range hidden behind a later-starting one must still be found."""
+    index = WeightRangeIndex()
+    index.update("alice", 50.0, 100.0)
+    index.update("bob", 60.0, 70.0)
+
+    # Bob starts last before both bounds but ends before them.
+    assert index.overlapping(80.0, 90.0) == "alice"
+    assert index.owner(85.0) == "alice"
+    # Inside both ranges the range starting last wins.
+    assert index.overlapping(62.0, 65.0) == "bob"
+    assert index.owner(65.0) == "bob"
+    assert index.overlapping(100.0, 110.0) is None
+    assert index.owner(100.0) is None
+
+    index.remove("alice")
+    assert index.overlapping(80.0, 90.0) is None
+    assert index.owner(85.0) is None
+
+
+async def test_weight_range_filter_uses_domain_index(hass: HomeAssistant) -> None:
+    """With a domain index, overlapping legacy ranges must have one owner."""
+    index = WeightRangeIndex()
+    index.update("entry_alice", 50.0, 75.0)
+    index.update("entry_bob", 70.0, 90.0)
+    hass.data[DOMAIN] = {WEIGHT_RANGES: index}
+
+    alice_filter = WeightRangeFilter()
+    alice_filter.index_key = "entry_alice"
+    bob_filter = WeightRangeFilter()
+    bob_filter.index_key = "entry_bob"
+    alice = {CONF_NAME: "Alice", CONF_WEIGHT_MIN: 50.0, CONF_WEIGHT_MAX: 75.0}
+    bob = {CONF_NAME: "Bob", CONF_WEIGHT_MIN: 70.0, CONF_WEIGHT_MAX: 90.0}
+    assert alice_filter.accepts(hass, alice, 60.0) is True
+    assert alice_filter.accepts(hass, alice, 72.0) is False
+    assert bob_filter.accepts(hass, bob, 72.0) is True
+    hass.data.pop(DOMAIN)
+
+
+# ===========================================================================
+# ProfileIdRouter
+# ===========================================================================
+
+
+async def test_profile_id_router_caches_current_id(hass: HomeAssistant) -> None:
+    """The parsed ID must follow the sensor and route to its owners."""
+    hass.states.async_set("sensor.scale_profile", "1")
+    router = ProfileIdRouter(hass)
+    router.register("Alice", "sensor.scale_profile", 1)
+    router.register("Bob", "sensor.scale_profile", 2)
+    assert router.tracked_entities == {"sensor.scale_profile"}
+    assert router.current_id("sensor.scale_profile") == 1
+    assert router.owners("sensor.scale_profile") == {"alice"}
+
+    hass.states.async_set("sensor.scale_profile", "2.0")
+    await hass.async_block_till_done()
+    assert router.owners("sensor.scale_profile") == {"bob"}
+
+    hass.states.async_set("sensor.scale_profile", "unknown")
+    await hass.async_block_till_done()
+    assert router.current_id("sensor.scale_profile") is None
+    assert router.owners("sensor.scale_profile") == frozenset()
+    router.unload()
+    assert router.tracked_entities == frozenset()
+
+
+async def test_profile_id_router_unregister_stops_tracking(
+    hass: HomeAssistant,
+) -> None:
+    """A sensor must stay tracked until its last profile unregisters."""
+    router = ProfileIdRouter(hass)
+    router.register("Alice", "sensor.scale_profile", 1)
+    router.register("Bob", "sensor.scale_profile", 2)
+
+    router.unregister("ALICE")
+    assert not router.is_registered("Alice")
+    assert router.tracked_entities == {"sensor.scale_profile"}
+    router.unregister("Bob")
+    assert router.tracked_entities == frozenset()
+
+    hass.states.async_set("sensor.scale_profile", "2")
+    await hass.async_block_till_done()
+    assert router.current_id("sensor.scale_profile") is None
+
+
+async def test_profile_id_filter_uses_domain_router(hass: HomeAssistant) -> None:
+    """Registered profiles must be routed by the cached profile ID."""
+    hass.states.async_set("sensor.scale_profile", "2")
+    router = ProfileIdRouter(hass)
+    router.register("Alice", "sensor.scale_profile", 1)
+    router.register("Bob", "sensor.scale_profile", 2)
+    hass.data[DOMAIN] = {PROFILE_ID_ROUTER: router}
+
+    f = ProfileIdFilter()
+    alice = {
+        CONF_NAME: "Alice",
+        CONF_SENSOR_PROFILE_ID: "sensor.scale_profile",
+        CONF_PROFILE_ID: 1,
+    }
+    bob = {**alice, CONF_NAME: "Bob", CONF_PROFILE_ID: 2}
+    assert f.accepts(hass, alice, 70.0) is False
+    assert f.accepts(hass, bob, 70.0) is True
+    router.unload()
+    hass.data.pop(DOMAIN)
+
+
 # ===========================================================================
 # build_profile_filter
 # ===========================================================================
@@ -273,7 +565,7 @@ async def test_on_notification_action_confirms_matching_user(
 
     hass.bus.async_fire(
         EVENT_MOBILE_APP_NOTIFICATION_ACTION,
-        {"action": "ALICE"},
+        {"action": notification_action("e1")},
     )
     await hass.async_block_till_done()
 
@@ -282,27 +574,26 @@ async def test_on_notification_action_confirms_matching_user(
     coord.unload()
 
 
-async def test_on_notification_action_case_insensitive(hass: HomeAssistant) -> None:
-    """Action matching must be case-insensitive."""
+async def test_on_notification_action_names_differing_in_case(
+    hass: HomeAssistant,
+) -> None:
+    """Users whose names only differ in case must keep their own actions."""
     coord = _make_coordinator(hass)
-    notify_filter = _make_filter()
-    handler = _make_handler_mock()
-
-    coord.register(
-        entry_id="e1",
-        user_name="Alice",
-        notify_filter=notify_filter,
-        device_id="d1",
-        handler=handler,
-    )
+    filter_upper, filter_lower = _make_filter(), _make_filter()
+    handler_upper, handler_lower = _make_handler_mock(), _make_handler_mock()
+    coord.register("e_upper", "Alice", filter_upper, "d1", handler_upper)
+    coord.register("e_lower", "alice", filter_lower, "d1", handler_lower)
+    coord.unregister("e_upper")
 
     hass.bus.async_fire(
         EVENT_MOBILE_APP_NOTIFICATION_ACTION,
-        {"action": "alice"},
+        {"action": f"{NOTIFICATION_ACTION_PREFIX}e_lower"},
     )
     await hass.async_block_till_done()
 
-    assert notify_filter.is_confirmed() is True
+    assert filter_lower.is_confirmed() is True
+    handler_lower.accept_pending_measurement.assert_called_once()
+    handler_upper.accept_pending_measurement.assert_not_called()
     coord.unload()
 
 
@@ -324,7 +615,7 @@ async def test_on_notification_action_ignores_unrelated_action(
 
     hass.bus.async_fire(
         EVENT_MOBILE_APP_NOTIFICATION_ACTION,
-        {"action": "BOB"},
+        {"action": notification_action("e_bob")},
     )
     await hass.async_block_till_done()
 
@@ -348,7 +639,7 @@ async def test_on_notification_action_routes_to_correct_user(
 
     hass.bus.async_fire(
         EVENT_MOBILE_APP_NOTIFICATION_ACTION,
-        {"action": "BOB"},
+        {"action": notification_action("e_bob")},
     )
     await hass.async_block_till_done()
 
@@ -359,6 +650,41 @@ async def test_on_notification_action_routes_to_correct_user(
     coord.unload()
 
 
+async def test_on_notification_action_ignores_foreign_actions(
+    hass: HomeAssistant,
+) -> None:
+    """Actions of other notifications must be filtered out before routing."""
+    coord = _make_coordinator(hass)
+    handler = _make_handler_mock()
+    coord.register("e1", "Alice", _make_filter(), "d1", handler)
+
+    with patch.object(coord, "_entries", wraps=coord._entries) as entries:
+        hass.bus.async_fire(EVENT_MOBILE_APP_NOTIFICATION_ACTION, {"action": "ALICE"})
+        hass.bus.async_fire(EVENT_MOBILE_APP_NOTIFICATION_ACTION, {"action": "URI"})
+        hass.bus.async_fire(EVENT_MOBILE_APP_NOTIFICATION_ACTION, {})
+        await hass.async_block_till_done()
+
+    entries.get.assert_not_called()
+    handler.accept_pending_measurement.assert_not_called()
+    coord.unload()
+
+
+async def test_unregister_removes_action_route(hass: HomeAssistant) -> None:
+    """An unregistered user must no longer be routed."""
+    coord = _make_coordinator(hass)
+    handler = _make_handler_mock()
+    coord.register("e1", "Alice", _make_filter(), "d1", handler)
+    coord.unregister("e1")
+
+    hass.bus.async_fire(
+        EVENT_MOBILE_APP_NOTIFICATION_ACTION, {"action": notification_action("e1")}
+    )
+    await hass.async_block_till_done()
+
+    handler.accept_pending_measurement.assert_not_called()
+    coord.unload()
+
+
 # ===========================================================================
 # NotificationCoordinator — async_notify weight pre-filter
 # ===========================================================================
@@ -829,3 +1155,374 @@ async def test_get_notify_translations_falls_back_to_english(
 
     assert isinstance(result, dict)
     coord.unload()
+
+
+async def test_get_notify_translations_cached_per_language(
+    hass: HomeAssistant,
+) -> None:
+    """Translations must be read from disk once per language."""
+    coord = _make_coordinator(hass)
+    hass.config.language = "fr"
+
+    with patch(
+        "custom_components.bodymiscale.profile._load_notify_translations",
+        return_value={"weighing_title": "Qui se pèse ?"},
+    ) as mock_load:
+        await coord.async_load_translations()
+        first = await coord._get_notify_translations("fr")
+        second = await coord._get_notify_translations("fr")
+
+    assert first == second == {"weighing_title": "Qui se pèse ?"}
+    mock_load.assert_called_once_with("fr")
+    coord.unload()
+
+
+async def test_language_change_reloads_translations(hass: HomeAssistant) -> None:
+    """A core config language change must drop and reload the cache."""
+    coord = _make_coordinator(hass)
+    hass.config.language = "en"
+
+    with patch(
+        "custom_components.bodymiscale.profile._load_notify_translations",
+        side_effect=lambda language: {"weighing_title": language},
+    ) as mock_load:
+        await coord.async_load_translations()
+        hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE, {"latitude": 1.0})
+        await hass.async_block_till_done()
+        assert mock_load.call_count == 1
+
+        hass.config.language = "fr"
+        hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE, {"language": "fr"})
+        await hass.async_block_till_done()
+        assert mock_load.call_count == 2
+        assert await coord._get_notify_translations("fr") == {"weighing_title": "fr"}
+        assert mock_load.call_count == 2
+
+    coord.unload()
+
+
+# ===========================================================================
+# NotificationCoordinator — notify service cache
+# ===========================================================================
+
+
+async def test_notify_service_resolved_once_per_device(hass: HomeAssistant) -> None:
+    """Later weighings must reuse the service resolved for a device."""
+    coord = _make_coordinator(hass)
+    mock_resolve = AsyncMock(return_value="mobile_app_d1")
+
+    with patch.object(coord, "_resolve_notify_service", new=mock_resolve):
+        assert await coord._async_get_notify_service("d1") == "mobile_app_d1"
+        assert await coord._async_get_notify_service("d1") == "mobile_app_d1"
+
+    mock_resolve.assert_awaited_once_with("d1")
+    coord.unload()
+
+
+async def test_notify_service_unresolved_is_not_cached(hass: HomeAssistant) -> None:
+    """A device without a service must be resolved again next time."""
+    coord = _make_coordinator(hass)
+    mock_resolve = AsyncMock(side_effect=[None, "mobile_app_d1"])
+
+    with patch.object(coord, "_resolve_notify_service", new=mock_resolve):
+        assert await coord._async_get_notify_service("d1") is None
+        assert await coord._async_get_notify_service("d1") == "mobile_app_d1"
+
+    assert mock_resolve.await_count == 2
+    coord.unload()
+
+
+async def test_notify_service_cache_invalidation(hass: HomeAssistant) -> None:
+    """Registry and notify service changes must drop stale resolutions."""
+    coord = _make_coordinator(hass)
+    coord._notify_services.update({"d1": "mobile_app_d1", "d2": "mobile_app_d2"})
+
+    hass.bus.async_fire(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED, {"action": "update", "device_id": "d1"}
+    )
+    await hass.async_block_till_done()
+    assert coord._notify_services == {"d2": "mobile_app_d2"}
+
+    hass.bus.async_fire(EVENT_SERVICE_REGISTERED, {"domain": "light", "service": "x"})
+    await hass.async_block_till_done()
+    assert coord._notify_services == {"d2": "mobile_app_d2"}
+
+    hass.bus.async_fire(
+        EVENT_SERVICE_REMOVED, {"domain": "notify", "service": "mobile_app_d2"}
+    )
+    await hass.async_block_till_done()
+    assert coord._notify_services == {}
+
+    coord._notify_services["d1"] = "mobile_app_d1"
+    hass.bus.async_fire(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "remove", "entity_id": "sensor.phone_battery"},
+    )
+    await hass.async_block_till_done()
+    assert coord._notify_services == {}
+    coord.unload()
+
+
+# ===========================================================================
+# NotificationCoordinator — concurrent fan-out
+# ===========================================================================
+
+
+def _register_devices(coord: NotificationCoordinator, *devices: str) -> None:
+    for device_id in devices:
+        coord.register(
+            f"entry_{device_id}",
+            device_id.capitalize(),
+            _make_filter(),
+            device_id,
+            _make_handler_mock(config={}),
+        )
+
+
+async def test_async_notify_sends_to_devices_concurrently(
+    hass: HomeAssistant,
+) -> None:
+    """Every device must be notified without waiting for the others."""
+    coord = _make_coordinator(hass)
+    _register_devices(coord, "alice", "bob")
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def slow_call(
+        _registry: Any, domain: str, service: str, data: dict, blocking: bool = False
+    ) -> None:
+        assert blocking, "The delivery must be awaited"
+        started.append(service)
+        await release.wait()
+
+    async def mock_resolve(device_id: str) -> str:
+        return f"mobile_app_{device_id}"
+
+    with (
+        patch.object(coord, "_get_notify_translations", new=AsyncMock(return_value={})),
+        patch.object(coord, "_resolve_notify_service", new=mock_resolve),
+        patch("homeassistant.core.ServiceRegistry.async_call", new=slow_call),
+    ):
+        task = hass.async_create_task(coord.async_notify(70.0))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert sorted(started) == ["mobile_app_alice", "mobile_app_bob"]
+        release.set()
+        await task
+
+    assert coord.delivery_times.keys() == {"alice", "bob"}
+    coord.unload()
+
+
+async def test_async_notify_isolates_failing_devices(hass: HomeAssistant) -> None:
+    """A device that fails or times out must not stop the others."""
+    coord = _make_coordinator(hass)
+    _register_devices(coord, "alice", "bob", "carol")
+    sent: list[str] = []
+
+    async def flaky_call(
+        _registry: Any, domain: str, service: str, data: dict, blocking: bool = False
+    ) -> None:
+        if service == "mobile_app_alice":
+            raise HomeAssistantError("push service down")
+        if service == "mobile_app_bob":
+            await asyncio.sleep(60)
+        sent.append(service)
+
+    async def mock_resolve(device_id: str) -> str:
+        return f"mobile_app_{device_id}"
+
+    with (
+        patch.object(coord, "_resolve_notify_service", new=mock_resolve),
+        patch("homeassistant.core.ServiceRegistry.async_call", new=flaky_call),
+        patch("custom_components.bodymiscale.profile.NOTIFY_TIMEOUT", 0.01),
+    ):
+        await coord.async_notify(70.0)
+
+    assert sent == ["mobile_app_carol"]
+    assert coord.delivery_times.keys() == {"carol"}
+    coord.unload()
+
+
+async def test_async_notify_isolates_failing_notify_services(
+    hass: HomeAssistant,
+) -> None:
+    """Raising or slow notify services must not stop the other devices."""
+    coord = _make_coordinator(hass)
+    _register_devices(coord, "alice", "bob", "carol")
+    delivered: list[str] = []
+
+    async def failing(call: ServiceCall) -> None:
+        raise HomeAssistantError("push service down")
+
+    async def slow(call: ServiceCall) -> None:
+        await asyncio.sleep(60)
+
+    async def working(call: ServiceCall) -> None:
+        delivered.append(call.service)
+
+    hass.services.async_register("notify", "mobile_app_alice", failing)
+    hass.services.async_register("notify", "mobile_app_bob", slow)
+    hass.services.async_register("notify", "mobile_app_carol", working)
+
+    async def mock_resolve(device_id: str) -> str:
+        return f"mobile_app_{device_id}"
+
+    with (
+        patch.object(coord, "_get_notify_translations", new=AsyncMock(return_value={})),
+        patch.object(coord, "_resolve_notify_service", new=mock_resolve),
+        patch("custom_components.bodymiscale.profile.NOTIFY_TIMEOUT", 0.05),
+    ):
+        await coord.async_notify(70.0)
+
+    assert delivered == ["mobile_app_carol"]
+    # Only the delivered notification is timed.
+    assert coord.delivery_times.keys() == {"carol"}
+    coord.unload()
+
+
+# ===========================================================================
+# NotificationCoordinator — pending measurement queue
+# ===========================================================================
+
+
+async def test_add_measurement_queues_each_weighing_once(hass: HomeAssistant) -> None:
+    """Handlers seeing the same weighing must queue it only once."""
+    coord = _make_coordinator(hass)
+    measured = dt_util.utcnow()
+
+    first = coord.add_measurement("sensor.weight", 70.0, measured)
+    assert first is not None
+    assert coord.add_measurement("sensor.weight", 70.0, measured) is None
+    second = coord.add_measurement(
+        "sensor.weight", 82.0, measured + timedelta(seconds=30)
+    )
+    assert second is not None
+
+    coord.add_impedance("sensor.weight", Metric.IMPEDANCE, 480.0)
+    assert [m.weight for m in coord.pending_measurements] == [70.0, 82.0]
+    assert first.impedance == {}
+    assert second.impedance == {Metric.IMPEDANCE: 480.0}
+    coord.unload()
+
+
+async def test_pending_queue_is_bounded(hass: HomeAssistant) -> None:
+    """The oldest measurement must be dropped when the queue is full."""
+    coord = _make_coordinator(hass)
+    start = dt_util.utcnow()
+    for i in range(PENDING_QUEUE_SIZE + 2):
+        coord.add_measurement("sensor.weight", 60.0 + i, start + timedelta(seconds=i))
+
+    weights = [m.weight for m in coord.pending_measurements]
+    assert len(weights) == PENDING_QUEUE_SIZE
+    assert weights[0] == 62.0
+    coord.unload()
+
+
+async def test_expired_measurements_are_pruned(hass: HomeAssistant) -> None:
+    """Measurements older than the timeout must not be kept."""
+    coord = _make_coordinator(hass)
+    old = dt_util.utcnow() - timedelta(seconds=PENDING_MEASUREMENT_TIMEOUT + 1)
+    coord.add_measurement("sensor.weight", 70.0, old)
+    coord.add_measurement("sensor.weight", 71.0, dt_util.utcnow())
+
+    assert [m.weight for m in coord.pending_measurements] == [71.0]
+    coord.unload()
+
+
+async def test_notification_actions_carry_measurement_id(
+    hass: HomeAssistant,
+) -> None:
+    """Each action must name the queued measurement it confirms."""
+    coord = _make_coordinator(hass)
+    coord.register("e1", "Alice", _make_filter(), "d1", _make_handler_mock())
+
+    with (
+        patch.object(
+            coord,
+            "_resolve_notify_service",
+            new=AsyncMock(return_value="mobile_app_d1"),
+        ),
+        patch(
+            "homeassistant.core.ServiceRegistry.async_call", new_callable=AsyncMock
+        ) as mock_call,
+    ):
+        await coord.async_notify(70.0, "0a1b2c3d")
+
+    actions = mock_call.call_args[0][2]["data"]["actions"]
+    assert actions == [
+        {"action": notification_action("e1", "0a1b2c3d"), "title": "Alice"}
+    ]
+    coord.unload()
+
+
+async def test_action_replays_the_confirmed_measurement(hass: HomeAssistant) -> None:
+    """Back-to-back weighings must each be confirmable by their own action."""
+    coord = _make_coordinator(hass)
+    filter_alice, filter_bob = _make_filter(), _make_filter()
+    handler_alice, handler_bob = _make_handler_mock(), _make_handler_mock()
+    coord.register("e_alice", "Alice", filter_alice, "d1", handler_alice)
+    coord.register("e_bob", "Bob", filter_bob, "d1", handler_bob)
+
+    measured = dt_util.utcnow()
+    first = coord.add_measurement("sensor.weight", 62.0, measured)
+    second = coord.add_measurement(
+        "sensor.weight", 84.0, measured + timedelta(seconds=40)
+    )
+    assert first is not None and second is not None
+
+    hass.bus.async_fire(
+        EVENT_MOBILE_APP_NOTIFICATION_ACTION,
+        {"action": notification_action("e_bob", second.measurement_id)},
+    )
+    hass.bus.async_fire(
+        EVENT_MOBILE_APP_NOTIFICATION_ACTION,
+        {"action": notification_action("e_alice", first.measurement_id)},
+    )
+    await hass.async_block_till_done()
+
+    handler_bob.accept_pending_measurement.assert_called_once_with(second)
+    handler_alice.accept_pending_measurement.assert_called_once_with(first)
+    assert coord.pending_measurements == []
+
+    # Tapping again on a measurement already confirmed does nothing.
+    hass.bus.async_fire(
+        EVENT_MOBILE_APP_NOTIFICATION_ACTION,
+        {"action": notification_action("e_alice", first.measurement_id)},
+    )
+    await hass.async_block_till_done()
+    assert handler_alice.accept_pending_measurement.call_count == 1
+    assert filter_alice.is_confirmed() is True  # armed once, not consumed
+    coord.unload()
+
+
+async def test_pending_queue_survives_restart(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """The queue must be saved and restored by the next coordinator."""
+    coord = _make_coordinator(hass)
+    measurement = coord.add_measurement("sensor.weight", 70.0, dt_util.utcnow())
+    assert measurement is not None
+    coord.add_impedance("sensor.weight", Metric.IMPEDANCE, 480.0)
+    await coord.async_save_pending()
+    coord.unload()
+    assert hass_storage[PENDING_STORAGE_KEY]["data"]["pending"][0]["weight"] == 70.0
+
+    restored = _make_coordinator(hass)
+    await restored.async_load()
+    assert restored.pending_measurements == [measurement]
+    restored.unload()
+
+
+async def test_pending_queue_save_is_debounced(hass: HomeAssistant) -> None:
+    """Queue changes must go through a delayed store write."""
+    coord = _make_coordinator(hass)
+    with patch.object(coord._store, "async_delay_save") as mock_save:
+        coord.add_measurement("sensor.weight", 70.0, dt_util.utcnow())
+        coord.add_impedance("sensor.weight", Metric.IMPEDANCE, 480.0)
+
+    assert mock_save.call_count == 2
+    data_func, delay = mock_save.call_args[0]
+    assert delay == PENDING_SAVE_DELAY
+    assert data_func()["pending"][0]["impedance"] == {"impedance": 480.0}
+    coord.unload()
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorEntityDescription, SensorStateClass
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -22,6 +23,7 @@ from custom_components.bodymiscale.const import (
     ATTR_INTRACELLULAR_WATER,
     ATTR_LAST_MEASUREMENT_TIME,
     ATTR_LBM,
+    ATTR_MEASUREMENT_LATENCY,
     ATTR_MUSCLE,
     ATTR_VISCERAL,
     ATTR_WATER,
@@ -36,9 +38,16 @@ from custom_components.bodymiscale.const import (
     IMPEDANCE_MODE_NONE,
     IMPEDANCE_MODE_STANDARD,
 )
-from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.metrics import (
+    BodyScaleMetricsHandler,
+    CycleLatency,
+)
 from custom_components.bodymiscale.models import Metric
-from custom_components.bodymiscale.sensor import BodyScaleSensor, async_setup_entry
+from custom_components.bodymiscale.sensor import (
+    BodyScaleLatencySensor,
+    BodyScaleSensor,
+    async_setup_entry,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -73,6 +82,7 @@ def _make_handler(
     handler.config_entry_id = "entry_test"
     handler.subscribe = MagicMock(return_value=lambda: None)
     handler.restore_metric = MagicMock()
+    handler.last_cycle_latency = None
     return handler
 
 
@@ -146,6 +156,12 @@ async def test_sensor_setup_no_impedance_creates_base_sensors(
     assert CONF_SENSOR_IMPEDANCE_LOW not in keys
     assert CONF_SENSOR_IMPEDANCE_HIGH not in keys
 
+    # Latency diagnostic sensor — created but disabled by default
+    latency = next(s for s in sensors if isinstance(s, BodyScaleLatencySensor))
+    assert latency.entity_description.key == ATTR_MEASUREMENT_LATENCY
+    assert latency.entity_category is EntityCategory.DIAGNOSTIC
+    assert latency.entity_registry_enabled_default is False
+
 
 async def test_sensor_setup_standard_impedance_includes_shared_sensors(
     hass: HomeAssistant,
@@ -573,6 +589,31 @@ async def test_on_value_non_numeric_stored_as_is(hass: HomeAssistant) -> None:
     assert sensor._attr_native_value == "unavailable"
 
 
+async def test_on_value_unchanged_value_skips_state_write(hass: HomeAssistant) -> None:
+    """on_value must not write the state again when the rounded value is unchanged."""
+    sensor = _make_sensor(precision=1)
+    sensor.hass = hass
+
+    received_callbacks: list[Any] = []
+    sensor._handler.subscribe = MagicMock(
+        side_effect=lambda metric, cb: received_callbacks.append(cb) or (lambda: None)
+    )
+
+    with patch.object(
+        sensor, "async_get_last_sensor_data", new=AsyncMock(return_value=None)
+    ):
+        await sensor.async_added_to_hass()
+
+    on_value = received_callbacks[0]
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        on_value(22.71)
+        on_value(22.69)
+        on_value(23.0)
+
+    assert mock_write.call_count == 2
+    assert sensor._attr_native_value == pytest.approx(23.0)
+
+
 # ===========================================================================
 # on_value closure — get_attributes populated (lines 465-470)
 # ===========================================================================
@@ -605,3 +646,54 @@ async def test_on_value_populates_extra_attributes(hass: HomeAssistant) -> None:
 
     assert sensor._attr_extra_state_attributes.get("bmi_label") == "normal"
     assert attr_calls[0] == pytest.approx(22.5)
+
+
+# ===========================================================================
+# BodyScaleLatencySensor
+# ===========================================================================
+
+
+async def test_latency_sensor_reports_breakdown_in_ms(hass: HomeAssistant) -> None:
+    """Each published cycle must update the total and the stage attributes."""
+    handler = _make_handler()
+    captured: list[Any] = []
+    handler.subscribe_latency = MagicMock(
+        side_effect=lambda cb: captured.append(cb) or (lambda: None)
+    )
+    sensor = BodyScaleLatencySensor(handler)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.alice_measurement_latency"
+
+    await sensor.async_added_to_hass()
+    assert sensor.native_value is None
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        captured[0](CycleLatency(ingest=0.75, filter=0.0, compute=0.0004, publish=2.0))
+
+    mock_write.assert_called_once()
+    assert sensor.native_value == 2750.4
+    assert sensor.extra_state_attributes == {
+        "ingest": 750.0,
+        "filter": 0.0,
+        "compute": 0.4,
+        "publish": 2000.0,
+    }
+
+
+async def test_latency_sensor_shows_last_breakdown_when_added(
+    hass: HomeAssistant,
+) -> None:
+    """A sensor enabled after a measurement must show the last breakdown."""
+    handler = _make_handler()
+    handler.subscribe_latency = MagicMock(return_value=lambda: None)
+    handler.last_cycle_latency = CycleLatency(
+        ingest=0.5, filter=0.0, compute=0.001, publish=2.0
+    )
+    sensor = BodyScaleLatencySensor(handler)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.alice_measurement_latency"
+
+    await sensor.async_added_to_hass()
+
+    assert sensor.native_value == 2501.0
+    handler.subscribe_latency.assert_called_once()
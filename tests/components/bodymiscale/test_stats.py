@@ -0,0 +1,111 @@
+"""Tests for bodymiscale stats.py (per-cycle long-term statistics)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from pytest_homeassistant_custom_component.typing import RecorderInstanceGenerator
+
+from custom_components.bodymiscale.models import Metric
+from custom_components.bodymiscale.stats import (
+    CycleStatistics,
+    async_import_metric_statistics,
+    statistic_id,
+)
+
+_MEASURED = datetime(2026, 3, 2, 7, 15, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Allow the recorder to be set up before the hass fixture."""
+
+
+async def test_cycle_statistics_one_row_per_metric(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """A completed cycle must import one hourly row per numeric metric."""
+    imported = CycleStatistics(hass, "Alice").async_import(
+        {
+            Metric.LAST_MEASUREMENT_TIME: _MEASURED,
+            Metric.WEIGHT: 70.0,
+            Metric.BMI: 25.7,
+            Metric.STATUS: "ok",
+        },
+    )
+    await async_wait_recording_done(hass)
+
+    assert imported == 2
+    ids = {statistic_id("Alice", Metric.WEIGHT), statistic_id("Alice", Metric.BMI)}
+    stats = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        _MEASURED - timedelta(hours=1),
+        _MEASURED + timedelta(hours=1),
+        ids,
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    assert stats[statistic_id("Alice", Metric.BMI)][0]["mean"] == pytest.approx(25.7)
+    assert stats[statistic_id("Alice", Metric.WEIGHT)][0]["max"] == pytest.approx(70.0)
+
+
+async def test_cycle_statistics_without_measurement_time_skipped(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Without a measurement time there is no hour to attach the rows to."""
+    assert CycleStatistics(hass, "Alice").async_import({Metric.BMI: 25.7}) == 0
+
+
+async def _weight_rows(
+    recorder_mock: Recorder, hass: HomeAssistant, profile: str
+) -> list[dict]:
+    await async_wait_recording_done(hass)
+    stats = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        _MEASURED - timedelta(hours=1),
+        _MEASURED + timedelta(hours=3),
+        {statistic_id(profile, Metric.WEIGHT)},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    return [
+        {key: row[key] for key in ("start", "mean", "min", "max")}
+        for row in stats[statistic_id(profile, Metric.WEIGHT)]
+    ]
+
+
+async def test_cycle_statistics_match_backfill_rows(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Live cycles must aggregate an hour like the recompute_history backfill."""
+    times = [
+        _MEASURED,
+        _MEASURED + timedelta(minutes=20),
+        _MEASURED + timedelta(hours=2),
+    ]
+    weights = [70.0, 72.0, 71.0]
+
+    live = CycleStatistics(hass, "Alice")
+    for when, weight in zip(times, weights, strict=True):
+        live.async_import({Metric.LAST_MEASUREMENT_TIME: when, Metric.WEIGHT: weight})
+    async_import_metric_statistics(
+        hass, "Bob", times, {Metric.WEIGHT: weights}, (Metric.WEIGHT,)
+    )
+
+    alice = await _weight_rows(recorder_mock, hass, "Alice")
+    assert alice == await _weight_rows(recorder_mock, hass, "Bob")
+    assert alice[0]["mean"] == pytest.approx(71.0)
+    assert (alice[0]["min"], alice[0]["max"]) == (70.0, 72.0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 import pytest
 from freezegun import freeze_time
 
@@ -280,6 +282,12 @@ def test_get_age_birthday_not_yet_this_year() -> None:
     assert get_age("1990-12-31") == 35
 
 
+def test_get_age_at_reference_date() -> None:
+    """A reference date must be used instead of today when given."""
+    assert get_age("1990-06-15", datetime(2020, 6, 14, tzinfo=UTC)) == 29
+    assert get_age("1990-06-15", datetime(2020, 6, 15, tzinfo=UTC)) == 30
+
+
 def test_get_age_invalid_string_returns_zero() -> None:
     """Invalid date string must return 0."""
     assert get_age("not-a-date") == 0
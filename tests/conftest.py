@@ -5,6 +5,77 @@ from __future__ import annotations
 import pytest
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark and replay options."""
+    group = parser.getgroup("bodymiscale benchmarks")
+    group.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks in tests/benchmarks (skipped otherwise).",
+    )
+    group.addoption(
+        "--bench-json",
+        metavar="PATH",
+        default=None,
+        help="Write the benchmark results to PATH as JSON.",
+    )
+    group.addoption(
+        "--bench-compare",
+        action="store_true",
+        default=False,
+        help="Fail benchmarks that regressed compared with the baseline.",
+    )
+    group.addoption(
+        "--bench-baseline",
+        metavar="PATH",
+        default=None,
+        help="Baseline results to compare with (default: tests/benchmarks/baseline.json).",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.5,
+        help="Relative timing regression allowed before failing (default: 0.5).",
+    )
+    group.addoption(
+        "--bench-counter-tolerance",
+        type=float,
+        default=0.1,
+        help=(
+            "Relative regression of allocations and subscriber calls allowed "
+            "before failing (default: 0.1)."
+        ),
+    )
+
+    group = parser.getgroup("bodymiscale replay")
+    group.addoption(
+        "--replay",
+        metavar="PATH",
+        action="append",
+        default=[],
+        help="Replay a JSONL capture of scale events (tests/replay, repeatable).",
+    )
+    group.addoption(
+        "--replay-json",
+        metavar="DIR",
+        default=None,
+        help="Write the metric stream of each replayed capture to DIR as JSONL.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks unless --bench is given."""
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --bench")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations for all tests."""
@@ -0,0 +1,36 @@
+"""Fixtures for the bodymiscale replays."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+CAPTURES = Path(__file__).parent / "captures"
+
+_SUMMARIES_KEY = pytest.StashKey[dict[str, str]]()
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``capture_path`` with the captures given with --replay."""
+    if "capture_path" in metafunc.fixturenames:
+        paths = [Path(path) for path in metafunc.config.getoption("--replay")]
+        metafunc.parametrize("capture_path", paths, ids=[path.name for path in paths])
+
+
+@pytest.fixture(scope="session")
+def replay_summaries(request: pytest.FixtureRequest) -> dict[str, str]:
+    """Collect the summary of every capture replayed with --replay."""
+    return request.config.stash.setdefault(_SUMMARIES_KEY, {})
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Print the summary of every capture replayed with --replay."""
+    summaries = config.stash.get(_SUMMARIES_KEY, None)
+    if not summaries:
+        return
+    terminalreporter.section("replay")
+    for name, summary in summaries.items():
+        terminalreporter.write_line(f"{name}: {summary}")
@@ -0,0 +1,337 @@
+"""Offline replay of recorded scale events through the metrics handlers.
+
+A capture is a JSONL file. Lines with a ``profile`` key hold the config of
+one profile (config entry keys, e.g. ``name``, ``birthday``, ``weight``,
+``impedance_mode``, ``profile_method``); every other line is an HA
+``state_changed`` or ``state_reported`` event as serialized by the event
+bus or a websocket ``subscribe_events`` dump::
+
+    {"profile": {"name": "Alice", "birthday": "1990-01-15", ...}}
+    {"event_type": "state_changed", "time_fired": "2026-05-02T07:12:03.120+00:00",
+     "data": {"entity_id": "sensor.scale_weight",
+              "new_state": {"state": "61.35", "attributes": {...}}}}
+
+``replay`` writes each recorded state into the test ``hass`` in order, so
+the events reach the handlers through the real bus and the shared
+``SensorDispatcher``. The handlers' timers (settle window, pending
+measurement timeout) run on a virtual clock set to the recorded event
+times: a replay runs as fast as the handlers allow but every cycle sees
+the delays of the capture.
+
+Notify profiles are replayed without a notification coordinator: nobody
+confirms their weighings.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.typing import StateType
+
+from custom_components.bodymiscale.const import (
+    DOMAIN,
+    PROFILE_ID_ROUTER,
+    SENSOR_DISPATCHER,
+    WEIGHT_RANGES,
+    WEIGHT_ROUTER,
+)
+from custom_components.bodymiscale.metrics import BodyScaleMetricsHandler
+from custom_components.bodymiscale.metrics.dispatcher import SensorDispatcher
+from custom_components.bodymiscale.models import Metric
+from custom_components.bodymiscale.profile import (
+    NearestWeightRouter,
+    ProfileIdRouter,
+    WeightRangeIndex,
+)
+
+_EVENT_TYPES = (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED)
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureEvent:
+    """One recorded state of a scale sensor."""
+
+    timestamp: float
+    event_type: str
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Capture:
+    """Profiles and events of a capture file."""
+
+    profiles: list[dict[str, Any]] = field(default_factory=list)
+    events: list[CaptureEvent] = field(default_factory=list)
+
+
+def _event_timestamp(raw: Mapping[str, Any], data: Mapping[str, Any]) -> float:
+    """Return when a recorded event happened, as a POSIX timestamp."""
+    new_state = data["new_state"]
+    for value in (
+        raw.get("time_fired"),
+        new_state.get("last_reported"),
+        new_state.get("last_updated"),
+    ):
+        if isinstance(value, (int, float)):
+            return float(value)
+        if value:
+            return datetime.fromisoformat(value).timestamp()
+    raise ValueError(f"Event without time: {raw}")
+
+
+def parse_capture(lines: Iterable[str]) -> Capture:
+    """Parse the lines of a capture; blank lines and other events are skipped."""
+    capture = Capture()
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as err:
+            raise ValueError(f"Line {number} is not JSON: {err}") from err
+        if "profile" in raw:
+            capture.profiles.append(dict(raw["profile"]))
+            continue
+        data = raw.get("data", {})
+        # A removed entity (new_state null) has nothing to replay.
+        if raw.get("event_type") not in _EVENT_TYPES or not data.get("new_state"):
+            continue
+        new_state = data["new_state"]
+        capture.events.append(
+            CaptureEvent(
+                timestamp=_event_timestamp(raw, data),
+                event_type=raw["event_type"],
+                entity_id=data.get("entity_id") or new_state["entity_id"],
+                state=str(new_state["state"]),
+                attributes=new_state.get("attributes") or {},
+            )
+        )
+    return capture
+
+
+def load_capture(path: Path) -> Capture:
+    """Read a capture file."""
+    with path.open(encoding="utf-8") as file:
+        return parse_capture(file)
+
+
+class VirtualClock:
+    """Run the handlers' ``async_call_later`` timers on the capture's time."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+        self._timers: list[tuple[float, int, Callable[[datetime], Any]]] = []
+        self._cancelled: set[int] = set()
+        self._sequence = itertools.count()
+
+    def utcnow(self) -> datetime:
+        """Return the current capture time."""
+        return datetime.fromtimestamp(self.now, UTC)
+
+    def call_later(
+        self,
+        _hass: HomeAssistant,
+        delay: float | timedelta,
+        action: Callable[[datetime], Any],
+    ) -> CALLBACK_TYPE:
+        """Schedule ``action`` like ``async_call_later``, in capture time."""
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        sequence = next(self._sequence)
+        heapq.heappush(self._timers, (self.now + delay, sequence, action))
+
+        def _cancel() -> None:
+            self._cancelled.add(sequence)
+
+        return _cancel
+
+    def advance(self, timestamp: float) -> None:
+        """Fire the timers due up to ``timestamp``, in order, then move there."""
+        while self._timers and self._timers[0][0] <= timestamp:
+            due, sequence, action = heapq.heappop(self._timers)
+            if sequence in self._cancelled:
+                self._cancelled.discard(sequence)
+                continue
+            self.now = max(self.now, due)
+            action(self.utcnow())
+        self.now = max(self.now, timestamp)
+
+    def run_all(self) -> None:
+        """Fire every timer still scheduled (the end of the capture)."""
+        while self._timers:
+            self.advance(max(due for due, _, _ in self._timers))
+
+
+@dataclass(frozen=True, slots=True)
+class MetricUpdate:
+    """A value published by a profile, at a time relative to the capture start."""
+
+    time: float
+    profile: str
+    metric: Metric
+    value: StateType | datetime
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the update as JSON-serializable values."""
+        value = self.value
+        return {
+            "time": round(self.time, 3),
+            "profile": self.profile,
+            "metric": self.metric.value,
+            "value": value.isoformat() if isinstance(value, datetime) else value,
+        }
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    """What a replay produced and how fast it ran."""
+
+    events: int
+    elapsed: float
+    stream: list[MetricUpdate]
+    cycles: dict[str, int]
+    stats: dict[str, dict[str, Any]]
+
+    @property
+    def events_per_sec(self) -> float:
+        """Return the replay throughput."""
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    def values(self, profile: str, metric: Metric) -> list[StateType | datetime]:
+        """Return every value of a metric published by a profile, in order."""
+        return [
+            update.value
+            for update in self.stream
+            if update.profile == profile and update.metric is metric
+        ]
+
+    def summary(self) -> str:
+        """Return a short text report of the replay."""
+        lines = [
+            f"{self.events} events in {self.elapsed * 1000:.1f} ms "
+            f"({self.events_per_sec:,.0f} events/s), "
+            f"{len(self.stream)} metric updates"
+        ]
+        lines.extend(
+            f"  {profile}: {cycles} cycles, {self.stats[profile]['passes']} passes"
+            for profile, cycles in self.cycles.items()
+        )
+        return "\n".join(lines)
+
+    def write_stream(self, path: Path) -> None:
+        """Write the metric stream to ``path`` as JSONL."""
+        path.write_text(
+            "".join(json.dumps(update.as_dict()) + "\n" for update in self.stream)
+        )
+
+
+async def replay(hass: HomeAssistant, capture: Capture) -> ReplayResult:
+    """Replay a capture through one handler per profile and collect the output."""
+    if not capture.profiles:
+        raise ValueError("The capture defines no profile")
+    if not capture.events:
+        raise ValueError("The capture holds no scale event")
+
+    start = capture.events[0].timestamp
+    clock = VirtualClock(start)
+    stream: list[MetricUpdate] = []
+    cycles: dict[str, int] = {}
+    dispatcher = SensorDispatcher(hass)
+    hass.data[DOMAIN] = {
+        SENSOR_DISPATCHER: dispatcher,
+        WEIGHT_ROUTER: NearestWeightRouter(),
+        WEIGHT_RANGES: WeightRangeIndex(),
+        PROFILE_ID_ROUTER: ProfileIdRouter(hass),
+    }
+
+    handlers: list[BodyScaleMetricsHandler] = []
+    with (
+        patch(
+            "custom_components.bodymiscale.metrics.async_call_later",
+            clock.call_later,
+        ),
+        # LAST_MEASUREMENT_TIME stamps the capture time, not the replay's.
+        patch("homeassistant.util.dt.utcnow", clock.utcnow),
+    ):
+        try:
+            for index, config in enumerate(capture.profiles):
+                handler = BodyScaleMetricsHandler(
+                    hass, config, config_entry_id=f"replay_{index}"
+                )
+                handlers.append(handler)
+                name = handler.config.get("name", handler.config_entry_id)
+                cycles[name] = 0
+                handler.subscribe_batch(_recorder(stream, clock, start, name))
+                handler.subscribe_cycle(_cycle_counter(cycles, name))
+
+            began = perf_counter()
+            for event in capture.events:
+                clock.advance(event.timestamp)
+                hass.states.async_set(
+                    event.entity_id,
+                    event.state,
+                    event.attributes,
+                    timestamp=event.timestamp,
+                )
+                # State listeners are called from the loop: let the event
+                # reach the handlers before the clock moves on.
+                await hass.async_block_till_done()
+            clock.run_all()
+            elapsed = perf_counter() - began
+        finally:
+            for handler in handlers:
+                handler.unload()
+            dispatcher.unload()
+            hass.data.pop(DOMAIN, None)
+
+    return ReplayResult(
+        events=len(capture.events),
+        elapsed=elapsed,
+        stream=stream,
+        cycles=cycles,
+        stats={
+            handler.config.get("name", handler.config_entry_id): (
+                handler.stats.as_dict()
+            )
+            for handler in handlers
+        },
+    )
+
+
+def _recorder(
+    stream: list[MetricUpdate], clock: VirtualClock, start: float, profile: str
+) -> Callable[[Mapping[Metric, StateType | datetime]], None]:
+    """Return a batch subscriber appending a profile's values to the stream."""
+
+    def _record(changes: Mapping[Metric, StateType | datetime]) -> None:
+        time = clock.now - start
+        stream.extend(
+            MetricUpdate(time, profile, metric, value)
+            for metric, value in changes.items()
+        )
+
+    return _record
+
+
+def _cycle_counter(
+    cycles: dict[str, int], profile: str
+) -> Callable[[Mapping[Metric, StateType | datetime]], None]:
+    """Return a cycle subscriber counting a profile's completed cycles."""
+
+    def _count(_snapshot: Mapping[Metric, StateType | datetime]) -> None:
+        cycles[profile] += 1
+
+    return _count
@@ -0,0 +1,113 @@
+"""Replays of recorded scale events.
+
+The committed captures in ``captures/`` reproduce field issues and run
+with the rest of the suite. Replay your own capture with
+``pytest tests/replay --replay capture.jsonl [--replay-json DIR]``:
+the summary at the end of the run reports the throughput and ``--replay-json`` writes the
+metric stream of every profile.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.bodymiscale.const import DOMAIN, RECALCULATION_DEBOUNCE
+from custom_components.bodymiscale.models import Metric
+
+from .conftest import CAPTURES
+from .harness import VirtualClock, load_capture, parse_capture, replay
+
+
+async def test_replay_cross_user_impedance_stays_with_its_weighing(
+    hass: HomeAssistant,
+) -> None:
+    """Each profile must only get the impedance of its own weighings.
+
+    Alice's last accepted weight (60.2 kg) is still in her range when Bob's
+    impedance arrives; it must not be taken for hers.
+    """
+    result = await replay(hass, load_capture(CAPTURES / "cross_user_impedance.jsonl"))
+
+    assert result.values("Alice", Metric.IMPEDANCE) == [480.0]
+    assert result.values("Bob", Metric.IMPEDANCE) == [520.0]
+    assert result.values("Alice", Metric.WEIGHT) == [60.2, 61.0]
+    assert result.values("Bob", Metric.WEIGHT) == [85.4, 85.0]
+    assert result.cycles == {"Alice": 2, "Bob": 2}
+    assert result.stats["Alice"]["rejections"] == {"WeightRangeFilter": 2}
+    # Bob's second weighing re-sent the same impedance (state_reported):
+    # his metrics are recomputed for the new weight.
+    assert len(result.values("Bob", Metric.FAT_PERCENTAGE)) == 2
+    assert DOMAIN not in hass.data
+
+
+async def test_replay_settle_window_runs_on_capture_time(
+    hass: HomeAssistant,
+) -> None:
+    """A weighing without impedance must complete one settle window later."""
+    result = await replay(hass, load_capture(CAPTURES / "cross_user_impedance.jsonl"))
+
+    # Alice's 61.0 kg weighing (600 s into the capture) had no impedance.
+    last_weighing = [
+        update
+        for update in result.stream
+        if update.profile == "Alice" and update.metric is Metric.LAST_MEASUREMENT_TIME
+    ][-1]
+    assert last_weighing.time == pytest.approx(599.93 + RECALCULATION_DEBOUNCE)
+    assert last_weighing.as_dict()["value"] == "2026-05-02T07:10:05.050000+00:00"
+
+
+def test_parse_capture_skips_other_events() -> None:
+    """Unrelated events and removed entities must not be replayed."""
+    capture = parse_capture(
+        [
+            '{"profile": {"name": "Alice"}}',
+            "",
+            '{"event_type": "call_service", "time_fired": 1.0, "data": {}}',
+            '{"event_type": "state_changed", "time_fired": 2.0,'
+            ' "data": {"entity_id": "sensor.w", "new_state": null}}',
+            '{"event_type": "state_reported", "data": {"entity_id": "sensor.w",'
+            ' "new_state": {"state": 70.5, "last_reported": 3.0}}}',
+        ]
+    )
+
+    assert capture.profiles == [{"name": "Alice"}]
+    assert [(e.timestamp, e.entity_id, e.state) for e in capture.events] == [
+        (3.0, "sensor.w", "70.5")
+    ]
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_capture(["not json"])
+
+
+def test_virtual_clock_fires_due_timers_in_order() -> None:
+    """Timers must fire at their due time, in order, unless cancelled."""
+    clock = VirtualClock(100.0)
+    fired: list[float] = []
+    clock.call_later(None, 5, lambda now: fired.append(now.timestamp()))
+    cancel = clock.call_later(None, 2, lambda now: fired.append(-1.0))
+    clock.call_later(None, 1, lambda now: fired.append(now.timestamp()))
+    cancel()
+
+    clock.advance(103.0)
+    assert fired == [101.0]
+    assert clock.now == 103.0
+    clock.run_all()
+    assert fired == [101.0, 105.0]
+
+
+async def test_replay_capture(
+    hass: HomeAssistant,
+    request: pytest.FixtureRequest,
+    replay_summaries: dict[str, str],
+    capture_path: Path,
+) -> None:
+    """Replay a capture given with --replay and report its throughput."""
+    result = await replay(hass, load_capture(capture_path))
+
+    replay_summaries[capture_path.name] = result.summary()
+    output = request.config.getoption("--replay-json")
+    if output:
+        result.write_stream(Path(output) / f"{capture_path.stem}.stream.jsonl")
+    assert result.events